@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+week1 로그 분석기 벤치마크
+
+log_generator.py로 만든 100만/1000만/1억 라인 합성 로그에서 파이프라인의
+각 단계(read_log_file, sort_logs_by_time_reversed, save_problematic_logs 등)를
+실행해 걸린 시간, 초당 라인 수, 최대 메모리를 재고 JSON으로 저장합니다.
+이전 결과 JSON을 --compare로 넘기면 단계별로 얼마나 빨라졌는지 보여줍니다.
+
+--micro를 주면 키워드 필터(기존 any 검색 vs KeywordMatcher)와 병렬 검사
+(작업 프로세스 1~N개) 비교도 함께 실행합니다.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from log_generator import generate_log
+from main import (
+    PROBLEM_KEYWORDS, DEFAULT_MATCHER, LogStore, iter_log_file, read_log_file,
+    sort_logs_by_time_reversed, iter_logs_by_time_reversed,
+    save_problematic_logs, scan_log_parallel
+)
+
+DEFAULT_SIZES = [1000000, 10000000, 100000000]
+# 전체를 메모리에 올리는 단계는 이 라인 수를 넘는 로그에서 건너뜀 (작업 프로세스 메모리 부족 방지)
+IN_MEMORY_LINE_LIMIT = 10000000
+
+
+def legacy_filter(lines, keywords=PROBLEM_KEYWORDS):
+    """
+    기존 save_problematic_logs의 키워드 검사 방식
+
+    Args:
+        lines (list): 로그 라인 리스트 (str 또는 bytes)
+        keywords (list): 찾을 키워드 리스트
+
+    Returns:
+        list: 키워드가 포함된 라인 리스트
+    """
+    if lines and isinstance(lines[0], bytes):
+        keywords = [keyword.encode('utf-8') for keyword in keywords]
+    return [line for line in lines if any(keyword in line.upper() for keyword in keywords)]
+
+
+def matcher_filter(lines, matcher=DEFAULT_MATCHER):
+    """
+    KeywordMatcher를 사용한 키워드 검사
+
+    Args:
+        lines (list): 로그 라인 리스트 (str 또는 bytes)
+        matcher (KeywordMatcher): 컴파일된 매처
+
+    Returns:
+        list: 키워드가 포함된 라인 리스트
+    """
+    return list(matcher.filter(lines))
+
+
+def time_it(func, lines, repeat=3):
+    """
+    함수를 여러 번 실행해서 가장 짧은 실행 시간(초)을 돌려줍니다.
+
+    Args:
+        func (callable): 측정할 함수
+        lines (list): 함수에 넘길 로그 라인 리스트
+        repeat (int): 반복 횟수
+
+    Returns:
+        float: 가장 짧은 실행 시간(초)
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(lines)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def bench_keyword_filter(lines, repeat=3):
+    """
+    기존 필터와 KeywordMatcher 필터를 str/bytes 라인에서 비교합니다.
+
+    Args:
+        lines (list): 헤더를 제외한 str 로그 라인 리스트
+        repeat (int): 반복 횟수
+
+    Returns:
+        dict: {'str': {...}, 'bytes': {...}} 형태의 측정 결과(초)
+    """
+    byte_lines = [line.encode('utf-8') for line in lines]
+    assert legacy_filter(lines) == matcher_filter(lines)
+    assert legacy_filter(byte_lines) == matcher_filter(byte_lines)
+
+    results = {}
+    for name, sample in (('str', lines), ('bytes', byte_lines)):
+        legacy = time_it(legacy_filter, sample, repeat)
+        matcher = time_it(matcher_filter, sample, repeat)
+        results[name] = {
+            'legacy': legacy,
+            'matcher': matcher,
+            'speedup': legacy / matcher if matcher else float('inf')
+        }
+    return results
+
+
+def bench_parallel_scan(log_path, max_workers=None, chunk_size=4 * 1024 * 1024):
+    """
+    직렬 save_problematic_logs와 작업 프로세스 수 1~N의 scan_log_parallel을 비교합니다.
+
+    병렬 결과 파일이 직렬 결과와 바이트 단위로 같은지도 확인합니다.
+    작업 프로세스 수가 CPU 코어 수를 넘으면 더 빨라지지 않으므로
+    max_workers 기본값은 코어 수입니다.
+
+    Args:
+        log_path (str): 로그 파일 경로
+        max_workers (int): 측정할 최대 작업 프로세스 수 (기본값 CPU 코어 수)
+        chunk_size (int): 작업 하나가 맡는 바이트 범위 크기
+
+    Returns:
+        dict: {'serial': 초, 1: 초, 2: 초, ...}
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as temp_dir:
+        serial_output = os.path.join(temp_dir, 'serial.log')
+        parallel_output = os.path.join(temp_dir, 'parallel.log')
+
+        start = time.perf_counter()
+        save_problematic_logs(iter_log_file(log_path, binary=True), serial_output)
+        results = {'serial': time.perf_counter() - start}
+        with open(serial_output, 'rb') as file:
+            expected = file.read()
+
+        for workers in range(1, max_workers + 1):
+            start = time.perf_counter()
+            scan_log_parallel(log_path, parallel_output, workers, chunk_size)
+            results[workers] = time.perf_counter() - start
+            with open(parallel_output, 'rb') as file:
+                assert file.read() == expected, f'작업 프로세스 {workers}개의 결과가 직렬 결과와 다릅니다.'
+    return results
+
+
+def _stage_read_log_file(log_path, output_path):
+    return len(read_log_file(log_path))
+
+
+def _stage_iter_log_file(log_path, output_path):
+    return sum(1 for _ in iter_log_file(log_path))
+
+
+def _stage_sort_logs_by_time_reversed(log_path, output_path):
+    return len(sort_logs_by_time_reversed(read_log_file(log_path)))
+
+
+def _stage_iter_logs_by_time_reversed(log_path, output_path):
+    return sum(1 for _ in iter_logs_by_time_reversed(iter_log_file(log_path)))
+
+
+def _stage_log_store(log_path, output_path):
+    return len(LogStore.from_file(log_path))
+
+
+def _stage_save_problematic_logs(log_path, output_path):
+    save_problematic_logs(iter_log_file(log_path, binary=True), output_path)
+    return None  # 라인 수는 _run_stage가 측정 구간 밖에서 센다
+
+
+def _stage_scan_log_parallel(log_path, output_path):
+    return sum(scan_log_parallel(log_path, output_path).values())
+
+
+# 측정할 단계 (이름: (함수, 설명))
+STAGES = {
+    'read_log_file': (_stage_read_log_file, '전체 라인을 리스트로 읽기'),
+    'iter_log_file': (_stage_iter_log_file, '한 줄씩 스트리밍으로 읽기'),
+    'sort_logs_by_time_reversed': (_stage_sort_logs_by_time_reversed, 'read_log_file + 메모리 정렬'),
+    'iter_logs_by_time_reversed': (_stage_iter_logs_by_time_reversed, '스트리밍 읽기 + 외부 정렬'),
+    'LogStore.from_file': (_stage_log_store, '사전 인코딩 메모리 저장소 만들기'),
+    'save_problematic_logs': (_stage_save_problematic_logs, 'bytes 스트리밍 문제 로그 저장'),
+    'scan_log_parallel': (_stage_scan_log_parallel, '병렬 문제 로그 저장 (작업 프로세스 = 코어 수)')
+}
+# 로그 전체를 리스트로 메모리에 올리는 단계
+IN_MEMORY_STAGES = {'read_log_file', 'sort_logs_by_time_reversed'}
+
+
+def _max_rss_bytes():
+    """현재 프로세스의 최대 RSS(바이트), resource 모듈이 없으면 None"""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, 리눅스는 KB 단위
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def _run_stage(stage, log_path, output_path, memory):
+    """
+    새 작업 프로세스 안에서 단계 하나를 실행하고 시간과 최대 메모리를 잽니다.
+
+    단계 함수가 라인 수를 돌려주지 않으면(None) 측정이 끝난 뒤에 따로 셉니다.
+
+    Returns:
+        dict: {'lines': 라인 수, 'seconds': 초, 'peak_memory_bytes': 바이트}
+    """
+    func = STAGES[stage][0]
+    if memory == 'tracemalloc':
+        tracemalloc.start()
+    baseline = _max_rss_bytes()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        lines = func(log_path, output_path)
+        seconds = time.perf_counter() - start
+
+    if memory == 'tracemalloc':
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    else:
+        peak = _max_rss_bytes() - baseline
+    if lines is None:
+        lines = sum(1 for _ in iter_log_file(log_path, binary=True))
+    return {'lines': lines, 'seconds': seconds, 'peak_memory_bytes': peak}
+
+
+def run_pipeline_benchmark(log_path, stages=None, memory='rss', line_count=None,
+                           in_memory_limit=IN_MEMORY_LINE_LIMIT):
+    """
+    로그 파일 하나에 대해 각 단계를 별도 프로세스에서 실행해 측정합니다.
+
+    단계마다 새 프로세스를 쓰므로 최대 메모리가 앞 단계의 영향을 받지 않습니다.
+    'rss'는 단계 실행 중 늘어난 최대 RSS이고, 'tracemalloc'은 파이썬 할당의
+    최대치입니다(훨씬 느려지므로 시간 비교에는 쓰지 않는 것이 좋습니다).
+    scan_log_parallel의 메모리에는 하위 작업 프로세스가 포함되지 않습니다.
+    로그가 in_memory_limit 라인보다 크면 IN_MEMORY_STAGES는 실행하지 않고
+    {'skipped': 이유}만 기록합니다.
+
+    Args:
+        log_path (str): 로그 파일 경로
+        stages (list): 측정할 단계 이름 (기본값 STAGES 전체)
+        memory (str): 'rss' 또는 'tracemalloc'
+        line_count (int): 헤더를 제외한 로그 라인 수 (모르면 None, 이때는 건너뛰지 않음)
+        in_memory_limit (int): 메모리 단계를 실행할 최대 라인 수 (None이면 제한 없음)
+
+    Returns:
+        dict: {단계: {'lines', 'seconds', 'lines_per_second', 'peak_memory_bytes'}}
+    """
+    if memory == 'rss' and resource is None:
+        memory = 'tracemalloc'
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, 'problematic_logs.log')
+        for stage in stages or STAGES:
+            if (stage in IN_MEMORY_STAGES and line_count is not None
+                    and in_memory_limit is not None and line_count > in_memory_limit):
+                results[stage] = {'skipped': f'{in_memory_limit:,} 라인 초과 (메모리 부족 방지)'}
+                continue
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(_run_stage, stage, log_path, output_path, memory).result()
+            result['lines_per_second'] = result['lines'] / result['seconds'] if result['seconds'] else None
+            results[stage] = result
+    return results
+
+
+def _git_revision():
+    """현재 저장소의 커밋 해시 (git이 없으면 None)"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(size, results, previous=None):
+    """
+    한 크기의 측정 결과를 표로 출력합니다.
+
+    Args:
+        size (int): 로그 라인 수
+        results (dict): run_pipeline_benchmark의 결과
+        previous (dict): 비교할 이전 결과 (같은 크기, 없으면 None)
+    """
+    print(f'\n=== {size:,} 라인 ===')
+    print(f'{"단계":<28} {"시간(s)":>9} {"라인/초":>12} {"최대 메모리(MB)":>16} {"이전 대비":>9}')
+    for stage, result in results.items():
+        if 'skipped' in result:
+            print(f'{stage:<28} 건너뜀: {result["skipped"]}')
+            continue
+        change = ''
+        if previous and previous.get(stage, {}).get('seconds') and result['seconds']:
+            change = f'{previous[stage]["seconds"] / result["seconds"]:.2f}배'
+        print(
+            f'{stage:<28} {result["seconds"]:>9.3f} {result["lines_per_second"]:>12,.0f} '
+            f'{result["peak_memory_bytes"] / 1024 / 1024:>16.1f} {change:>9}'
+        )
+
+
+def run_micro_benchmarks(log_path, line_count):
+    """키워드 필터 비교와 병렬 검사 확장성 측정을 실행합니다."""
+    lines = []
+    for line in iter_log_file(log_path):
+        lines.append(line)
+        if len(lines) > line_count:
+            break
+    lines = lines[1:]
+
+    print(f'\n키워드 필터 벤치마크 ({len(lines):,} 라인)')
+    for name, result in bench_keyword_filter(lines).items():
+        print(
+            f'  {name:<5} 기존: {result["legacy"]:.3f}s  '
+            f'매처: {result["matcher"]:.3f}s  ({result["speedup"]:.2f}배)'
+        )
+
+    print(f'\n병렬 검사 벤치마크 (CPU 코어 {os.cpu_count()}개)')
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = bench_parallel_scan(log_path)
+    serial = results.pop('serial')
+    print(f'  직렬: {serial:.3f}s')
+    for workers, elapsed in results.items():
+        print(f'  작업 프로세스 {workers}개: {elapsed:.3f}s  ({serial / elapsed:.2f}배)')
+
+
+def _write_report(output_path, report):
+    """결과 JSON을 임시 파일에 쓴 뒤 교체해서 저장합니다."""
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    os.replace(temp_path, output_path)
+
+
+def main():
+    """합성 로그를 크기별로 만들어 파이프라인 벤치마크를 실행하고 JSON으로 저장합니다."""
+    parser = argparse.ArgumentParser(description='week1 로그 분석기 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='측정할 로그 라인 수 (기본값 1000000 10000000 100000000)')
+    parser.add_argument('--problem-ratio', type=float, default=0.01, help='문제 라인 비율 (기본값 0.01)')
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), help='측정할 단계 (기본값 전체)')
+    parser.add_argument('--memory', choices=['rss', 'tracemalloc'], default='rss', help='최대 메모리 측정 방식')
+    parser.add_argument('--workdir', help='합성 로그를 만들어 둘 디렉터리 (지정하면 다음 실행에서 재사용)')
+    parser.add_argument('--output', default='benchmark_results.json', help='결과 JSON 경로')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON 경로')
+    parser.add_argument('--micro', action='store_true', help='키워드 필터·병렬 검사 비교도 실행')
+    parser.add_argument('--in-memory-limit', type=int, default=IN_MEMORY_LINE_LIMIT,
+                        help=f'전체를 메모리에 올리는 단계를 실행할 최대 라인 수 (기본값 {IN_MEMORY_LINE_LIMIT})')
+    args = parser.parse_args()
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            previous = json.load(file).get('results', {})
+
+    report = {
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'problem_ratio': args.problem_ratio,
+        'memory': args.memory,
+        'results': {}
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        workdir = args.workdir or temp_dir
+        os.makedirs(workdir, exist_ok=True)
+        for size in args.sizes:
+            log_path = os.path.join(workdir, f'synthetic_{size}_{args.problem_ratio}.log')
+            if not os.path.exists(log_path):
+                print(f'{size:,} 라인 합성 로그를 만드는 중...')
+                generate_log(log_path, size, args.problem_ratio, seed=size)
+
+            results = run_pipeline_benchmark(
+                log_path, args.stages, args.memory, size, args.in_memory_limit
+            )
+            report['results'][str(size)] = results
+            # 큰 크기에서 중단돼도 앞 크기의 결과는 남도록 크기마다 저장
+            _write_report(args.output, report)
+            print_results(size, results, previous.get(str(size)))
+            if args.micro:
+                run_micro_benchmarks(log_path, min(size, 1000000))
+
+    print(f'\n벤치마크 결과가 {args.output}에 저장되었습니다.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+미션 컴퓨터 합성 로그 생성기
+
+mission_computer_main.log와 같은 'timestamp,event,message' 형식의 로그를
+원하는 라인 수와 문제 라인 비율로 만들어 냅니다. 벤치마크(benchmark.py)에서
+100만~1억 라인 규모의 입력을 만들 때 사용합니다.
+"""
+
+import argparse
+import random
+import time
+
+from main import parse_timestamp
+
+# 문제 키워드가 없는 평상시 메시지 (mission_computer_main.log에서 발췌)
+NORMAL_MESSAGES = [
+    'Rocket initialization process started.',
+    'Power systems online. Batteries at optimal charge.',
+    'Communication established with mission control.',
+    'Avionics check: All systems functional.',
+    'Propulsion check: Thrusters responding as expected.',
+    'Life support systems nominal.',
+    'Initial telemetry received. Rocket is on its trajectory.',
+    'Max-Q passed. Vehicle is stable.',
+    'Navigation systems show nominal performance.',
+    'Orbital operations initiated. Satellite deployment upcoming.',
+    'Heat shield performing as expected during reentry.',
+    'Center and mission control systems powered down.'
+]
+
+# 문제 키워드가 들어 있는 메시지와 그때의 이벤트 종류
+PROBLEM_MESSAGES = [
+    ('INFO', 'Oxygen tank unstable.'),
+    ('INFO', 'Oxygen tank explosion.'),
+    ('WARNING', 'Cabin pressure fluctuating outside nominal range.'),
+    ('ERROR', 'Telemetry checksum error on downlink channel 2.'),
+    ('CRITICAL', 'Coolant loop pressure critical.'),
+    ('ERROR', 'Thruster valve failure detected.')
+]
+
+HEADER = 'timestamp,event,message\n'
+
+
+def generate_log(file_path, line_count, problem_ratio=0.01, seed=None,
+                 start='2023-08-27 10:00:00', max_step=3, batch_size=100000):
+    """
+    합성 로그 파일을 만듭니다.
+
+    timestamp는 start부터 0~max_step초씩 늘어나므로 로그는 시간순이고
+    같은 timestamp가 여러 번 나올 수 있습니다. 문제 라인은 problem_ratio
+    비율로 무작위 위치에 들어가고, 평상시 라인은 모두 INFO 이벤트입니다.
+
+    Args:
+        file_path (str): 만들 로그 파일 경로
+        line_count (int): 헤더를 제외한 라인 수
+        problem_ratio (float): 문제 키워드가 들어 있는 라인의 비율 (0~1)
+        seed (int): 난수 시드 (같은 시드면 같은 로그가 만들어짐)
+        start (str): 첫 라인의 timestamp ('YYYY-MM-DD HH:MM:SS')
+        max_step (int): 이웃한 라인 사이의 최대 시간 간격(초)
+        batch_size (int): 한 번에 모아서 쓸 라인 수
+
+    Returns:
+        int: 만든 문제 라인 수
+    """
+    if not 0 <= problem_ratio <= 1:
+        raise ValueError('문제 라인 비율은 0과 1 사이여야 합니다.')
+
+    rng = random.Random(seed)
+    timestamp = parse_timestamp(start)
+    formatted_at = None
+    formatted = ''
+    problem_count = 0
+
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write(HEADER)
+        written = 0
+        while written < line_count:
+            batch = []
+            for _ in range(min(batch_size, line_count - written)):
+                timestamp += rng.randint(0, max_step)
+                if timestamp != formatted_at:
+                    formatted = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(timestamp))
+                    formatted_at = timestamp
+                if rng.random() < problem_ratio:
+                    event, message = rng.choice(PROBLEM_MESSAGES)
+                    problem_count += 1
+                else:
+                    event, message = 'INFO', rng.choice(NORMAL_MESSAGES)
+                batch.append(f'{formatted},{event},{message}\n')
+            file.writelines(batch)
+            written += len(batch)
+    return problem_count
+
+
+def main():
+    """명령행 인자로 받은 크기의 합성 로그를 만듭니다."""
+    parser = argparse.ArgumentParser(description='미션 컴퓨터 합성 로그 생성기')
+    parser.add_argument('output', help='만들 로그 파일 경로')
+    parser.add_argument('lines', type=int, help='헤더를 제외한 라인 수 (예: 1000000)')
+    parser.add_argument('--problem-ratio', type=float, default=0.01, help='문제 라인 비율 (기본값 0.01)')
+    parser.add_argument('--seed', type=int, help='난수 시드')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    problem_count = generate_log(args.output, args.lines, args.problem_ratio, args.seed)
+    elapsed = time.perf_counter() - started
+    print(f'{args.output}: {args.lines:,} 라인 (문제 라인 {problem_count:,}개), {elapsed:.1f}초')
+
+
+if __name__ == '__main__':
+    main()
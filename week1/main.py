@@ -1,47 +1,319 @@
-def read_log_file(file_path):
+import argparse
+import calendar
+import csv
+import glob
+import gzip
+import heapq
+import io
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice, pairwise
+from operator import attrgetter, itemgetter
+
+try:
+    import bz2
+except ImportError:
+    bz2 = None
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+# 문제가 되는 키워드들(로그 분석 후 파악된 문제)
+PROBLEM_KEYWORDS = ['UNSTABLE', 'EXPLOSION', 'ERROR', 'CRITICAL', 'WARNING', 'FAILURE']
+
+# 키워드별 심각도 (숫자가 클수록 심각함)
+PROBLEM_KEYWORD_SEVERITY = {
+    'EXPLOSION': 5,
+    'CRITICAL': 5,
+    'FAILURE': 4,
+    'ERROR': 4,
+    'UNSTABLE': 3,
+    'WARNING': 2
+}
+
+# 외부 정렬에서 한 번에 메모리에 올려 정렬할 최대 라인 수
+DEFAULT_RUN_SIZE = 100000
+
+# 병렬 스캔에서 작업 하나가 맡는 바이트 범위의 기본 크기
+PARALLEL_CHUNK_SIZE = 32 * 1024 * 1024
+
+# 로그 묶음의 어느 파일에도 헤더 행이 없을 때 iter_log_set이 대신 돌려주는 헤더
+DEFAULT_LOG_HEADER = 'timestamp,event,message\n'
+# 로테이션된 로그 파일 이름 (예: mission_computer_main.log.2.bz2)과 압축 형식별 매직 바이트
+ROTATED_LOG_PATTERN = r'\.(\d+)(?:\.(?:gz|bz2|xz))?$'
+COMPRESSION_MAGIC = {
+    'gzip': b'\x1f\x8b',
+    'bz2': b'BZh',
+    'xz': b'\xfd7zXZ\x00'
+}
+
+# 증분 처리 체크포인트 사이드카 파일 접미사와 파일 식별에 쓰는 앞부분 길이
+CHECKPOINT_SUFFIX = '.checkpoint'
+CHECKPOINT_HEAD_LENGTH = 1024
+
+# LogStore가 같은 메시지를 한 번만 저장하려고 기억해 두는 서로 다른 메시지 수의 상한
+STORE_DEDUP_LIMIT = 100000
+
+# 시간 구간 조회용 희소 인덱스 사이드카 파일 접미사와 기본 간격(라인 수)
+TIME_INDEX_SUFFIX = '.tsidx'
+TIME_INDEX_EVERY = 1024
+
+# timestamp를 해석할 수 없는 라인의 정렬 키 (모든 정상 timestamp보다 작음)
+MISSING_TIMESTAMP = -(1 << 63)
+
+
+def iter_log_file(file_path, binary=False):
     """
-    로그 파일을 읽어서 내용을 반환하는 함수
+    로그 파일을 한 줄씩 읽어서 돌려주는 제너레이터
+    
+    파일 전체를 메모리에 올리지 않으므로 로그 크기와 관계없이
+    메모리 사용량이 일정하게 유지된다. gzip/bz2/xz로 압축된 파일은
+    스트리밍으로 풀면서 읽는다.
     
     Args:
         file_path (str): 로그 파일 경로
+        binary (bool): True이면 디코딩하지 않고 bytes 라인을 돌려줌
         
-    Returns:
-        list: 로그 파일의 각 라인을 담고 있는 리스트
+    Yields:
+        str | bytes: 로그 파일의 각 라인
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-        return lines
+        file = open_log_stream(file_path, binary)
     except FileNotFoundError:
         print(f'오류: {file_path} 파일을 찾을 수 없습니다.')
-        return []
+        return
     except PermissionError:
         print(f'오류: {file_path} 파일에 접근할 권한이 없습니다.')
-        return []
+        return
     except Exception as e:
         print(f'오류: 파일을 읽는 중 예상치 못한 오류가 발생했습니다. {e}')
-        return []
+        return
+    
+    with file:
+        try:
+            yield from file
+        except Exception as e:
+            print(f'오류: 파일을 읽는 중 예상치 못한 오류가 발생했습니다. {e}')
+
+def detect_compression(file_path):
+    """
+    파일 앞부분의 매직 바이트로 압축 형식을 알아낸다.
+    
+    Args:
+        file_path (str): 파일 경로
+        
+    Returns:
+        str: 'gzip', 'bz2', 'xz' 중 하나 (압축되지 않았으면 None)
+    """
+    with open(file_path, 'rb') as file:
+        head = file.read(6)
+    for compression, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+def open_log_stream(file_path, binary=False):
+    """
+    압축 형식을 감지해서 로그 파일을 스트리밍으로 연다.
+    
+    Args:
+        file_path (str): 로그 파일 경로 (일반 텍스트, gzip, bz2, xz)
+        binary (bool): True이면 바이너리 모드로 연다
+        
+    Returns:
+        file: 압축을 풀면서 읽는 파일 객체
+        
+    Raises:
+        OSError: 파일을 열 수 없거나 필요한 압축 모듈이 없는 경우
+    """
+    compression = detect_compression(file_path)
+    if compression is None:
+        opener = open
+    elif compression == 'gzip':
+        opener = gzip.open
+    else:
+        module = bz2 if compression == 'bz2' else lzma
+        if module is None:
+            raise OSError(f'{compression} 압축을 풀 모듈이 없어 {file_path} 파일을 읽을 수 없습니다.')
+        opener = module.open
+    
+    if binary:
+        return opener(file_path, 'rb')
+    if opener is open:
+        return open(file_path, 'r', encoding='utf-8')
+    return opener(file_path, 'rt', encoding='utf-8')
+
+def read_log_file(file_path):
+    """
+    로그 파일을 읽어서 내용을 반환하는 함수
+    
+    Args:
+        file_path (str): 로그 파일 경로
+        
+    Returns:
+        list: 로그 파일의 각 라인을 담고 있는 리스트
+    """
+    return list(iter_log_file(file_path))
+
+class LogRecord:
+    """
+    한 번만 파싱한 로그 라인 레코드
+    
+    timestamp는 epoch 초(int), 이벤트는 sys.intern으로 공유하는 이름,
+    메시지는 원본 라인 안의 시작 위치로만 저장한다. __slots__를 사용해
+    레코드마다 __dict__를 만들지 않는다.
+    """
+    
+    __slots__ = ('timestamp', 'event', 'message_offset', 'line')
+    
+    def __init__(self, timestamp, event, message_offset, line):
+        """
+        LogRecord 초기화
+        
+        Args:
+            timestamp (int): epoch 초 (해석할 수 없으면 MISSING_TIMESTAMP)
+            event (str): 이벤트 이름 (예: 'INFO')
+            message_offset (int): line 안에서 메시지가 시작하는 위치
+            line (str | bytes): 원본 로그 라인
+        """
+        self.timestamp = timestamp
+        self.event = event
+        self.message_offset = message_offset
+        self.line = line
+    
+    @classmethod
+    def parse(cls, line):
+        """
+        'timestamp,event,message' 형식의 라인을 한 번에 파싱한다.
+        
+        Args:
+            line (str | bytes): 로그 라인
+            
+        Returns:
+            LogRecord: 파싱된 레코드
+        """
+        separator = b',' if isinstance(line, bytes) else ','
+        first = line.find(separator)
+        if first < 0:
+            return cls(MISSING_TIMESTAMP, '', len(line), line)
+        
+        second = line.find(separator, first + 1)
+        if second < 0:
+            event = line[first + 1:].rstrip()
+            message_offset = len(line)
+        else:
+            event = line[first + 1:second]
+            message_offset = second + 1
+        if isinstance(event, bytes):
+            event = event.decode('utf-8', errors='replace')
+        return cls(parse_timestamp(line[:first]), sys.intern(event), message_offset, line)
+    
+    @property
+    def message(self):
+        """줄바꿈을 제외한 메시지"""
+        return self.line[self.message_offset:].rstrip('\r\n' if isinstance(self.line, str) else b'\r\n')
+    
+    def __repr__(self):
+        return f'LogRecord({self.timestamp}, {self.event!r}, {self.message!r})'
+
+def parse_timestamp(text):
+    """
+    'YYYY-MM-DD HH:MM:SS' 형식의 timestamp를 UTC epoch 초로 바꾼다.
+    
+    strptime 대신 고정 위치를 잘라서 변환하고, 날짜 부분은 캐시한다.
+    
+    Args:
+        text (str | bytes): timestamp 문자열
+        
+    Returns:
+        int: epoch 초 (형식이 맞지 않으면 MISSING_TIMESTAMP)
+    """
+    if len(text) != 19:
+        return MISSING_TIMESTAMP
+    try:
+        return (_day_epoch(text[:10])
+                + int(text[11:13]) * 3600 + int(text[14:16]) * 60 + int(text[17:19]))
+    except ValueError:
+        return MISSING_TIMESTAMP
+
+def format_timestamp(timestamp):
+    """
+    epoch 초를 'YYYY-MM-DD HH:MM:SS' 형식(UTC)으로 바꾼다.
+    
+    Args:
+        timestamp (int): epoch 초
+        
+    Returns:
+        str: timestamp 문자열 (MISSING_TIMESTAMP이면 빈 문자열)
+    """
+    if timestamp == MISSING_TIMESTAMP:
+        return ''
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(timestamp))
+
+@lru_cache(maxsize=1024)
+def _day_epoch(date_text):
+    """'YYYY-MM-DD' 날짜의 0시를 epoch 초로 돌려준다."""
+    return calendar.timegm((int(date_text[0:4]), int(date_text[5:7]), int(date_text[8:10]), 0, 0, 0))
+
+def iter_log_records(lines):
+    """
+    로그 라인을 LogRecord로 파싱해서 돌려주는 제너레이터
+    
+    Args:
+        lines (iterable): 헤더를 제외한 로그 라인 (str 또는 bytes)
+        
+    Yields:
+        LogRecord: 파싱된 레코드
+    """
+    for line in lines:
+        yield LogRecord.parse(line)
 
 def print_log_content(lines):
     """
     로그 내용을 출력하는 함수
     
     Args:
-        lines (list): 로그 파일의 각 라인을 담고 있는 리스트
+        lines (iterable): 로그 파일의 각 라인 또는 LogRecord (리스트 또는 제너레이터)
     """
-    if not lines:
+    lines = iter(lines)
+    first = next(lines, None)
+    if first is None:
         print('로그 내용이 없습니다.')
         return
     
     print('=== 로그 파일 내용 ===')
+    print(_to_text(first).strip())
     for line in lines:
-        print(line.strip())  # 줄바꿈 문자 제거 후 출력
+        print(_to_text(line).strip())  # 줄바꿈 문자 제거 후 출력
     print('=== 로그 파일 끝 ===')
 
+def _to_text(line):
+    """LogRecord는 원본 라인으로, bytes 라인은 utf-8로 디코딩해서 돌려준다."""
+    if isinstance(line, LogRecord):
+        line = line.line
+    if isinstance(line, bytes):
+        return line.decode('utf-8', errors='replace')
+    return line
+
 def sort_logs_by_time_reversed(lines):
     """
     로그를 시간 역순으로 정렬하는 함수
     
+    각 라인은 LogRecord로 한 번만 파싱해서 정수 timestamp로 비교한다.
+    
     Args:
         lines (list): 로그 파일의 각 라인을 담고 있는 리스트
         
@@ -53,73 +325,1741 @@ def sort_logs_by_time_reversed(lines):
         return lines
     
     header = lines[0]
-    data_lines = lines[1:]
-    
-    # CSV 형식의 로그에서 timestamp 열을 기준으로 정렬
-    sorted_lines = sorted(
-        data_lines,
-        key=lambda x: x.split(',')[0] if ',' in x and len(x.split(',')) > 0 else '',
-        reverse=True  # 역순 정렬
-    )
+    records = sort_records_reversed([LogRecord.parse(line) for line in lines[1:]])
     
     # 헤더와 정렬된 데이터 라인을 합침
-    return [header] + sorted_lines
+    return [header] + [record.line for record in records]
+
+def sort_records_reversed(records):
+    """
+    LogRecord 리스트를 timestamp 역순으로 안정 정렬한다.
+    
+    이미 역순이면 그대로, 이미 시간순이면 뒤집기만 하므로 O(n)이다.
+    같은 timestamp끼리는 sorted(..., reverse=True)처럼 원래 순서를 유지한다.
+    
+    Args:
+        records (list): LogRecord 리스트 (제자리에서 정렬될 수 있음)
+        
+    Returns:
+        list: timestamp 역순으로 정렬된 LogRecord 리스트
+    """
+    if all(a.timestamp >= b.timestamp for a, b in pairwise(records)):
+        return records
+    if all(a.timestamp <= b.timestamp for a, b in pairwise(records)):
+        return _reverse_stable(records)
+    records.sort(key=attrgetter('timestamp'), reverse=True)
+    return records
 
-def save_problematic_logs(lines, output_file):
+def _reverse_stable(records):
+    """시간순 리스트를 뒤집되, 같은 timestamp 묶음 안의 순서는 유지한다."""
+    result = []
+    end = len(records)
+    while end > 0:
+        start = end - 1
+        timestamp = records[start].timestamp
+        while start > 0 and records[start - 1].timestamp == timestamp:
+            start -= 1
+        result.extend(records[start:end])
+        end = start
+    return result
+
+def iter_logs_by_time_reversed(lines, run_size=DEFAULT_RUN_SIZE, temp_dir=None):
+    """
+    로그를 시간 역순으로 정렬해서 돌려주는 제너레이터 (외부 정렬)
+    
+    run_size 라인씩 정렬한 런(run)을 임시 파일에 쓰고, heapq.merge로
+    k-way 병합하므로 로그 크기와 관계없이 메모리에는 한 런만 올라간다.
+    입력이 한 런 안에 들어가면 임시 파일 없이 메모리에서 정렬한다.
+    각 라인은 한 번만 파싱하고, 런 파일에는 정수 timestamp를 함께 저장한다.
+    결과는 sort_logs_by_time_reversed와 같다.
+    
+    Args:
+        lines (iterable): 로그 파일의 각 라인 (리스트 또는 제너레이터)
+        run_size (int): 런 하나에 담을 최대 라인 수
+        temp_dir (str): 임시 파일을 만들 디렉터리 (기본값은 시스템 임시 디렉터리)
+        
+    Yields:
+        str: 헤더 행과 시간 역순으로 정렬된 로그 라인
+    """
+    lines = iter(lines)
+    header = next(lines, None)
+    if header is None:
+        return
+    yield header
+    
+    runs = []
+    try:
+        while True:
+            chunk = list(iter_log_records(islice(lines, run_size)))
+            if not chunk:
+                break
+            chunk = sort_records_reversed(chunk)
+            if not runs and len(chunk) < run_size:
+                # 런이 하나뿐이면 임시 파일을 거치지 않는다
+                for record in chunk:
+                    yield record.line
+                return
+            runs.append(_write_run(chunk, temp_dir))
+            del chunk
+        
+        # 같은 timestamp는 앞선 런이 먼저 나오므로 sorted()와 같은 안정 정렬이 된다
+        for _, line in heapq.merge(
+            *(_read_run(run) for run in runs),
+            key=itemgetter(0),
+            reverse=True
+        ):
+            yield line
+    finally:
+        for run in runs:
+            run.close()
+
+def _write_run(chunk, temp_dir):
+    """
+    정렬된 런을 임시 파일에 쓴다.
+    
+    각 라인 앞에 정수 timestamp와 줄바꿈 여부('1'/'0')를 붙여서,
+    병합할 때 다시 파싱하지 않고 원래 라인을 그대로 되살린다.
+    """
+    run = tempfile.TemporaryFile('w+', encoding='utf-8', newline='\n', dir=temp_dir)
+    for record in chunk:
+        line = record.line
+        if line.endswith('\n'):
+            run.write(f'{record.timestamp} 1{line}')
+        else:
+            run.write(f'{record.timestamp} 0{line}\n')
+    run.seek(0)
+    return run
+
+def _read_run(run):
+    """_write_run으로 쓴 런 파일에서 (timestamp, 원래 라인)을 하나씩 돌려준다."""
+    for record in run:
+        space = record.index(' ')
+        timestamp = int(record[:space])
+        if record[space + 1] == '1':
+            yield timestamp, record[space + 2:]
+        else:
+            yield timestamp, record[space + 2:-1]
+
+class KeywordMatcher:
+    """
+    여러 키워드를 한 번에 찾는 미리 컴파일된 매처
+    
+    키워드를 대문자 alternation 정규식 하나(str용, bytes용)로 컴파일해 두고,
+    라인을 upper()한 뒤 한 번만 검색한다. re.IGNORECASE는 측정해 보면
+    upper() 후 대소문자 구분 검색보다 몇 배 느려서 사용하지 않는다.
+    """
+    
+    def __init__(self, keywords=None):
+        """
+        KeywordMatcher 초기화
+        
+        Args:
+            keywords (dict | list): {키워드: 심각도} 사전 또는 키워드 리스트
+                (리스트이면 PROBLEM_KEYWORD_SEVERITY의 심각도, 없으면 1을 사용,
+                기본값 PROBLEM_KEYWORD_SEVERITY)
+        """
+        if keywords is None:
+            keywords = PROBLEM_KEYWORD_SEVERITY
+        if not isinstance(keywords, dict):
+            keywords = {
+                keyword: PROBLEM_KEYWORD_SEVERITY.get(keyword.upper(), 1)
+                for keyword in keywords
+            }
+        if not keywords:
+            raise ValueError('키워드가 하나 이상 필요합니다.')
+        
+        self.severity = {keyword.upper(): severity for keyword, severity in keywords.items()}
+        # 긴 키워드를 먼저 두어 겹치는 키워드 중 가장 긴 것이 보고되도록 한다
+        ordered = sorted(self.severity, key=len, reverse=True)
+        self.pattern = re.compile('|'.join(re.escape(keyword) for keyword in ordered))
+        self.byte_pattern = re.compile(
+            b'|'.join(re.escape(keyword.encode('utf-8')) for keyword in ordered)
+        )
+    
+    def search(self, line):
+        """
+        라인에서 처음 나오는 키워드를 찾는다.
+        
+        Args:
+            line (str | bytes | LogRecord): 검색할 로그 라인
+            
+        Returns:
+            tuple: (키워드, 심각도), 키워드가 없으면 None
+        """
+        if isinstance(line, LogRecord):
+            line = line.line
+        if isinstance(line, bytes):
+            found = self.byte_pattern.search(line.upper())
+            if found is None:
+                return None
+            keyword = found.group().decode('utf-8')
+        else:
+            found = self.pattern.search(line.upper())
+            if found is None:
+                return None
+            keyword = found.group()
+        return keyword, self.severity[keyword]
+    
+    def filter(self, lines):
+        """
+        키워드가 포함된 라인만 돌려주는 제너레이터
+        
+        Args:
+            lines (iterable): 로그 라인 (str, bytes 또는 LogRecord)
+            
+        Yields:
+            str | bytes | LogRecord: 키워드가 포함된 라인 (입력과 같은 타입)
+        """
+        search_text = self.pattern.search
+        search_bytes = self.byte_pattern.search
+        for line in lines:
+            text = line.line if isinstance(line, LogRecord) else line
+            search = search_bytes if isinstance(text, bytes) else search_text
+            if search(text.upper()) is not None:
+                yield line
+    
+    def iter_matches(self, lines):
+        """
+        키워드가 포함된 라인과 찾은 키워드, 심각도를 돌려주는 제너레이터
+        
+        Args:
+            lines (iterable): 로그 라인 (str, bytes 또는 LogRecord)
+            
+        Yields:
+            tuple: (라인, 키워드, 심각도)
+        """
+        for line in lines:
+            found = self.search(line)
+            if found is not None:
+                yield line, found[0], found[1]
+    
+    def find_all(self, line):
+        """
+        라인에 포함된 서로 다른 키워드를 모두 찾는다.
+        
+        Args:
+            line (str | bytes | LogRecord): 검색할 로그 라인
+            
+        Returns:
+            list: 처음 나온 순서대로 중복 없이 나열한 키워드 리스트
+        """
+        if isinstance(line, LogRecord):
+            line = line.line
+        if isinstance(line, bytes):
+            found = (keyword.decode('utf-8') for keyword in self.byte_pattern.findall(line.upper()))
+        else:
+            found = self.pattern.findall(line.upper())
+        return list(dict.fromkeys(found))
+
+# 기본 키워드로 미리 컴파일해 둔 매처
+DEFAULT_MATCHER = KeywordMatcher()
+
+def filter_problematic_lines(lines, keywords=None):
+    """
+    문제가 되는 키워드가 포함된 라인만 돌려주는 제너레이터
+    
+    bytes 라인이 들어오면 디코딩 없이 bytes 정규식으로 비교한다.
+    
+    Args:
+        lines (iterable): 헤더를 제외한 로그 라인 (str, bytes 또는 LogRecord)
+        keywords (dict | list | KeywordMatcher): 찾을 키워드 또는 컴파일된 매처
+            (기본값 DEFAULT_MATCHER)
+        
+    Yields:
+        str | bytes | LogRecord: 키워드가 포함된 라인 (입력과 같은 타입)
+    """
+    # 대소문자 구분 없이 키워드가 포함된 라인 찾기
+    yield from _get_matcher(keywords).filter(lines)
+
+def _get_matcher(keywords):
+    """키워드 인자(None, 사전, 리스트, KeywordMatcher)를 KeywordMatcher로 바꾼다."""
+    if keywords is None:
+        return DEFAULT_MATCHER
+    if isinstance(keywords, KeywordMatcher):
+        return keywords
+    return KeywordMatcher(keywords)
+
+def _normalize_newline(line):
+    """bytes 라인의 CRLF를 텍스트 모드로 읽었을 때와 같은 LF로 바꾼다."""
+    if isinstance(line, bytes) and line.endswith(b'\r\n'):
+        return line[:-2] + b'\n'
+    return line
+
+def save_problematic_logs(lines, output_file, keywords=None):
     """
     문제가 되는 로그 내용만 파일로 저장하는 함수
     
+    라인을 하나씩 걸러서 바로 파일에 쓰므로 입력이 제너레이터여도
+    전체를 메모리에 올리지 않는다. bytes 라인이면 그대로 바이너리로 쓴다.
+    
     Args:
-        lines (list): 로그 파일의 각 라인을 담고 있는 리스트
+        lines (iterable): 로그 파일의 각 라인 (str 또는 bytes)
         output_file (str): 저장할 파일 경로
+        keywords (dict | list | KeywordMatcher): 찾을 키워드 (기본값 DEFAULT_MATCHER)
     """
-    # 문제가 되는 키워드들(로그 분석 후 파악된 문제)
-    problem_keywords = ['UNSTABLE', 'EXPLOSION', 'ERROR', 'CRITICAL', 'WARNING', 'FAILURE']
-    
-    problematic_lines = []
+    lines = iter(lines)
+    first = next(lines, None)
+    if first is None:
+        print('문제가 되는 로그 내용이 없습니다.')
+        return
     
-    # 헤더 행을 추가
-    if lines and ',' in lines[0]:
-        problematic_lines.append(lines[0])
+    # 헤더 행은 첫 번째 문제 라인을 찾았을 때 함께 쓴다
+    separator = b',' if isinstance(first, bytes) else ','
+    header = first if separator in first else None
     
-    for line in lines[1:] if lines else []:
-        # 대소문자 구분 없이 키워드가 포함된 라인 찾기
-        if any(keyword in line.upper() for keyword in problem_keywords):
-            problematic_lines.append(line)
+    file = None
+    try:
+        for line in filter_problematic_lines(lines, keywords):
+            if file is None:
+                if isinstance(line, bytes):
+                    file = open(output_file, 'wb')
+                else:
+                    file = open(output_file, 'w', encoding='utf-8')
+                if header is not None:
+                    file.write(_normalize_newline(header))
+            file.write(_normalize_newline(line))
+    except Exception as e:
+        print(f'오류: 파일을 저장하는 중 예상치 못한 오류가 발생했습니다. {e}')
+        return
+    finally:
+        if file is not None:
+            file.close()
     
-    if len(problematic_lines) <= 1:  # 헤더만 있는 경우
+    if file is None:  # 헤더만 있는 경우
         print('문제가 되는 로그 내용이 없습니다.')
         return
+    print(f'문제가 되는 로그가 {output_file}에 저장되었습니다.')
+
+def split_log_ranges(log_path, chunk_size=PARALLEL_CHUNK_SIZE):
+    """
+    헤더 다음부터 파일 끝까지를 줄바꿈에 맞춘 바이트 범위로 나눈다.
+    
+    Args:
+        log_path (str): 로그 파일 경로
+        chunk_size (int): 범위 하나의 대략적인 크기(바이트)
+        
+    Returns:
+        tuple: (헤더 bytes, [(시작, 끝), ...]) - 범위는 파일 순서대로 정렬됨
+    """
+    with open(log_path, 'rb') as file:
+        header = file.readline()
+        size = os.fstat(file.fileno()).st_size
+        ranges = []
+        start = len(header)
+        while start < size:
+            file.seek(min(start + chunk_size, size))
+            if file.tell() < size:
+                file.readline()  # 다음 줄바꿈까지 이동
+            end = file.tell()
+            ranges.append((start, end))
+            start = end
+    return header, ranges
+
+_WORKER_MATCHERS = {}
+
+def _scan_log_range(log_path, start, end, severity):
+    """
+    병렬 스캔 작업: 한 바이트 범위에서 문제 라인과 이벤트별 개수를 구한다.
+    
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 두고, 매처는
+    작업 프로세스마다 한 번만 컴파일해서 재사용한다.
+    
+    Returns:
+        tuple: (줄바꿈을 통일한 문제 라인 bytes, {이벤트: 개수})
+    """
+    search = _worker_matcher(severity).byte_pattern.search
+    
+    problems = []
+    event_counts = Counter()
+    with open(log_path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    # splitlines()는 \r 등에서도 나누므로, 직렬 경로처럼 \n에서만 나눈다
+    for line in io.BytesIO(data):
+        _count_event(line, event_counts)
+        if search(line.upper()) is not None:
+            problems.append(_normalize_newline(line))
+    return b''.join(problems), event_counts
+
+def _worker_matcher(severity):
+    """작업 프로세스에서 같은 키워드 설정의 매처를 한 번만 컴파일한다."""
+    key = tuple(sorted(severity.items()))
+    matcher = _WORKER_MATCHERS.get(key)
+    if matcher is None:
+        matcher = _WORKER_MATCHERS[key] = KeywordMatcher(severity)
+    return matcher
+
+def _count_event(line, event_counts):
+    """bytes 로그 라인의 event 열을 찾아 event_counts에 더한다."""
+    first = line.find(b',')
+    if first < 0:
+        return
+    second = line.find(b',', first + 1)
+    event = line[first + 1:second] if second >= 0 else line[first + 1:].rstrip()
+    event_counts[event.decode('utf-8', errors='replace')] += 1
+
+def scan_log_parallel(log_path, output_file, workers=None, chunk_size=PARALLEL_CHUNK_SIZE, keywords=None):
+    """
+    로그를 줄바꿈에 맞춘 바이트 범위로 나눠 여러 CPU 코어에서 검사한다.
+    
+    각 범위의 문제 라인은 원래 순서대로 합쳐서 쓰므로 결과 파일은
+    save_problematic_logs의 결과와 바이트 단위로 같다. 동시에 이벤트별
+    라인 수도 센다. 메모리에는 작업 중인 범위들만 올라간다.
+    
+    확장성: 범위들은 서로 독립적이라 작업 프로세스 수에 거의 비례해서
+    빨라지다가 CPU 코어 수나 디스크 읽기 속도에서 멈춘다. 작업 프로세스가
+    1개이면 프로세스 생성과 이벤트 집계 비용 때문에 직렬보다 느리다
+    (1코어 환경, 100만 라인 측정: 직렬 0.93초, 1개 1.51초).
+    코어 수별 측정은 benchmark.py의 bench_parallel_scan으로 한다.
     
+    Args:
+        log_path (str): 로그 파일 경로
+        output_file (str): 문제 로그를 저장할 파일 경로
+        workers (int): 작업 프로세스 수 (기본값 CPU 코어 수)
+        chunk_size (int): 작업 하나가 맡는 바이트 범위 크기
+        keywords (dict | list | KeywordMatcher): 찾을 키워드 (기본값 DEFAULT_MATCHER)
+        
+    Returns:
+        Counter: 이벤트별 라인 수 (로그를 읽을 수 없으면 None)
+    """
+    severity = _get_matcher(keywords).severity
     try:
-        with open(output_file, 'w', encoding='utf-8') as file:
-            file.writelines(problematic_lines)
+        header, ranges = split_log_ranges(log_path, chunk_size)
+    except FileNotFoundError:
+        print(f'오류: {log_path} 파일을 찾을 수 없습니다.')
+        return None
+    except PermissionError:
+        print(f'오류: {log_path} 파일에 접근할 권한이 없습니다.')
+        return None
+    
+    event_counts = Counter()
+    file = None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _scan_log_range,
+                *zip(*((log_path, start, end, severity) for start, end in ranges))
+            ) if ranges else []
+            # executor.map은 제출한 순서대로 결과를 돌려준다
+            for problems, counts in results:
+                event_counts.update(counts)
+                if not problems:
+                    continue
+                if file is None:
+                    file = open(output_file, 'wb')
+                    if b',' in header:
+                        file.write(_normalize_newline(header))
+                file.write(problems)
+    except Exception as e:
+        print(f'오류: 병렬 검사 중 예상치 못한 오류가 발생했습니다. {e}')
+        return None
+    finally:
+        if file is not None:
+            file.close()
+    
+    if file is None:
+        print('문제가 되는 로그 내용이 없습니다.')
+    else:
         print(f'문제가 되는 로그가 {output_file}에 저장되었습니다.')
+    return event_counts
+
+def find_rotated_logs(log_path):
+    """
+    로테이션된 로그 묶음을 오래된 파일부터 찾는다.
+    
+    log_path.N, log_path.N.gz, log_path.N.bz2, log_path.N.xz 형식의 파일을
+    번호가 큰(오래된) 순서로 나열하고, 현재 로그(log_path)를 마지막에 둔다.
+    
+    Args:
+        log_path (str): 현재 로그 파일 경로
+        
+    Returns:
+        list: 로그 파일 경로 리스트 (오래된 순)
+    """
+    pattern = re.compile(re.escape(os.path.basename(log_path)) + ROTATED_LOG_PATTERN)
+    rotated = []
+    for path in glob.glob(glob.escape(log_path) + '.*'):
+        found = pattern.match(os.path.basename(path))
+        if found:
+            rotated.append((int(found.group(1)), path))
+    rotated.sort(reverse=True)
+    paths = [path for _, path in rotated]
+    if os.path.exists(log_path):
+        paths.append(log_path)
+    return paths
+
+def _line_timestamp(line):
+    """str/bytes 로그 라인의 timestamp 열을 epoch 초로 돌려준다."""
+    return parse_timestamp(line[:line.find(b',' if isinstance(line, bytes) else ',')])
+
+def _carry_timestamps(lines, source_index):
+    """
+    라인을 (timestamp, 원본 번호, 라인)으로 돌려준다.
+    
+    timestamp가 없는 라인(여러 줄 메시지 등)은 바로 앞 라인의 timestamp를
+    이어받으므로 병합해도 주인 라인과 떨어지지 않는다.
+    """
+    timestamp = MISSING_TIMESTAMP
+    for line in lines:
+        found = _line_timestamp(line)
+        if found != MISSING_TIMESTAMP:
+            timestamp = found
+        yield timestamp, source_index, line
+
+def iter_log_set(log_path, binary=False):
+    """
+    로테이션·압축된 로그 묶음 전체를 timestamp 순으로 돌려주는 제너레이터
+    
+    각 파일은 시간순으로 쌓인 로그이므로 파일마다 스트리밍으로 풀면서
+    heapq.merge로 병합한다. 헤더 행은 파일마다 첫 라인에 timestamp가
+    없는지로 판단하고(로테이션된 파일에는 보통 헤더가 없다), 처음 찾은
+    헤더를 한 번만 돌려준다. 어느 파일에도 헤더가 없으면 DEFAULT_LOG_HEADER를
+    돌려주므로 첫 라인은 항상 헤더 행이다.
+    
+    Args:
+        log_path (str): 현재 로그 파일 경로
+        binary (bool): True이면 bytes 라인을 돌려줌
+        
+    Yields:
+        str | bytes: 헤더 행과 timestamp 순으로 병합된 로그 라인
+    """
+    streams = []
+    header = None
+    for source_index, path in enumerate(find_rotated_logs(log_path)):
+        lines = iter_log_file(path, binary)
+        first = next(lines, None)
+        if first is None:
+            continue
+        if _line_timestamp(first) != MISSING_TIMESTAMP:
+            lines = chain([first], lines)  # 헤더가 없는 파일은 첫 라인도 데이터
+        elif header is None:
+            header = first
+        streams.append(_carry_timestamps(lines, source_index))
+    if not streams:
+        return
+    if header is None:
+        header = DEFAULT_LOG_HEADER.encode('utf-8') if binary else DEFAULT_LOG_HEADER
+    yield header
+    for _, _, line in heapq.merge(*streams):
+        yield line
+
+def iter_log_file_reversed(file_path, start=0, block_size=64 * 1024):
+    """
+    파일 끝에서부터 bytes 라인을 거꾸로 돌려주는 제너레이터
+    
+    block_size씩 뒤에서부터 읽으므로 파일 크기와 관계없이 메모리에는
+    블록 하나와 걸쳐 있는 라인 하나만 올라간다.
+    
+    Args:
+        file_path (str): 압축되지 않은 로그 파일 경로
+        start (int): 이 바이트 위치 앞부분(예: 헤더 행)은 읽지 않는다
+        block_size (int): 한 번에 읽을 바이트 수
+        
+    Yields:
+        bytes: 파일의 마지막 라인부터 거꾸로 (줄바꿈 포함)
+    """
+    with open(file_path, 'rb') as file:
+        position = file.seek(0, os.SEEK_END)
+        remainder = b''
+        at_end = True  # 파일의 마지막 조각은 줄바꿈으로 끝나지 않는다
+        while position > start:
+            size = min(block_size, position - start)
+            position -= size
+            file.seek(position)
+            parts = (file.read(size) + remainder).split(b'\n')
+            remainder = parts[0]
+            for part in reversed(parts[1:]):
+                if at_end:
+                    at_end = False
+                    if part:
+                        yield part
+                    continue
+                yield part + b'\n'
+        if at_end:
+            if remainder:
+                yield remainder
+        else:
+            yield remainder + b'\n'
+
+def _iter_tagged_lines(log_path, source_index, reverse):
+    """
+    병합할 로그 하나를 (timestamp, 원본 번호, 라인)으로 돌려준다.
+    
+    첫 라인에 timestamp가 없으면 헤더 행으로 보고 건너뛴다. 중간에
+    timestamp가 없는 라인(여러 줄 메시지 등)은 바로 앞의 timestamp 라인에
+    딸린 것으로 보고 그 timestamp를 이어받아 순서가 흐트러지지 않게 한다.
+    역순으로 읽을 때는 딸린 라인이 먼저 나오므로 주인 라인을 만날 때까지
+    모아 두었다가, 주인 라인 뒤에 원래 순서대로 함께 돌려준다.
+    """
+    with open_log_stream(log_path, binary=True) as file:
+        first = file.readline()
+    header_length = len(first) if _line_timestamp(first) == MISSING_TIMESTAMP else 0
+    
+    if reverse:
+        if detect_compression(log_path) is not None:
+            raise ValueError(f'압축된 로그 {log_path}는 역순으로 병합할 수 없습니다.')
+        continuation = []
+        for line in iter_log_file_reversed(log_path, header_length):
+            timestamp = _line_timestamp(line)
+            if timestamp == MISSING_TIMESTAMP:
+                continuation.append(line)
+                continue
+            yield timestamp, source_index, line
+            for owned in reversed(continuation):
+                yield timestamp, source_index, owned
+            continuation.clear()
+        # 첫 timestamp 라인보다 앞에 있던 라인은 주인이 없으므로 맨 뒤에 둔다
+        for line in reversed(continuation):
+            yield MISSING_TIMESTAMP, source_index, line
+        return
+    
+    lines = iter_log_file(log_path, binary=True)
+    if header_length:
+        next(lines, None)
+    yield from _carry_timestamps(lines, source_index)
+
+def iter_merged_logs(log_paths, reverse=False, labels=None):
+    """
+    각각 시간순으로 쌓인 여러 로그를 timestamp 순으로 병합하는 제너레이터
+    
+    미션 컴퓨터, 센서 모듈(mars_base_sensor_log.txt), 환경 로그처럼
+    'timestamp,...' 형식으로 시작하는 로그를 파일마다 스트리밍으로 읽고
+    heapq.merge로 병합하므로 메모리에는 파일마다 라인 하나씩만 올라간다.
+    인코딩이 다른 로그도 섞일 수 있도록 라인은 bytes 그대로 돌려준다.
+    
+    Args:
+        log_paths (list): 로그 파일 경로 리스트 (압축 파일도 가능, 역순은 불가)
+        reverse (bool): True이면 최신 라인부터 (파일을 뒤에서부터 읽음)
+        labels (list): 각 로그의 출처 이름 (기본값은 확장자를 뺀 파일 이름)
+        
+    Yields:
+        tuple: (출처 이름, bytes 라인) - 같은 timestamp는 log_paths 순서대로
+    """
+    if labels is None:
+        labels = [os.path.splitext(os.path.basename(path))[0] for path in log_paths]
+    if len(labels) != len(log_paths):
+        raise ValueError('labels와 log_paths의 개수가 같아야 합니다.')
+    
+    streams = [
+        _iter_tagged_lines(path, source_index, reverse)
+        for source_index, path in enumerate(log_paths)
+    ]
+    for _, source_index, line in heapq.merge(*streams, key=itemgetter(0), reverse=reverse):
+        yield labels[source_index], line
+
+def save_merged_logs(log_paths, output_file, reverse=False, labels=None):
+    """
+    여러 로그를 timestamp 순으로 병합해서 '출처,원본 라인' 형식으로 저장한다.
+    
+    Args:
+        log_paths (list): 로그 파일 경로 리스트
+        output_file (str): 저장할 파일 경로
+        reverse (bool): True이면 최신 라인부터
+        labels (list): 각 로그의 출처 이름 (기본값은 확장자를 뺀 파일 이름)
+        
+    Returns:
+        int: 저장한 라인 수 (실패하면 None)
+    """
+    count = 0
+    try:
+        with open(output_file, 'wb') as file:
+            for label, line in iter_merged_logs(log_paths, reverse, labels):
+                if not line.endswith(b'\n'):
+                    line += b'\n'
+                file.write(label.encode('utf-8') + b',' + _normalize_newline(line))
+                count += 1
+    except FileNotFoundError as e:
+        print(f'오류: {e.filename} 파일을 찾을 수 없습니다.')
+        return None
+    except Exception as e:
+        print(f'오류: 로그를 병합하는 중 예상치 못한 오류가 발생했습니다. {e}')
+        return None
+    print(f'로그 {len(log_paths)}개의 라인 {count}개가 {output_file}에 병합되었습니다.')
+    return count
+
+def _scan_log_file(log_path, severity):
+    """
+    병렬 스캔 작업: 압축되었을 수도 있는 로그 파일 하나를 풀면서 검사한다.
+    
+    첫 라인에 timestamp가 없을 때만 헤더 행으로 보고, 헤더가 없는
+    파일(로테이션된 파일 등)은 첫 라인부터 검사한다.
+    
+    Returns:
+        tuple: (헤더 bytes (없으면 b''), 줄바꿈을 통일한 문제 라인 리스트, {이벤트: 개수})
+    """
+    search = _worker_matcher(severity).byte_pattern.search
+    problems = []
+    event_counts = Counter()
+    with open_log_stream(log_path, binary=True) as file:
+        header = file.readline()
+        lines = file
+        if _line_timestamp(header) != MISSING_TIMESTAMP:
+            lines = chain([header], file)
+            header = b''
+        for line in lines:
+            _count_event(line, event_counts)
+            if search(line.upper()) is not None:
+                problems.append(_normalize_newline(line))
+    return header, problems, event_counts
+
+def scan_rotated_logs(log_path, output_file, workers=None, keywords=None):
+    """
+    로테이션·압축된 로그 묶음 전체에서 문제 라인을 찾아 timestamp 순으로 저장한다.
+    
+    파일마다 작업 프로세스 하나가 압축을 풀면서 검사하므로 디스크에
+    압축을 풀어 둘 필요가 없고, 여러 파일을 동시에 풀 수 있다.
+    메모리에는 문제 라인만 모인다.
+    
+    Args:
+        log_path (str): 현재 로그 파일 경로
+        output_file (str): 문제 로그를 저장할 파일 경로
+        workers (int): 작업 프로세스 수 (기본값 CPU 코어 수)
+        keywords (dict | list | KeywordMatcher): 찾을 키워드 (기본값 DEFAULT_MATCHER)
+        
+    Returns:
+        Counter: 묶음 전체의 이벤트별 라인 수 (실패하면 None)
+    """
+    paths = find_rotated_logs(log_path)
+    if not paths:
+        print(f'오류: {log_path} 로그 묶음을 찾을 수 없습니다.')
+        return None
+    
+    severity = _get_matcher(keywords).severity
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_scan_log_file, paths, [severity] * len(paths)))
+    except Exception as e:
+        print(f'오류: 로그 묶음을 검사하는 중 예상치 못한 오류가 발생했습니다. {e}')
+        return None
+    
+    event_counts = Counter()
+    for _, _, counts in results:
+        event_counts.update(counts)
+    header = next((header for header, _, _ in results if header), b'')
+    problems = heapq.merge(*(problems for _, problems, _ in results), key=_line_timestamp)
+    
+    file = None
+    try:
+        for line in problems:
+            if file is None:
+                file = open(output_file, 'wb')
+                if b',' in header:
+                    file.write(_normalize_newline(header))
+            file.write(line)
     except Exception as e:
         print(f'오류: 파일을 저장하는 중 예상치 못한 오류가 발생했습니다. {e}')
+        return None
+    finally:
+        if file is not None:
+            file.close()
+    
+    if file is None:
+        print('문제가 되는 로그 내용이 없습니다.')
+    else:
+        print(f'로그 {len(paths)}개의 문제 로그가 {output_file}에 저장되었습니다.')
+    return event_counts
 
-def main():
+def load_checkpoint(checkpoint_path):
     """
-    메인 함수
+    증분 처리 체크포인트를 읽는다.
+    
+    Args:
+        checkpoint_path (str): 체크포인트 사이드카 파일 경로
+        
+    Returns:
+        dict: 체크포인트 (파일이 없거나 손상되었으면 None)
+    """
+    try:
+        with open(checkpoint_path, 'r', encoding='utf-8') as file:
+            checkpoint = json.load(file)
+        if not all(key in checkpoint for key in ('offset', 'inode', 'device', 'head_crc', 'head_length')):
+            raise ValueError('필수 항목이 없습니다.')
+        return checkpoint
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f'경고: 체크포인트 {checkpoint_path}를 읽을 수 없어 처음부터 처리합니다. {e}')
+        return None
+
+def save_checkpoint(checkpoint_path, checkpoint):
+    """
+    증분 처리 체크포인트를 임시 파일에 쓴 뒤 교체해서 원자적으로 저장한다.
+    
+    Args:
+        checkpoint_path (str): 체크포인트 사이드카 파일 경로
+        checkpoint (dict): 저장할 체크포인트
+    """
+    temp_path = checkpoint_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(checkpoint, file)
+    os.replace(temp_path, checkpoint_path)
+
+def _head_crc(file, length):
+    """파일 앞부분 length 바이트의 CRC32 (같은 파일인지 확인하는 지문)"""
+    file.seek(0)
+    return zlib.crc32(file.read(length))
+
+def _is_same_file(file, stat, checkpoint):
+    """체크포인트가 가리키는 파일이 지금 열린 파일과 같은 파일인지 확인한다."""
+    if (stat.st_ino, stat.st_dev) != (checkpoint['inode'], checkpoint['device']):
+        return False
+    if stat.st_size < checkpoint['offset']:
+        return False
+    return _head_crc(file, checkpoint['head_length']) == checkpoint['head_crc']
+
+def _find_rotated_log(log_path, checkpoint):
+    """로테이션으로 이름이 바뀐 이전 로그(log_path.1)가 체크포인트의 파일이면 경로를 돌려준다."""
+    rotated_path = f'{log_path}.1'
+    try:
+        stat = os.stat(rotated_path)
+    except OSError:
+        return None
+    if (stat.st_ino, stat.st_dev) == (checkpoint['inode'], checkpoint['device']):
+        return rotated_path
+    return None
+
+def _read_header(log_path):
+    """로그 파일의 헤더 행을 bytes로 돌려준다 (없으면 None)."""
+    try:
+        with open(log_path, 'rb') as file:
+            first = file.readline()
+    except OSError:
+        return None
+    if first and _line_timestamp(first) == MISSING_TIMESTAMP:
+        return first
+    return None
+
+class _ProblemLogAppender:
+    """문제 라인이 처음 나올 때 출력 파일을 열고, 빈 파일이면 헤더부터 쓰는 도우미"""
+    
+    def __init__(self, output_file, header, mode='ab'):
+        self.output_file = output_file
+        self.header = header
+        self.mode = mode
+        self.file = None
+        self.count = 0
+    
+    def write(self, line):
+        if self.file is None:
+            self.file = open(self.output_file, self.mode)
+            if self.file.tell() == 0 and self.header is not None:
+                self.file.write(_normalize_newline(self.header))
+        self.file.write(_normalize_newline(line))
+        self.count += 1
+    
+    def close(self):
+        if self.file is None and self.mode == 'wb' and os.path.exists(self.output_file):
+            # 새로 쓰는데 문제 라인이 없으면 이전 결과만 비운다
+            self.file = open(self.output_file, 'wb')
+        if self.file is not None:
+            self.file.close()
+
+def _scan_new_lines(file, offset, matcher, appender):
+    """
+    offset부터 줄바꿈으로 끝나는 완전한 라인만 검사해서 문제 라인을 쓴다.
+    
+    마지막 라인이 아직 다 쓰이지 않았으면(줄바꿈 없음) 처리하지 않고
+    다음 실행으로 넘긴다.
+    
+    Returns:
+        int: 처리를 마친 바이트 위치
+    """
+    search = matcher.byte_pattern.search
+    file.seek(offset)
+    for line in file:
+        if not line.endswith(b'\n'):
+            break
+        if offset == 0 and _line_timestamp(line) == MISSING_TIMESTAMP:
+            # 첫 줄이 타임스탬프로 시작하지 않으면 헤더 행이므로 검사하지 않는다
+            appender.header = line
+        elif search(line.upper()) is not None:
+            appender.write(line)
+        offset += len(line)
+    return offset
+
+def process_log_incrementally(log_path, output_file, checkpoint_path=None, keywords=None):
+    """
+    지난 실행 이후 로그 파일에 추가된 바이트만 검사해서 문제 라인을 덧붙인다.
+    
+    마지막으로 처리한 바이트 위치와 inode/장치 번호, 앞부분 CRC를
+    사이드카 체크포인트 파일에 저장한다. 파일이 로테이션되었으면
+    (inode가 바뀜) 이전 파일(log_path.1)의 남은 부분을 먼저 처리한 뒤
+    새 파일을 처음부터 읽고, 잘렸거나(크기가 줄어듦) 내용이 바뀌었으면
+    처음부터 다시 읽는다. 체크포인트가 없으면 출력 파일을 새로 쓴다.
+    
+    Args:
+        log_path (str): 로그 파일 경로
+        output_file (str): 문제 라인을 덧붙일 파일 경로
+        checkpoint_path (str): 체크포인트 경로 (기본값 log_path + CHECKPOINT_SUFFIX)
+        keywords (dict | list | KeywordMatcher): 찾을 키워드 (기본값 DEFAULT_MATCHER)
+        
+    Returns:
+        int: 새로 저장한 문제 라인 수 (로그를 읽을 수 없으면 0)
+    """
+    checkpoint_path = checkpoint_path or log_path + CHECKPOINT_SUFFIX
+    matcher = _get_matcher(keywords)
+    checkpoint = load_checkpoint(checkpoint_path)
+    # 체크포인트가 없으면 처음부터 전부 다시 검사하므로 이전 결과에 덧붙이지 않고 새로 쓴다
+    mode = 'ab' if checkpoint is not None else 'wb'
+    appender = _ProblemLogAppender(output_file, _read_header(log_path), mode)
+    
+    try:
+        with open(log_path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            offset = 0
+            if checkpoint is not None:
+                if _is_same_file(file, stat, checkpoint):
+                    offset = checkpoint['offset']
+                elif (stat.st_ino, stat.st_dev) != (checkpoint['inode'], checkpoint['device']):
+                    print(f'{log_path} 로그가 로테이션되어 새 파일을 처음부터 읽습니다.')
+                    rotated_path = _find_rotated_log(log_path, checkpoint)
+                    if rotated_path is not None:
+                        with open(rotated_path, 'rb') as rotated:
+                            _scan_new_lines(rotated, checkpoint['offset'], matcher, appender)
+                else:
+                    print(f'{log_path} 로그가 잘렸거나 바뀌어 처음부터 다시 읽습니다.')
+            
+            offset = _scan_new_lines(file, offset, matcher, appender)
+            head_length = min(offset, CHECKPOINT_HEAD_LENGTH)
+            checkpoint = {
+                'offset': offset,
+                'inode': stat.st_ino,
+                'device': stat.st_dev,
+                'size': stat.st_size,
+                'head_crc': _head_crc(file, head_length),
+                'head_length': head_length
+            }
+    except FileNotFoundError:
+        print(f'오류: {log_path} 파일을 찾을 수 없습니다.')
+        return 0
+    except PermissionError:
+        print(f'오류: {log_path} 파일에 접근할 권한이 없습니다.')
+        return 0
+    finally:
+        appender.close()
+    
+    save_checkpoint(checkpoint_path, checkpoint)
+    return appender.count
+
+def follow_log(log_path, output_file, interval=1.0, checkpoint_path=None, keywords=None, max_polls=None):
+    """
+    tail -f처럼 로그 파일을 주기적으로 확인하면서 새 문제 라인을 덧붙인다.
+    
+    Args:
+        log_path (str): 로그 파일 경로
+        output_file (str): 문제 라인을 덧붙일 파일 경로
+        interval (float): 확인 주기(초)
+        checkpoint_path (str): 체크포인트 경로 (기본값 log_path + CHECKPOINT_SUFFIX)
+        keywords (dict | list | KeywordMatcher): 찾을 키워드 (기본값 DEFAULT_MATCHER)
+        max_polls (int): 최대 확인 횟수 (기본값은 Ctrl+C까지 계속)
+    """
+    polls = 0
+    try:
+        while max_polls is None or polls < max_polls:
+            count = process_log_incrementally(log_path, output_file, checkpoint_path, keywords)
+            if count:
+                print(f'새 문제 로그 {count}건이 {output_file}에 추가되었습니다.')
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        print('\n로그 감시를 종료합니다.')
+
+class TimeIndex:
+    """
+    로그 파일의 N번째 라인마다 (timestamp, 바이트 위치)를 기록한 희소 인덱스
+    
+    로그 옆에 사이드카 파일(log_path + TIME_INDEX_SUFFIX)로 저장되며,
+    로그가 뒤에 덧붙여지면 새로 추가된 부분만 이어서 색인한다.
+    증분 처리 체크포인트처럼 inode/장치 번호와 앞부분 CRC, 그리고
+    색인한 마지막 부분의 CRC를 지문으로 저장해서, 로그가 로테이션되거나
+    다른 파일로 바뀌면 (더 커졌더라도) 알아챌 수 있다.
+    
+    항목에는 그 라인까지의 가장 늦은 timestamp를 기록하고, 앞선 라인보다
+    얼마나 늦게 기록된 라인이 있었는지(최대 지연)를 함께 저장한다.
+    시간순이 조금 어긋난 라인이 있어도 검색 범위를 지연만큼 넓혀서
+    인덱스를 계속 쓸 수 있고, 다시 만들 때마다 지연도 새로 계산된다.
+    
+    파일 형식 (리틀 엔디언):
+        헤더: 매직(8s) 버전(H) 플래그(H) 간격(I) 색인한 크기(q)
+              마지막 항목 이후 라인 수(q) 가장 늦은 timestamp(q) 최대 지연(q)
+              inode(Q) 장치 번호(Q) 앞부분 길이(I) 앞부분 CRC(I) 끝부분 CRC(I)
+        항목: (가장 늦은 timestamp(q), 바이트 위치(q)) 반복
+    """
+    
+    MAGIC = b'MLOGTIX\x00'
+    VERSION = 3
+    HEADER = struct.Struct('<8sHHIqqqqQQIII')
+    ENTRY = struct.Struct('<qq')
+    
+    def __init__(self, every=TIME_INDEX_EVERY):
+        """
+        TimeIndex 초기화
+        
+        Args:
+            every (int): 몇 라인마다 항목을 기록할지
+        """
+        self.every = every
+        self.timestamps = array('q')
+        self.offsets = array('q')
+        self.indexed_size = 0
+        self.lines_since_entry = every
+        self.last_timestamp = MISSING_TIMESTAMP
+        self.max_lateness = 0
+        self.inode = 0
+        self.device = 0
+        self.head_length = 0
+        self.head_crc = 0
+        self.tail_crc = 0
+    
+    def _tail_crc(self, file):
+        """색인한 부분의 마지막 head_length 바이트의 CRC32"""
+        file.seek(self.indexed_size - self.head_length)
+        return zlib.crc32(file.read(self.head_length))
+    
+    def matches(self, file):
+        """
+        인덱스가 지금 열린 로그 파일을 색인한 것인지 지문으로 확인한다.
+        
+        Args:
+            file (file): 바이너리 모드로 열린 로그 파일
+            
+        Returns:
+            bool: 같은 파일이고 색인한 부분이 그대로면 True
+        """
+        stat = os.fstat(file.fileno())
+        if (stat.st_ino, stat.st_dev) != (self.inode, self.device):
+            return False
+        if stat.st_size < self.indexed_size:
+            return False
+        return (_head_crc(file, self.head_length) == self.head_crc
+                and self._tail_crc(file) == self.tail_crc)
+    
+    def update(self, file):
+        """
+        지금까지 색인한 위치 뒤에 추가된 완전한 라인들을 색인한다.
+        
+        Args:
+            file (file): 바이너리 모드로 열린 로그 파일
+        """
+        file.seek(self.indexed_size)
+        offset = self.indexed_size
+        if offset == 0:
+            # 헤더 행은 색인하지 않는다
+            header = file.readline()
+            if not header.endswith(b'\n'):
+                return
+            offset = len(header)
+        
+        for line in file:
+            if not line.endswith(b'\n'):
+                break
+            timestamp = parse_timestamp(line[:line.find(b',')])
+            if timestamp != MISSING_TIMESTAMP:
+                if timestamp < self.last_timestamp:
+                    self.max_lateness = max(self.max_lateness, self.last_timestamp - timestamp)
+                else:
+                    self.last_timestamp = timestamp
+                if self.lines_since_entry >= self.every:
+                    self.timestamps.append(self.last_timestamp)
+                    self.offsets.append(offset)
+                    self.lines_since_entry = 0
+            self.lines_since_entry += 1
+            offset += len(line)
+        self.indexed_size = offset
+        
+        stat = os.fstat(file.fileno())
+        self.inode, self.device = stat.st_ino, stat.st_dev
+        self.head_length = min(offset, CHECKPOINT_HEAD_LENGTH)
+        self.head_crc = _head_crc(file, self.head_length)
+        self.tail_crc = self._tail_crc(file)
+    
+    def locate(self, start, end):
+        """
+        [start, end] 구간의 라인이 들어 있는 바이트 범위를 이분 탐색으로 찾는다.
+        
+        Args:
+            start (int): 시작 epoch 초
+            end (int): 끝 epoch 초
+            
+        Returns:
+            tuple: (시작 위치, 끝 위치) - 끝 위치가 None이면 파일 끝까지
+        """
+        if not self.offsets:
+            return 0, None
+        
+        # start보다 이른 마지막 항목부터 읽으면 start 이상인 라인을 놓치지 않는다
+        first = bisect_left(self.timestamps, start) - 1
+        begin = self.offsets[max(first, 0)]
+        
+        # end + 최대 지연보다 늦은 첫 항목부터는 모두 구간 밖이다
+        last = bisect_right(self.timestamps, end + self.max_lateness)
+        stop = self.offsets[last] if last < len(self.offsets) else None
+        return begin, stop
+    
+    def save(self, index_path):
+        """
+        인덱스를 임시 파일에 쓴 뒤 교체해서 저장한다.
+        
+        Args:
+            index_path (str): 인덱스 파일 경로
+        """
+        temp_path = index_path + '.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(self.HEADER.pack(
+                self.MAGIC, self.VERSION, 0, self.every,
+                self.indexed_size, self.lines_since_entry, self.last_timestamp, self.max_lateness,
+                self.inode, self.device, self.head_length, self.head_crc, self.tail_crc
+            ))
+            entries = array('q')
+            for timestamp, offset in zip(self.timestamps, self.offsets):
+                entries.append(timestamp)
+                entries.append(offset)
+            if struct.pack('=q', 1) != struct.pack('<q', 1):
+                entries.byteswap()
+            entries.tofile(file)
+        os.replace(temp_path, index_path)
+    
+    @classmethod
+    def load(cls, index_path):
+        """
+        저장된 인덱스를 읽는다.
+        
+        Args:
+            index_path (str): 인덱스 파일 경로
+            
+        Returns:
+            TimeIndex: 읽은 인덱스 (파일이 없거나 형식이 맞지 않으면 None)
+        """
+        try:
+            with open(index_path, 'rb') as file:
+                header = file.read(cls.HEADER.size)
+                data = file.read()
+        except OSError:
+            return None
+        if len(header) != cls.HEADER.size or len(data) % cls.ENTRY.size:
+            return None
+        (magic, version, flags, every, indexed_size, lines_since_entry, last_timestamp, max_lateness,
+         inode, device, head_length, head_crc, tail_crc) = cls.HEADER.unpack(header)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            return None
+        
+        index = cls(every)
+        index.indexed_size = indexed_size
+        index.lines_since_entry = lines_since_entry
+        index.last_timestamp = last_timestamp
+        index.max_lateness = max_lateness
+        index.inode, index.device = inode, device
+        index.head_length, index.head_crc, index.tail_crc = head_length, head_crc, tail_crc
+        entries = array('q', data)
+        if struct.pack('=q', 1) != struct.pack('<q', 1):
+            entries.byteswap()
+        index.timestamps = entries[0::2]
+        index.offsets = entries[1::2]
+        return index
+
+def open_time_index(log_path, index_path=None, every=TIME_INDEX_EVERY):
+    """
+    로그의 희소 인덱스를 읽고, 로그가 늘어났으면 이어서 색인해 저장한다.
+    
+    로그가 색인한 크기보다 작아졌거나, inode/장치 번호나 앞·끝부분 CRC가
+    달라졌으면(잘림, 로테이션, 다른 파일로 교체) 처음부터 다시 만든다.
+    
+    Args:
+        log_path (str): 로그 파일 경로
+        index_path (str): 인덱스 경로 (기본값 log_path + TIME_INDEX_SUFFIX)
+        every (int): 새로 만들 때 몇 라인마다 항목을 기록할지
+        
+    Returns:
+        TimeIndex: 최신 상태의 인덱스
+    """
+    index_path = index_path or log_path + TIME_INDEX_SUFFIX
+    index = TimeIndex.load(index_path)
+    with open(log_path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        rebuilt = index is None or not index.matches(file)
+        if rebuilt:
+            index = TimeIndex(every)
+        if size != index.indexed_size:
+            indexed_size = index.indexed_size
+            index.update(file)
+            # 마지막 라인이 아직 덜 쓰였을 뿐 새로 색인한 라인이 없으면 다시 저장하지 않는다
+            if rebuilt or index.indexed_size != indexed_size:
+                index.save(index_path)
+    return index
+
+def _to_epoch(value):
+    """epoch 초(int) 또는 'YYYY-MM-DD HH:MM:SS' 문자열을 epoch 초로 바꾼다."""
+    if isinstance(value, int):
+        return value
+    timestamp = parse_timestamp(value)
+    if timestamp == MISSING_TIMESTAMP:
+        raise ValueError(f'timestamp 형식이 올바르지 않습니다: {value!r} (YYYY-MM-DD HH:MM:SS)')
+    return timestamp
+
+def query_time_window(log_path, start, end, index_path=None):
+    """
+    [start, end] 시간 구간의 로그 라인만 읽어서 돌려주는 제너레이터
+    
+    희소 인덱스를 이분 탐색해서 구간이 들어 있는 바이트 범위를 찾고,
+    mmap으로 그 범위만 읽는다. 시간순이 어긋난 라인이 있으면 그 지연만큼
+    범위를 넓혀서 읽는다.
+    
+    Args:
+        log_path (str): 로그 파일 경로
+        start (int | str): 시작 시각 (epoch 초 또는 'YYYY-MM-DD HH:MM:SS')
+        end (int | str): 끝 시각 (포함)
+        index_path (str): 인덱스 경로 (기본값 log_path + TIME_INDEX_SUFFIX)
+        
+    Yields:
+        str: 구간에 속하는 로그 라인 (줄바꿈은 '\n'으로 통일)
+    """
+    start = _to_epoch(start)
+    end = _to_epoch(end)
+    index = open_time_index(log_path, index_path)
+    
+    with open(log_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            begin, stop = index.locate(start, end)
+            if begin == 0:
+                begin = view.find(b'\n') + 1 or len(view)  # 헤더 행 건너뛰기
+            if stop is None:
+                stop = len(view)
+            
+            position = begin
+            while position < stop:
+                newline = view.find(b'\n', position, stop)
+                line_end = stop if newline < 0 else newline + 1
+                line = view[position:line_end]
+                position = line_end
+                
+                timestamp = parse_timestamp(line[:line.find(b',')])
+                if timestamp == MISSING_TIMESTAMP or timestamp < start:
+                    continue
+                if timestamp > end:
+                    # 이후 라인은 이 라인보다 최대 지연 이상 이를 수 없다
+                    if timestamp - index.max_lateness > end:
+                        break
+                    continue
+                yield _normalize_newline(line).decode('utf-8', errors='replace')
+
+class LogStore:
+    """
+    반복 분석을 위해 파싱한 로그를 적은 메모리로 들고 있는 저장소
+    
+    이벤트는 저장소마다 따로 매기는 정수 코드(array('H'), 서로 다른 이벤트가
+    65536개를 넘으면 array('I')로 바꿈)로, timestamp는 array('q')로,
+    메시지는 bytearray 하나에 이어 붙이고 위치(array('q'))로 가리킨다.
+    같은 메시지는 한 번만 저장한다(서로 다른 메시지 STORE_DEDUP_LIMIT개까지
+    메시지의 해시로 기억함). 필터·정렬·슬라이스는 라인을 복사하지 않고
+    LogView의 인덱스 배열만 만든다.
+    
+    메모리는 메시지가 얼마나 반복되는지에 달려 있다 (tracemalloc, 100만 라인).
+    평상시 미션 로그처럼 같은 메시지가 반복되면 라인마다 약 14바이트로
+    readlines()(약 112바이트)보다 한 자릿수 적다. 메시지가 모두 다르면
+    메시지 바이트와 배열(라인당 22바이트)에 중복 확인용 사전이 더해져
+    라인당 약 88바이트로 readlines()(약 136바이트)와 큰 차이가 없고,
+    라인 수가 적을수록 사전의 몫이 커져 비슷해진다.
+    """
+    
+    def __init__(self, header='timestamp,event,message\n', dedup_limit=STORE_DEDUP_LIMIT):
+        """
+        LogStore 초기화
+        
+        Args:
+            header (str): 헤더 행
+            dedup_limit (int): 중복 제거를 위해 기억할 서로 다른 메시지 수의 상한
+        """
+        self.header = header
+        self.dedup_limit = dedup_limit
+        self.timestamps = array('q')
+        self.event_codes = array('H')
+        self.event_names = []
+        self.message_ids = array('I')
+        self.message_offsets = array('q', [0])
+        self.buffer = bytearray()
+        self._message_index = {}
+        self._event_index = {}
+        self._bare_lines = set()
+    
+    @classmethod
+    def from_file(cls, file_path, dedup_limit=STORE_DEDUP_LIMIT):
+        """
+        로그 파일을 bytes로 스트리밍하면서 저장소를 만든다.
+        
+        Args:
+            file_path (str): 로그 파일 경로 (압축 파일도 가능)
+            dedup_limit (int): 중복 제거를 위해 기억할 서로 다른 메시지 수의 상한
+            
+        Returns:
+            LogStore: 만든 저장소 (파일을 읽을 수 없으면 빈 저장소)
+        """
+        return cls.from_lines(iter_log_file(file_path, binary=True), dedup_limit=dedup_limit)
+    
+    @classmethod
+    def from_lines(cls, lines, has_header=True, dedup_limit=STORE_DEDUP_LIMIT):
+        """
+        로그 라인들로 저장소를 만든다.
+        
+        Args:
+            lines (iterable): 로그 라인 (str 또는 bytes)
+            has_header (bool): 첫 라인이 헤더 행이면 True
+            dedup_limit (int): 중복 제거를 위해 기억할 서로 다른 메시지 수의 상한
+            
+        Returns:
+            LogStore: 만든 저장소
+        """
+        store = cls(dedup_limit=dedup_limit)
+        lines = iter(lines)
+        if has_header:
+            header = next(lines, None)
+            if header is not None:
+                store.header = _to_text(_normalize_newline(header))
+        for line in lines:
+            store.append(line)
+        return store
+    
+    def append(self, line):
+        """
+        로그 라인 하나를 파싱해서 저장한다.
+        
+        Args:
+            line (str | bytes): 헤더를 제외한 로그 라인
+        """
+        if isinstance(line, str):
+            line = line.encode('utf-8')
+        record = LogRecord.parse(line)
+        if record.timestamp == MISSING_TIMESTAMP:
+            # timestamp가 없는 라인은 원래 모양으로 되살릴 수 있게 라인 전체를 저장한다
+            message = line.rstrip(b'\r\n')
+        else:
+            message = record.message
+            if record.message_offset == len(line) and not line.endswith(b','):
+                # 'timestamp,event'처럼 메시지 열이 없는 라인은 되살릴 때 쉼표를 붙이지 않는다
+                self._bare_lines.add(len(self.timestamps))
+        
+        event_code = self._event_code(record.event)
+        self.timestamps.append(record.timestamp)
+        self.event_codes.append(event_code)
+        self.message_ids.append(self._message_id(message))
+    
+    def _event_code(self, event):
+        """이벤트 이름을 이 저장소의 정수 코드로 바꾼다 (처음 보는 이름이면 새로 등록)."""
+        code = self._event_index.get(event)
+        if code is None:
+            code = self._event_index[event] = len(self.event_names)
+            self.event_names.append(event)
+            if code > 0xFFFF and self.event_codes.typecode == 'H':
+                self.event_codes = array('I', self.event_codes)
+        return code
+    
+    def _message_id(self, message):
+        """
+        메시지를 버퍼에 저장하고 id를 돌려준다 (이미 있으면 기존 id).
+        
+        중복 확인용 사전은 메시지 bytes 대신 hash(message)를 키로 하고,
+        찾은 id의 메시지가 정말 같은지 버퍼에서 확인한다. 해시가 같은
+        다른 메시지는 새로 저장한다.
+        """
+        key = hash(message)
+        message_id = self._message_index.get(key)
+        if message_id is not None:
+            start = self.message_offsets[message_id]
+            if (self.message_offsets[message_id + 1] - start == len(message)
+                    and self.buffer.startswith(message, start)):
+                return message_id
+        
+        message_id = len(self.message_offsets) - 1
+        self.buffer += message
+        self.message_offsets.append(len(self.buffer))
+        if key not in self._message_index and len(self._message_index) < self.dedup_limit:
+            self._message_index[key] = message_id
+        return message_id
+    
+    def __len__(self):
+        return len(self.timestamps)
+    
+    def message(self, index):
+        """index번째 라인의 메시지 (str)"""
+        message_id = self.message_ids[index]
+        start = self.message_offsets[message_id]
+        end = self.message_offsets[message_id + 1]
+        return self.buffer[start:end].decode('utf-8', errors='replace')
+    
+    def event(self, index):
+        """index번째 라인의 이벤트 이름"""
+        return self.event_names[self.event_codes[index]]
+    
+    def line(self, index):
+        """
+        index번째 라인을 원래 'timestamp,event,message' 형식으로 되살린다.
+        
+        Args:
+            index (int): 라인 번호
+            
+        Returns:
+            str: 줄바꿈('\n')으로 끝나는 로그 라인
+        """
+        timestamp = self.timestamps[index]
+        if timestamp == MISSING_TIMESTAMP:
+            return self.message(index) + '\n'
+        if index in self._bare_lines:
+            return f'{format_timestamp(timestamp)},{self.event(index)}\n'
+        return f'{format_timestamp(timestamp)},{self.event(index)},{self.message(index)}\n'
+    
+    def view(self):
+        """저장소 전체를 가리키는 LogView"""
+        return LogView(self)
+    
+    @property
+    def nbytes(self):
+        """저장소가 차지하는 대략적인 메모리(바이트, 중복 제거용 사전 제외)"""
+        arrays = (self.timestamps, self.event_codes, self.message_ids, self.message_offsets)
+        return sum(len(values) * values.itemsize for values in arrays) + len(self.buffer)
+
+class LogView:
     """
-    log_file_path = 'mission_computer_main.log'
-    problem_log_file = 'problematic_logs.log'
+    LogStore의 일부 라인을 인덱스 배열로 가리키는 뷰
+    
+    filter(), sort(), 슬라이스는 라인을 복사하지 않고 새 인덱스 배열을 가진
+    뷰를 돌려준다. 반복하면 원래 형식의 로그 라인(str)을 하나씩 만들어 낸다.
+    """
+    
+    def __init__(self, store, indices=None):
+        """
+        LogView 초기화
+        
+        Args:
+            store (LogStore): 가리킬 저장소
+            indices (array): 라인 번호 배열 (기본값은 저장소 전체)
+        """
+        self.store = store
+        self.indices = indices
     
-    # 로그 파일 읽기
-    log_lines = read_log_file(log_file_path)
+    def __len__(self):
+        return len(self.store) if self.indices is None else len(self.indices)
     
-    if log_lines:
-        # 원본 로그 내용 출력
-        print('원본 로그 내용:')
-        print_log_content(log_lines)
+    def _index_range(self):
+        return range(len(self.store)) if self.indices is None else self.indices
+    
+    def __iter__(self):
+        line = self.store.line
+        for index in self._index_range():
+            yield line(index)
+    
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            indices = self._index_range()[item]
+            return LogView(self.store, array('q', indices) if isinstance(indices, range) else indices)
+        return self.store.line(self._index_range()[item])
+    
+    def lines(self, with_header=True):
+        """
+        헤더 행(선택)과 뷰의 로그 라인을 돌려주는 제너레이터
+        
+        Args:
+            with_header (bool): 헤더 행도 돌려줄지 여부
+            
+        Yields:
+            str: 로그 라인
+        """
+        if with_header:
+            yield self.store.header
+        yield from self
+    
+    def filter(self, event=None, start=None, end=None, keywords=None):
+        """
+        조건에 맞는 라인만 가리키는 새 뷰를 만든다.
+        
+        키워드 검사는 서로 다른 메시지와 이벤트마다 한 번만 하므로
+        반복되는 메시지가 많은 로그일수록 빠르다.
+        
+        Args:
+            event (str): 이 이벤트 이름의 라인만
+            start (int | str): 이 시각 이후 라인만 (epoch 초 또는 'YYYY-MM-DD HH:MM:SS')
+            end (int | str): 이 시각까지의 라인만
+            keywords (dict | list | KeywordMatcher | bool): 문제 키워드가 있는 라인만
+                (True이면 DEFAULT_MATCHER)
+            
+        Returns:
+            LogView: 조건에 맞는 라인의 뷰
+        """
+        store = self.store
+        timestamps = store.timestamps
+        event_codes = store.event_codes
+        message_ids = store.message_ids
+        event_code = store._event_index.get(event, -1) if event is not None else None
+        start = _to_epoch(start) if start is not None else None
+        end = _to_epoch(end) if end is not None else None
         
-        # 시간 역순으로 정렬된 로그 출력
-        sorted_log_lines = sort_logs_by_time_reversed(log_lines)
-        print('\n시간 역순으로 정렬된 로그 내용:')
-        print_log_content(sorted_log_lines)
+        matches_message = matches_event = None
+        if keywords is not None and keywords is not False:
+            matcher = _get_matcher(None if keywords is True else keywords)
+            message_cache = {}
+            event_cache = {}
+            
+            def matches_message(message_id):
+                found = message_cache.get(message_id)
+                if found is None:
+                    begin = store.message_offsets[message_id]
+                    stop = store.message_offsets[message_id + 1]
+                    found = matcher.byte_pattern.search(bytes(store.buffer[begin:stop]).upper()) is not None
+                    message_cache[message_id] = found
+                return found
+            
+            def matches_event(code):
+                found = event_cache.get(code)
+                if found is None:
+                    found = event_cache[code] = matcher.search(store.event_names[code]) is not None
+                return found
         
-        # 문제가 되는 로그만 파일로 저장
-        save_problematic_logs(log_lines, problem_log_file)
+        selected = array('q')
+        for index in self._index_range():
+            if event_code is not None and event_codes[index] != event_code:
+                continue
+            if start is not None and timestamps[index] < start:
+                continue
+            if end is not None and timestamps[index] > end:
+                continue
+            if matches_message is not None and not (
+                matches_event(event_codes[index]) or matches_message(message_ids[index])
+            ):
+                continue
+            selected.append(index)
+        return LogView(store, selected)
+    
+    def sort(self, reverse=False):
+        """
+        timestamp 순으로 정렬된 새 뷰를 만든다 (같은 timestamp는 원래 순서 유지).
+        
+        Args:
+            reverse (bool): True이면 시간 역순
+            
+        Returns:
+            LogView: 정렬된 뷰
+        """
+        indices = sorted(self._index_range(), key=self.store.timestamps.__getitem__, reverse=reverse)
+        return LogView(self.store, array('q', indices))
+
+class LogAggregator:
+    """
+    로그를 한 번만 훑으면서 사고 분석에 필요한 통계를 모으는 집계기
+    
+    이벤트 종류별 개수, 문제 키워드별 개수와 처음/마지막 발생, 시간 구간
+    (기본 1분)별 이벤트·키워드 개수를 함께 계산한다. 라인은 저장하지 않으므로
+    메모리 사용량은 라인 수가 아니라 구간 수와 이벤트·키워드 종류 수에만 비례한다.
+    """
+    
+    def __init__(self, bucket_seconds=60, keywords=None):
+        """
+        LogAggregator 초기화
+        
+        Args:
+            bucket_seconds (int): 시간 구간 크기(초)
+            keywords (dict | list | KeywordMatcher): 찾을 키워드 (기본값 DEFAULT_MATCHER)
+        """
+        if bucket_seconds <= 0:
+            raise ValueError('시간 구간 크기는 0보다 커야 합니다.')
+        self.bucket_seconds = bucket_seconds
+        self.matcher = _get_matcher(keywords)
+        self.line_count = 0
+        self.event_counts = Counter()
+        self.keyword_counts = Counter()
+        self.first_seen = {}
+        self.last_seen = {}
+        self.buckets = {}
+    
+    def add(self, line):
+        """
+        로그 라인 하나를 집계에 더한다.
+        
+        Args:
+            line (str | bytes | LogRecord): 헤더를 제외한 로그 라인
+        """
+        record = line if isinstance(line, LogRecord) else LogRecord.parse(line)
+        event = record.event
+        self.line_count += 1
+        self.event_counts[event] += 1
+        
+        bucket = None
+        if record.timestamp != MISSING_TIMESTAMP:
+            start = record.timestamp - record.timestamp % self.bucket_seconds
+            bucket = self.buckets.get(start)
+            if bucket is None:
+                bucket = self.buckets[start] = Counter()
+            bucket['event', event] += 1
+        
+        for keyword in self.matcher.find_all(record):
+            self.keyword_counts[keyword] += 1
+            if bucket is not None:
+                bucket['keyword', keyword] += 1
+            occurrence = (record.timestamp, _to_text(record.message))
+            if keyword not in self.first_seen:
+                self.first_seen[keyword] = occurrence
+            self.last_seen[keyword] = occurrence
+    
+    def consume(self, lines, has_header=True):
+        """
+        로그 라인들을 한 번에 집계한다.
+        
+        Args:
+            lines (iterable): 로그 라인 (str, bytes 또는 LogRecord)
+            has_header (bool): 첫 라인이 헤더 행이면 True
+            
+        Returns:
+            LogAggregator: 메서드 체이닝을 위한 자기 자신
+        """
+        lines = iter(lines)
+        if has_header:
+            next(lines, None)
+        for line in lines:
+            self.add(line)
+        return self
+    
+    def rows(self):
+        """
+        시간 구간별 개수를 (구간 시작, 종류, 이름, 개수) 행으로 돌려준다.
+        
+        Yields:
+            tuple: ('YYYY-MM-DD HH:MM:SS', 'event' | 'keyword', 이름, 개수)
+        """
+        for start in sorted(self.buckets):
+            counts = self.buckets[start]
+            for (kind, name) in sorted(counts):
+                yield format_timestamp(start), kind, name, counts[kind, name]
+    
+    def to_dict(self):
+        """
+        집계 결과를 JSON으로 저장할 수 있는 사전으로 돌려준다.
+        
+        Returns:
+            dict: 요약 통계와 시간 구간별 개수
+        """
+        def occurrence(found):
+            return {'timestamp': format_timestamp(found[0]), 'message': found[1]}
+        
+        buckets = {}
+        for start, kind, name, count in self.rows():
+            buckets.setdefault(start, {'event': {}, 'keyword': {}})[kind][name] = count
+        return {
+            'bucket_seconds': self.bucket_seconds,
+            'line_count': self.line_count,
+            'event_counts': dict(self.event_counts.most_common()),
+            'keyword_counts': dict(self.keyword_counts.most_common()),
+            'problems': {
+                keyword: {
+                    'count': self.keyword_counts[keyword],
+                    'severity': self.matcher.severity[keyword],
+                    'first': occurrence(self.first_seen[keyword]),
+                    'last': occurrence(self.last_seen[keyword])
+                }
+                for keyword in self.first_seen
+            },
+            'buckets': buckets
+        }
+    
+    def export(self, file_path):
+        """
+        집계 결과를 파일 확장자에 맞춰 JSON 또는 CSV로 저장한다.
+        
+        CSV에는 시간 구간별 개수만, JSON에는 요약 통계까지 모두 저장한다.
+        
+        Args:
+            file_path (str): 저장할 파일 경로 (.json 또는 .csv)
+            
+        Returns:
+            bool: 저장 성공 시 True, 그렇지 않으면 False
+        """
+        try:
+            if file_path.lower().endswith('.json'):
+                with open(file_path, 'w', encoding='utf-8') as file:
+                    json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+            else:
+                with open(file_path, 'w', newline='', encoding='utf-8') as file:
+                    writer = csv.writer(file)
+                    writer.writerow(['bucket_start', 'kind', 'name', 'count'])
+                    writer.writerows(self.rows())
+            return True
+        except Exception as e:
+            print(f'오류: 집계 결과를 {file_path}에 저장하는 중 오류가 발생했습니다. {e}')
+            return False
+
+def main(argv=None):
+    """
+    메인 함수
+    
+    Args:
+        argv (list): 명령행 인자 (기본값 sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description='화성 기지 미션 컴퓨터 로그 분석기')
+    parser.add_argument('--log', default='mission_computer_main.log', help='분석할 로그 파일')
+    parser.add_argument('--output', default='problematic_logs.log', help='문제 로그를 저장할 파일')
+    parser.add_argument('--incremental', action='store_true',
+                        help='지난 실행 이후 추가된 부분만 검사해서 문제 로그에 덧붙임')
+    parser.add_argument('--follow', action='store_true',
+                        help='로그 파일을 계속 감시하면서 새 문제 로그를 덧붙임')
+    parser.add_argument('--interval', type=float, default=1.0, help='--follow 확인 주기(초)')
+    parser.add_argument('--workers', type=int,
+                        help='문제 로그 검사를 여러 프로세스로 병렬 실행 (작업 프로세스 수)')
+    parser.add_argument('--rotated', action='store_true',
+                        help='로테이션·압축된 로그 묶음(.1, .2.gz, .3.bz2, .4.xz ...) 전체를 검사')
+    parser.add_argument('--merge', nargs='+', metavar='LOG',
+                        help='시간순으로 쌓인 여러 로그를 timestamp 순으로 병합 (--merge-output에 저장)')
+    parser.add_argument('--merge-output', default='merged_logs.log', help='--merge 결과 파일')
+    parser.add_argument('--reverse', action='store_true', help='--merge를 최신 라인부터 병합')
+    parser.add_argument('--aggregate', metavar='PATH',
+                        help='이벤트·키워드 통계를 한 번에 집계해서 저장 (.json 또는 .csv)')
+    parser.add_argument('--bucket', type=int, default=60, help='--aggregate 시간 구간 크기(초)')
+    parser.add_argument('--since', help='이 시각 이후 로그만 출력 (YYYY-MM-DD HH:MM:SS, --until과 함께 사용)')
+    parser.add_argument('--until', help='이 시각까지의 로그만 출력 (YYYY-MM-DD HH:MM:SS, --since와 함께 사용)')
+    args = parser.parse_args(argv)
+    
+    log_file_path = args.log
+    problem_log_file = args.output
+    
+    if args.merge:
+        save_merged_logs(args.merge, args.merge_output, args.reverse)
+        return
+    if args.aggregate:
+        lines = iter_log_set(log_file_path) if args.rotated else iter_log_file(log_file_path)
+        aggregator = LogAggregator(args.bucket).consume(lines)
+        if aggregator.export(args.aggregate):
+            print(f'라인 {aggregator.line_count}개의 집계 결과가 {args.aggregate}에 저장되었습니다.')
+        return
+    if args.rotated:
+        scan_rotated_logs(log_file_path, problem_log_file, args.workers)
+        return
+    if args.since or args.until:
+        if not (args.since and args.until):
+            parser.error('--since와 --until은 함께 지정해야 합니다.')
+        try:
+            print_log_content(query_time_window(log_file_path, args.since, args.until))
+        except (OSError, ValueError) as e:
+            print(f'오류: 시간 구간 조회 중 오류가 발생했습니다. {e}')
+        return
+    if args.follow:
+        follow_log(log_file_path, problem_log_file, args.interval)
+        return
+    if args.incremental:
+        count = process_log_incrementally(log_file_path, problem_log_file)
+        print(f'새 문제 로그 {count}건이 {problem_log_file}에 추가되었습니다.')
+        return
+    
+    # 원본 로그 내용 출력 (파일을 한 줄씩 읽으면서 바로 출력)
+    print('원본 로그 내용:')
+    print_log_content(iter_log_file(log_file_path))
+    
+    # 시간 역순으로 정렬된 로그 출력 (큰 로그도 외부 정렬로 메모리 사용량 고정)
+    print('\n시간 역순으로 정렬된 로그 내용:')
+    print_log_content(iter_logs_by_time_reversed(iter_log_file(log_file_path)))
+    
+    # 문제가 되는 로그만 파일로 저장 (디코딩 없이 bytes로 필터링)
+    if args.workers:
+        scan_log_parallel(log_file_path, problem_log_file, args.workers)
+    else:
+        save_problematic_logs(iter_log_file(log_file_path, binary=True), problem_log_file)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""
+화성 기지 인벤토리 관리자 벤치마크
+
+Mars_Base_Inventory_List.csv의 행을 바탕으로 원하는 크기의 합성 인벤토리를
+만들고, 이진 파일 읽기 방식별로 걸린 시간을 비교합니다.
+"""
+
+import argparse
+import contextlib
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from mian import (
+    read_csv_file, sort_by_flammability, filter_dangerous_items, write_csv_file,
+    write_binary_file, read_binary_file, decode_binary_file, convert_csv_to_binary,
+    write_inventory_file, read_inventory_file, infer_inventory_columns,
+    top_dangerous_items, iter_csv_file, iter_binary_file, INVENTORY_COLUMNS, Inventory,
+    FlammabilityIndex, InventoryDeltaLog, read_csv_file_cached, render_inventory,
+    INVENTORY_COLUMN_WIDTHS, write_compressed_binary_file, read_compressed_binary_file,
+    CompressedInventoryFile, merge_binary_files, InventoryQuery, filter_inventory
+)
+
+DEFAULT_SIZES = [100000, 1000000]
+# getrusage()의 ru_maxrss는 리눅스에서 KiB, macOS에서 바이트로 나옵니다
+RU_MAXRSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+BENCHES = ['binary', 'columnar', 'index', 'convert', 'typed', 'topk', 'delta', 'cache', 'render', 'compressed', 'merge', 'query']
+
+
+def generate_inventory(count, seed=None, source_file='Mars_Base_Inventory_List.csv'):
+    """
+    합성 인벤토리를 만듭니다.
+
+    원본 CSV의 행을 무작위로 골라 물질 이름 뒤에 번호를 붙이고,
+    인화성은 0~1 사이에서 소수 둘째 자리까지 무작위로 정합니다.
+
+    Args:
+        count (int): 만들 항목 수
+        seed (int): 난수 시드
+        source_file (str): 바탕이 되는 인벤토리 CSV 경로
+
+    Returns:
+        list: 인벤토리 데이터를 포함하는 딕셔너리 리스트
+    """
+    rng = random.Random(seed)
+    source = read_csv_file(source_file)
+    inventory = []
+    for index in range(count):
+        item = dict(rng.choice(source))
+        item['Substance'] = f'{item["Substance"]} #{index}'
+        item['Flammability'] = round(rng.random(), 2)
+        inventory.append(item)
+    return inventory
+
+
+def time_it(func, repeat=3):
+    """
+    함수를 여러 번 실행해서 가장 짧은 실행 시간(초)을 돌려줍니다.
+
+    timeit처럼 측정하는 동안 순환 GC를 끕니다. 100만 개 단위로 객체를 만들면
+    GC가 여러 번 전체 힙을 훑어서 측정값이 몇 배씩 흔들리기 때문입니다.
+
+    Args:
+        func (callable): 인자 없이 호출할 함수
+        repeat (int): 반복 횟수
+
+    Returns:
+        float: 가장 짧은 실행 시간(초)
+    """
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def bench_binary_readers(file_path, repeat=3):
+    """
+    read_binary_file과 decode_binary_file(지연 뷰)을 비교합니다.
+
+    지연 뷰는 레코드 위치만 찾는 경우, 인화성만 읽는 경우(정렬·필터),
+    모든 열을 읽는 경우(BinaryRecord.to_dict)로 나눠서 잽니다.
+
+    Args:
+        file_path (str): write_binary_file로 쓴 이진 파일 경로
+        repeat (int): 반복 횟수
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    def decode_all():
+        return [record.to_dict() for record in decode_binary_file(file_path)]
+
+    def decode_flammability():
+        return [record['Flammability'] for record in decode_binary_file(file_path)]
+
+    assert read_binary_file(file_path) == [dict(record) for record in decode_binary_file(file_path)]
+    return {
+        'read_binary_file': time_it(lambda: read_binary_file(file_path), repeat),
+        'decode_binary_file (위치만)': time_it(lambda: decode_binary_file(file_path), repeat),
+        'decode_binary_file + 인화성': time_it(decode_flammability, repeat),
+        'decode_binary_file + 모든 열': time_it(decode_all, repeat)
+    }
+
+
+def bench_columnar(inventory, repeat=3):
+    """
+    딕셔너리 리스트와 Inventory(열 단위)의 정렬·필터 시간을 비교합니다.
+
+    Args:
+        inventory (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        repeat (int): 반복 횟수
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    columnar = Inventory.from_records(inventory)
+    assert list(sort_by_flammability(columnar)) == sort_by_flammability(inventory)
+    return {
+        '딕셔너리 리스트 정렬': time_it(lambda: sort_by_flammability(inventory), repeat),
+        '딕셔너리 리스트 필터': time_it(lambda: filter_dangerous_items(inventory), repeat),
+        f'Inventory({columnar.backend}) 정렬': time_it(lambda: sort_by_flammability(columnar), repeat),
+        f'Inventory({columnar.backend}) 필터': time_it(lambda: filter_dangerous_items(columnar), repeat)
+    }
+
+
+def bench_flammability_index(inventory, thresholds=20, repeat=3):
+    """
+    여러 임계값으로 filter_dangerous_items를 부를 때, 매번 훑는 경우와
+    FlammabilityIndex를 쓰는 경우를 비교합니다.
+
+    Args:
+        inventory (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        thresholds (int): 0.9~0.99 사이에서 고를 임계값 수
+        repeat (int): 반복 횟수
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    values = [0.9 + 0.09 * step / thresholds for step in range(thresholds)]
+    index = FlammabilityIndex(inventory)
+    assert filter_dangerous_items(inventory, 0.9, index=index) == filter_dangerous_items(inventory, 0.9)
+    return {
+        f'임계값 {thresholds}개 전체 훑기': time_it(
+            lambda: [filter_dangerous_items(inventory, value) for value in values], repeat),
+        '색인 만들기': time_it(lambda: FlammabilityIndex(inventory), repeat),
+        f'임계값 {thresholds}개 색인 질의': time_it(
+            lambda: [filter_dangerous_items(inventory, value, index=index) for value in values], repeat),
+        f'임계값 {thresholds}개 개수만': time_it(
+            lambda: [index.count_at_least(value) for value in values], repeat)
+    }
+
+
+def _peak_rss():
+    """ru_maxrss를 바이트로 환산해 돌려줍니다 (윈도우처럼 resource가 없으면 None)."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RU_MAXRSS_UNIT
+
+
+def _convert_in_memory(csv_path, binary_path):
+    """기존 방식: 전체를 읽고 정렬한 뒤 한 번에 씁니다."""
+    return write_binary_file(sort_by_flammability(read_csv_file(csv_path)), binary_path)
+
+
+def _run_conversion(method, csv_path, binary_path, workers):
+    """
+    새 작업 프로세스 안에서 변환 하나를 실행하고 시간과 늘어난 최대 RSS를 잽니다.
+
+    Returns:
+        tuple: (초, 바이트 또는 None)
+    """
+    baseline = _peak_rss()
+    start = time.perf_counter()
+    if method == 'stream':
+        convert_csv_to_binary(csv_path, binary_path, workers=workers)
+    else:
+        _convert_in_memory(csv_path, binary_path)
+    seconds = time.perf_counter() - start
+    peak = _peak_rss()
+    return seconds, None if peak is None else peak - baseline
+
+
+def bench_conversion(inventory, work_dir, workers=(1, 2)):
+    """
+    CSV -> 정렬된 이진 파일 변환을 기존 방식과 convert_csv_to_binary로 비교합니다.
+
+    변환마다 새 프로세스에서 실행해 최대 RSS가 앞 측정의 영향을 받지 않게
+    합니다. convert_csv_to_binary의 메모리에는 하위 작업 프로세스가
+    포함되지 않습니다 (workers=1이면 현재 프로세스에서 실행).
+
+    Args:
+        inventory (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        work_dir (str): CSV와 결과 파일을 만들 디렉터리
+        workers (tuple): 측정할 작업 프로세스 수
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    csv_path = os.path.join(work_dir, 'inventory.csv')
+    write_csv_file(inventory, csv_path)
+    cases = [('기존 (읽기·정렬·쓰기)', 'memory', None)]
+    cases += [(f'convert_csv_to_binary x{count}', 'stream', count) for count in workers]
+
+    results = {}
+    for name, method, count in cases:
+        binary_path = os.path.join(work_dir, f'{method}{count or ""}.bin')
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            seconds, peak = executor.submit(
+                _run_conversion, method, csv_path, binary_path, count
+            ).result()
+        memory = '' if peak is None else f', 최대 RSS +{peak / 2 ** 20:.0f}MB'
+        results[f'{name}{memory}'] = seconds
+    return results
+
+
+def bench_typed_columns(inventory, work_dir):
+    """
+    무게·비중·강도를 문자열로 저장할 때와 숫자·열거형으로 저장할 때의
+    파일 크기와 쓰기·읽기 시간을 기존 write_binary_file 형식과 비교합니다.
+
+    Args:
+        inventory (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        work_dir (str): 결과 파일을 만들 디렉터리
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    typed_columns = infer_inventory_columns(inventory)
+    cases = [
+        ('write_binary_file', lambda path: write_binary_file(inventory, path), read_binary_file),
+        ('MINV 문자열 열', lambda path: write_inventory_file(inventory, path, INVENTORY_COLUMNS),
+         read_inventory_file),
+        ('MINV 숫자·열거형 열', lambda path: write_inventory_file(inventory, path, typed_columns),
+         read_inventory_file),
+        ('MINV 숫자·열거형 열, 색인 제외',
+         lambda path: write_inventory_file(inventory, path, typed_columns, name_index=False,
+                                           flammability_index=False),
+         read_inventory_file)
+    ]
+    results = {}
+    legacy_size = None
+    for number, (name, write, read) in enumerate(cases):
+        path = os.path.join(work_dir, f'typed{number}.bin')
+        write_seconds = time_it(lambda: write(path), 1)
+        size = os.path.getsize(path)
+        legacy_size = legacy_size or size
+        results[f'{name} 쓰기 ({size / 2 ** 20:.1f}MB, 기존 형식의 {size / legacy_size:.2f}배)'] = write_seconds
+        results[f'{name} 읽기'] = time_it(lambda: read(path), 1)
+    return results
+
+
+def bench_top_k(inventory, work_dir, count=20, repeat=3):
+    """
+    상위 count개를 구할 때 전체 정렬 후 자르기와 top_dangerous_items를 비교합니다.
+
+    Args:
+        inventory (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        work_dir (str): 스트리밍 측정용 CSV를 만들 디렉터리
+        count (int): 구할 항목 수
+        repeat (int): 반복 횟수
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    csv_path = os.path.join(work_dir, 'top_k.csv')
+    write_csv_file(inventory, csv_path)
+    assert top_dangerous_items(inventory, count) == sort_by_flammability(inventory)[:count]
+    return {
+        '정렬 후 자르기': time_it(lambda: sort_by_flammability(inventory)[:count], repeat),
+        'top_dangerous_items': time_it(lambda: top_dangerous_items(inventory, count), repeat),
+        'read_csv_file + 정렬 후 자르기': time_it(
+            lambda: sort_by_flammability(read_csv_file(csv_path))[:count], repeat),
+        'iter_csv_file + top_dangerous_items': time_it(
+            lambda: top_dangerous_items(iter_csv_file(csv_path), count), repeat)
+    }
+
+
+def bench_delta_log(inventory, work_dir, changes=100):
+    """
+    항목 하나를 고칠 때 파일 전체를 다시 쓰는 경우와 InventoryDeltaLog에
+    덧붙이는 경우, 그리고 변경을 합쳐 읽기·합치기(compact) 시간을 비교합니다.
+
+    Args:
+        inventory (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        work_dir (str): 이진 파일을 만들 디렉터리
+        changes (int): 덧붙일 변경 수
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    binary_path = os.path.join(work_dir, 'delta_base.bin')
+    write_binary_file(sort_by_flammability(inventory), binary_path)
+    log = InventoryDeltaLog(binary_path)
+    changed = [dict(item, Flammability=0.5) for item in inventory[:changes]]
+
+    def rewrite_one():
+        items = read_binary_file(binary_path)
+        items[0] = dict(items[0], Flammability=0.5)
+        write_binary_file(sort_by_flammability(items), binary_path)
+
+    def append_all():
+        for item in changed:
+            log.update(item)
+
+    results = {
+        '변경 1개: 전체 다시 쓰기': time_it(rewrite_one, 1),
+        f'변경 {changes}개: 변경 로그에 덧붙이기': time_it(append_all, 1),
+        '기본 파일만 읽기': time_it(lambda: sum(1 for _ in iter_binary_file(binary_path)), 1),
+        '변경을 합쳐 읽기': time_it(lambda: sum(1 for _ in log), 1),
+        'compact': time_it(log.compact, 1)
+    }
+    return results
+
+
+def bench_csv_cache(inventory, work_dir):
+    """
+    read_csv_file와 read_csv_file_cached의 첫 읽기(캐시 만들기)와 이후 읽기를 비교합니다.
+
+    Args:
+        inventory (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        work_dir (str): CSV와 캐시 파일을 만들 디렉터리
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    csv_path = os.path.join(work_dir, 'cached.csv')
+    write_csv_file(inventory, csv_path)
+    cache_path = csv_path + '.cache'
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+
+    results = {'read_csv_file': time_it(lambda: read_csv_file(csv_path), 1)}
+    for label in ('캐시 없음 (cold)', '캐시 있음 (warm)', '캐시 있음 + 해시 확인'):
+        stats = {}
+        verify = label.endswith('해시 확인')
+        results[label] = time_it(
+            lambda: read_csv_file_cached(csv_path, verify=verify, stats=stats), 1)
+    assert read_csv_file_cached(csv_path) == read_csv_file(csv_path)
+    return results
+
+
+def legacy_print_inventory(inventory_list):
+    """비교용: 행마다 제너레이터 join과 print를 쓰던 예전 print_inventory"""
+    col_widths = INVENTORY_COLUMN_WIDTHS
+    separator = '+'.join('-' * (col_widths[name] + 2) for name in col_widths.keys())
+    print(separator)
+    print('|'.join(f' {name:<{col_widths[name]}} ' for name in col_widths.keys()))
+    print(separator)
+    for item in inventory_list:
+        row = '|'.join(
+            f' {str(item[name]):<{col_widths[name]}} '
+            for name in col_widths.keys()
+        )
+        print(row)
+    print(separator)
+    print(f'총 항목 수: {len(inventory_list)}')
+
+
+def bench_render(inventory, repeat=3):
+    """
+    표 출력을 예전 print_inventory와 render_inventory로 비교합니다 (os.devnull에 씀).
+
+    Args:
+        inventory (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        repeat (int): 반복 횟수
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        def legacy():
+            with contextlib.redirect_stdout(devnull):
+                legacy_print_inventory(inventory)
+
+        return {
+            '예전 print_inventory': time_it(legacy, repeat),
+            'render_inventory': time_it(lambda: render_inventory(inventory, devnull), repeat),
+            'render_inventory (너비 측정)': time_it(
+                lambda: render_inventory(inventory, devnull, widths='auto'), repeat),
+            'render_inventory (head/tail 20)': time_it(
+                lambda: render_inventory(inventory, devnull, head=20, tail=20), repeat)
+        }
+
+
+def bench_compressed(inventory, work_dir, lookups=100):
+    """
+    write_binary_file 출력과 블록 압축 파일(zlib, lzma)의 크기, 쓰기·읽기 시간,
+    이름 하나 찾기 시간을 비교합니다.
+
+    Args:
+        inventory (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        work_dir (str): 결과 파일을 만들 디렉터리
+        lookups (int): 찾아볼 이름 수
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    names = random.Random(lookups).sample([item['Substance'] for item in inventory],
+                                          min(lookups, len(inventory)))
+    raw_path = os.path.join(work_dir, 'uncompressed.bin')
+    write_seconds = time_it(lambda: write_binary_file(inventory, raw_path), 1)
+    size = os.path.getsize(raw_path) / 2 ** 20
+    results = {
+        f'write_binary_file 쓰기 ({size:.1f}MB)': write_seconds,
+        'read_binary_file 읽기': time_it(lambda: read_binary_file(raw_path), 1)
+    }
+
+    def scan_lookup():
+        for name in names[:10]:
+            next(item for item in iter_binary_file(raw_path) if item['Substance'] == name)
+
+    results['기존 형식 이름 찾기 x10 (순차 탐색)'] = time_it(scan_lookup, 1)
+
+    for codec in ('zlib', 'lzma'):
+        path = os.path.join(work_dir, f'compressed.{codec}')
+        write_seconds = time_it(lambda: write_compressed_binary_file(inventory, path, codec=codec), 1)
+        size = os.path.getsize(path) / 2 ** 20
+        results[f'{codec} 블록 쓰기 ({size:.1f}MB)'] = write_seconds
+        results[f'{codec} 블록 읽기'] = time_it(lambda: read_compressed_binary_file(path), 1)
+
+        def lookup():
+            with CompressedInventoryFile(path) as compressed:
+                for name in names:
+                    compressed.find(name)
+
+        results[f'{codec} 이름 찾기 x{len(names)}'] = time_it(lookup, 1)
+    return results
+
+
+def _run_merge(method, input_paths, output_path):
+    """
+    새 작업 프로세스 안에서 병합 하나를 실행하고 시간과 늘어난 최대 RSS를 잽니다.
+
+    Returns:
+        tuple: (초, 바이트 또는 None)
+    """
+    baseline = _peak_rss()
+    start = time.perf_counter()
+    if method == 'stream':
+        merge_binary_files(input_paths, output_path)
+    else:
+        inventory = []
+        for path in input_paths:
+            inventory.extend(read_binary_file(path))
+        write_binary_file(sort_by_flammability(inventory), output_path)
+    seconds = time.perf_counter() - start
+    peak = _peak_rss()
+    return seconds, None if peak is None else peak - baseline
+
+
+def bench_merge(inventory, work_dir, parts=8):
+    """
+    인화성 순으로 정렬된 파일 parts개를 하나로 합칠 때, 모두 읽어 다시
+    정렬하는 방식과 merge_binary_files(k-way 병합)를 비교합니다.
+
+    Args:
+        inventory (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        work_dir (str): 입력·결과 파일을 만들 디렉터리
+        parts (int): 나눌 파일 수
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    input_paths = []
+    for part in range(parts):
+        path = os.path.join(work_dir, f'module{part}.bin')
+        write_binary_file(sort_by_flammability(inventory[part::parts]), path)
+        input_paths.append(path)
+
+    results = {}
+    for name, method in (('기존 (모두 읽기·정렬·쓰기)', 'memory'), ('merge_binary_files', 'stream')):
+        output_path = os.path.join(work_dir, f'merged_{method}.bin')
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            seconds, peak = executor.submit(_run_merge, method, input_paths, output_path).result()
+        memory = '' if peak is None else f', 최대 RSS +{peak / 2 ** 20:.0f}MB'
+        results[f'{name}{memory}'] = seconds
+    return results
+
+
+BENCH_QUERY = "Flammability >= 0.7 and Strength == 'Weak'"
+
+
+def bench_query(inventory, repeat=3):
+    """
+    손으로 쓴 필터 루프와 filter_inventory(컴파일한 쿼리)를 비교합니다.
+
+    Args:
+        inventory (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        repeat (int): 반복 횟수
+
+    Returns:
+        dict: {측정 이름: 초}
+    """
+    def by_hand():
+        return [item for item in inventory
+                if item['Flammability'] >= 0.7 and item['Strength'] == 'Weak']
+
+    columnar = Inventory.from_records(inventory)
+    assert filter_inventory(inventory, BENCH_QUERY) == by_hand()
+    assert list(filter_inventory(columnar, BENCH_QUERY)) == by_hand()
+    return {
+        '손으로 쓴 루프': time_it(by_hand, repeat),
+        'filter_inventory (캐시된 쿼리)': time_it(lambda: filter_inventory(inventory, BENCH_QUERY), repeat),
+        '매번 파싱·컴파일': time_it(lambda: InventoryQuery(BENCH_QUERY).filter(inventory), repeat),
+        f'Inventory({columnar.backend}) 마스크': time_it(
+            lambda: filter_inventory(columnar, BENCH_QUERY), repeat)
+    }
+
+
+def print_results(title, results):
+    """측정 결과를 첫 항목 대비 배수와 함께 출력합니다."""
+    print(f'\n=== {title} ===')
+    baseline = next(iter(results.values()))
+    for name, elapsed in results.items():
+        print(f'  {name:<42} {elapsed:8.3f}s  ({baseline / elapsed:.2f}배)')
+
+
+def main():
+    """크기별 합성 인벤토리로 벤치마크를 실행합니다."""
+    parser = argparse.ArgumentParser(description='화성 기지 인벤토리 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='측정할 항목 수 (기본값 100000 1000000)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--benches', nargs='+', choices=BENCHES, default=BENCHES,
+                        help='실행할 벤치마크 (기본값 전부)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in args.sizes:
+            inventory = generate_inventory(size, seed=size)
+            if 'binary' in args.benches:
+                binary_file = os.path.join(temp_dir, f'inventory_{size}.bin')
+                write_binary_file(inventory, binary_file)
+                print_results(f'이진 파일 읽기 ({size:,} 항목)', bench_binary_readers(binary_file, args.repeat))
+            if 'columnar' in args.benches:
+                print_results(f'정렬·필터 ({size:,} 항목)', bench_columnar(inventory, args.repeat))
+            if 'index' in args.benches:
+                print_results(f'인화성 색인 ({size:,} 항목)', bench_flammability_index(inventory, repeat=args.repeat))
+            if 'convert' in args.benches:
+                print_results(f'CSV -> 이진 변환 ({size:,} 항목)', bench_conversion(inventory, temp_dir))
+            if 'typed' in args.benches:
+                print_results(f'숫자·열거형 열 ({size:,} 항목)', bench_typed_columns(inventory, temp_dir))
+            if 'topk' in args.benches:
+                print_results(f'인화성 상위 20개 ({size:,} 항목)', bench_top_k(inventory, temp_dir, repeat=args.repeat))
+            if 'delta' in args.benches:
+                print_results(f'변경 로그 ({size:,} 항목)', bench_delta_log(inventory, temp_dir))
+            if 'cache' in args.benches:
+                print_results(f'CSV 캐시 ({size:,} 항목)', bench_csv_cache(inventory, temp_dir))
+            if 'render' in args.benches:
+                print_results(f'표 출력 ({size:,} 항목)', bench_render(inventory, args.repeat))
+            if 'compressed' in args.benches:
+                print_results(f'블록 압축 ({size:,} 항목)', bench_compressed(inventory, temp_dir))
+            if 'merge' in args.benches:
+                print_results(f'정렬된 파일 8개 병합 ({size:,} 항목)', bench_merge(inventory, temp_dir))
+            if 'query' in args.benches:
+                print_results(f'쿼리 필터 ({size:,} 항목)', bench_query(inventory, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
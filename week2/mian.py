@@ -6,9 +6,223 @@
 위험 물질을 식별하고 결과를 내보냅니다.
 """
 
+import argparse
 import csv
+import functools
+import hashlib
+import heapq
+import io
+import lzma
+import marshal
+import mmap
+import operator
 import os
+import re
 import struct
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, compress, islice, repeat
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 array 모듈 백엔드만 사용
+    np = None
+
+# 고정 레이아웃 이진 인벤토리 형식 (write_inventory_file / InventoryFile)
+INVENTORY_MAGIC = b'MINV'
+INVENTORY_VERSION = 3
+INVENTORY_COLUMNS = [
+    ('Substance', 't'),
+    ('Weight (g/cm³)', 't'),
+    ('Specific Gravity', 't'),
+    ('Strength', 't'),
+    ('Flammability', 'd')
+]
+# 측정값 열을 숫자·열거형으로 저장하는 형식 (f: float32, 'Various'는 NaN / e: u8 코드)
+TYPED_INVENTORY_COLUMNS = [
+    ('Substance', 't'),
+    ('Weight (g/cm³)', 'f'),
+    ('Specific Gravity', 'f'),
+    ('Strength', 'e'),
+    ('Flammability', 'd')
+]
+# 값이 여러 가지라 숫자 대신 적어 둔 측정값, 숫자 열에서는 NaN으로 저장
+VARIOUS = 'Various'
+MEASUREMENT_FIELDS = ('Weight (g/cm³)', 'Specific Gravity')
+# 열거형 열의 기본 코드 순서 (파일에는 실제 쓰인 값의 사전을 함께 저장)
+STRENGTH_LEVELS = ('Various', 'Very weak', 'Weak', 'Very low', 'Low', 'High', 'Very high')
+ENUM_LEVELS = {'Strength': STRENGTH_LEVELS}
+
+# write_binary_file(기존 형식)의 필드 순서와 미리 컴파일한 struct
+LEGACY_STRING_FIELDS = ['Substance', 'Weight (g/cm³)', 'Specific Gravity', 'Strength']
+_LEGACY_FIELD_INDEX = {field: index for index, field in enumerate(LEGACY_STRING_FIELDS)}
+_U32 = struct.Struct('I')
+_F32 = struct.Struct('f')
+# 스트리밍 변환기의 런 파일 항목 머리 (float64 인화성, 레코드 길이)
+_RUN_ENTRY = struct.Struct('dI')
+# print_inventory의 기본 열 너비
+INVENTORY_COLUMN_WIDTHS = {
+    'Substance': 25,
+    'Weight (g/cm³)': 15,
+    'Specific Gravity': 18,
+    'Strength': 15,
+    'Flammability': 12
+}
+# render_inventory가 한 번에 모아서 쓰는 행 수
+RENDER_BLOCK_ROWS = 10000
+
+# read_csv_file_cached의 이진 캐시 파일
+# (매직, marshal 버전, CSV 크기, CSV mtime_ns, 내용 해시, 경로 길이) 다음에 경로와 marshal 내용
+CSV_CACHE_SUFFIX = '.cache'
+CSV_CACHE_MAGIC = b'MCSC'
+_CSV_CACHE_HEADER = struct.Struct('<4sHQq16sH')
+
+# 이진 인벤토리 옆에 쌓는 변경 로그 (InventoryDeltaLog)
+DELTA_SUFFIX = '.delta'
+DELTA_MAGIC = b'MDLT'
+# 변경 로그 항목 머리 (작업 코드 I/U/D, 내용 길이)
+_DELTA_ENTRY = struct.Struct('<cI')
+# 블록 압축 이진 인벤토리 (write_compressed_binary_file)
+# (매직, 버전, 코덱, 플래그, 블록당 레코드 수, 레코드 수, 블록 색인 위치, 블록 수)
+BLOCK_MAGIC = b'MBLK'
+BLOCK_VERSION = 1
+BLOCK_CODECS = {'zlib': 1, 'lzma': 2}
+BLOCK_SORTED_BY_NAME = 0x1
+COMPRESSED_BLOCK_RECORDS = 1024
+_BLOCK_HEADER = struct.Struct('<4sHBBIQQI')
+# 블록 색인 항목 (위치, 압축 길이, 레코드 수, CRC32, 최소·최대 이름 길이) 다음에 두 이름
+_BLOCK_ENTRY = struct.Struct('<QIIIHH')
+# 스트리밍 변환기에서 작업 하나가 맡는 CSV 바이트 범위 크기
+CONVERT_CHUNK_SIZE = 8 * 1024 * 1024
+
+# 열 형식 코드별 고정 폭 struct 형식
+# (t: 문자열 힙의 u32 위치·길이, d: float64, f: float32 측정값, e: 열거형 코드,
+#  s: u64 위치의 문자열, n: float64 측정값 - s와 n은 버전 1·2 파일과 호환용)
+COLUMN_FORMATS = {'s': 'QI', 't': 'II', 'd': 'd', 'n': 'd', 'f': 'f', 'e': 'B'}
+# 열 형식 코드를 처음 지원한 파일 버전 (파일은 쓰인 코드 중 가장 높은 버전으로 씀)
+COLUMN_VERSIONS = {'s': 1, 'd': 1, 'n': 2, 'e': 2, 't': 3, 'f': 3}
+_STRING_CODES = ('s', 't')
+_MEASUREMENT_CODES = ('n', 'f')
+
+# 열 단위 인벤토리(Inventory)에서 숫자로 저장하는 열과 마스크 비교 연산자
+NUMERIC_FIELDS = ('Flammability',)
+MASK_OPERATORS = {
+    '>=': operator.ge,
+    '>': operator.gt,
+    '<=': operator.le,
+    '<': operator.lt,
+    '==': operator.eq,
+    '!=': operator.ne
+}
+
+# 인벤토리 쿼리 (compile_query)의 토큰, 키워드와 텍스트별 컴파일 캐시 크기
+QUERY_TOKEN = re.compile(r'''
+    (?P<space>\s+)
+  | (?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+  | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<field>`[^`]+`)
+  | (?P<op>>=|<=|==|!=|>|<)
+  | (?P<open>\()
+  | (?P<close>\))
+  | (?P<name>[^\W\d]\w*)
+''', re.VERBOSE)
+QUERY_KEYWORDS = ('and', 'or', 'not')
+QUERY_CACHE_SIZE = 256
+
+
+def parse_measurement(text, single=False):
+    """
+    측정값 텍스트를 float로 바꿉니다 ('Various'는 NaN).
+    
+    CSV 텍스트로 그대로 되돌릴 수 있는 값만 받습니다. 예를 들어 '2.50'은
+    float로 바꾸면 '2.5'가 되므로 ValueError를 냅니다.
+    
+    Args:
+        text (str): 측정값 텍스트
+        single (bool): True이면 float32로 저장해도 되돌릴 수 있는지까지 확인하고
+            float32로 반올림한 값을 돌려줍니다.
+        
+    Returns:
+        float: 측정값 (VARIOUS이면 NaN)
+    
+    Raises:
+        ValueError: 숫자가 아니거나 같은 텍스트로 되돌릴 수 없는 경우
+    """
+    if text == VARIOUS:
+        return float('nan')
+    value = float(text)
+    if single:
+        try:
+            value = _F32.unpack(_F32.pack(value))[0]
+        except OverflowError:
+            raise ValueError(f'float32 범위를 벗어난 측정값입니다: {text!r}') from None
+    if value != value or format_measurement(value, single) != text:
+        raise ValueError(f'텍스트로 되돌릴 수 없는 측정값입니다: {text!r}')
+    return value
+
+
+def format_measurement(value, single=False):
+    """
+    parse_measurement로 바꾼 값을 원래 CSV 텍스트로 되돌립니다.
+    
+    Args:
+        value (float): 측정값 (NaN이면 VARIOUS)
+        single (bool): True이면 value를 float32로 보고, 같은 float32가 되는
+            가장 짧은 표기로 되돌립니다.
+        
+    Returns:
+        str: 측정값 텍스트
+    """
+    if value != value:
+        return VARIOUS
+    if single:
+        for digits in range(1, 10):
+            text = f'{value:.{digits}g}'
+            if _F32.unpack(_F32.pack(float(text)))[0] == value:
+                return repr(float(text))
+    return repr(value)
+
+
+def infer_inventory_columns(data):
+    """
+    데이터가 텍스트 그대로 되돌아오는 범위에서 가장 작은 열 형식을 고릅니다.
+    
+    측정값 열(MEASUREMENT_FIELDS)은 모든 값이 float32로 되돌아오면 'f',
+    float64로만 되돌아오면 'n', 열거형 열(ENUM_LEVELS)은 값 종류가 256가지
+    이하이면 'e'로 하고, 그렇지 않은 열은 INVENTORY_COLUMNS처럼 문자열('t')로 둡니다.
+    
+    Args:
+        data (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        
+    Returns:
+        list: write_inventory_file에 넘길 (열 이름, 형식 코드) 리스트
+    """
+    columns = []
+    for (name, code), (_, typed_code) in zip(INVENTORY_COLUMNS, TYPED_INVENTORY_COLUMNS):
+        if typed_code in _MEASUREMENT_CODES:
+            for candidate in ('f', 'n'):
+                try:
+                    for item in data:
+                        parse_measurement(str(item[name]), candidate == 'f')
+                except ValueError:
+                    continue
+                code = candidate
+                break
+        elif typed_code == 'e':
+            levels = set(ENUM_LEVELS.get(name, ()))
+            levels.update(str(item[name]) for item in data)
+            if len(levels) <= 256:
+                code = typed_code
+        columns.append((name, code))
+    return columns
 
 
 def read_csv_file(file_path):
@@ -43,6 +257,133 @@ def read_csv_file(file_path):
         return []
 
 
+def _file_digest(file_path):
+    """파일 내용의 BLAKE2b 해시(16바이트)를 구합니다."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def _write_csv_cache(cache_path, file_path, stat, digest, payload):
+    """캐시 파일을 임시 파일에 쓴 뒤 바꿔 넣습니다 (실패해도 읽기에는 영향 없음)."""
+    path = os.path.abspath(file_path).encode('utf-8')
+    temp_path = cache_path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as file:
+            file.write(_CSV_CACHE_HEADER.pack(
+                CSV_CACHE_MAGIC, marshal.version, stat.st_size, stat.st_mtime_ns, digest, len(path)
+            ))
+            file.write(path)
+            file.write(payload)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # 캐시는 있으면 빠를 뿐이므로 읽기 전용 디렉터리 등에서는 조용히 건너뛴다
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def read_csv_file_cached(file_path, cache_path=None, verify=False, stats=None):
+    """
+    read_csv_file과 같은 결과를 이진 캐시 파일을 거쳐 돌려줍니다.
+    
+    처음 읽을 때는 CSV를 파싱하고, 결과를 열 단위로 marshal한 캐시를
+    '<CSV 경로>.cache'에 남깁니다. 캐시에는 CSV의 절대 경로, 크기,
+    mtime과 내용 해시가 함께 들어 있어서 다음에 읽을 때 다음처럼 고릅니다.
+    
+    - 경로나 크기가 다르면 캐시를 버리고 다시 파싱합니다.
+    - 크기와 mtime이 같으면 캐시를 그대로 씁니다 (verify=True이면 해시도 확인).
+    - mtime만 다르면 내용 해시를 비교해서, 같으면 캐시를 쓰고 mtime을
+      고쳐 두고 다르면 다시 파싱합니다.
+    
+    캐시가 깨졌거나 marshal 버전이 다르면 오래된 캐시처럼 다시 만듭니다.
+    
+    Args:
+        file_path (str): CSV 파일 경로
+        cache_path (str): 캐시 파일 경로 (기본값 file_path + CSV_CACHE_SUFFIX)
+        verify (bool): 크기와 mtime이 같아도 내용 해시를 확인할지 여부
+        stats (dict): 주면 'cache'에 'hit', 'refreshed', 'miss' 중 하나를,
+            'seconds'에 걸린 시간을 기록합니다.
+        
+    Returns:
+        list: CSV 데이터를 포함하는 딕셔너리 리스트
+    """
+    started = time.perf_counter()
+    cache_path = cache_path or file_path + CSV_CACHE_SUFFIX
+    result = 'miss'
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        print(f'오류: 파일 {file_path}을(를) 찾을 수 없습니다.')
+        return []
+    
+    data = None
+    digest = None
+    try:
+        with open(cache_path, 'rb') as file:
+            cached = file.read()
+        magic, version, size, mtime_ns, cached_digest, path_length = (
+            _CSV_CACHE_HEADER.unpack_from(cached)
+        )
+        position = _CSV_CACHE_HEADER.size
+        path = cached[position:position + path_length].decode('utf-8')
+        if (magic == CSV_CACHE_MAGIC and version == marshal.version and size == stat.st_size
+                and path == os.path.abspath(file_path)):
+            fresh = mtime_ns == stat.st_mtime_ns
+            if verify or not fresh:
+                digest = _file_digest(file_path)
+                fresh = digest == cached_digest
+            if fresh:
+                payload = memoryview(cached)[position + path_length:]
+                fieldnames, columns = marshal.loads(payload)
+                data = [dict(zip(fieldnames, values)) for values in zip(*columns)]
+                result = 'hit'
+                if mtime_ns != stat.st_mtime_ns:
+                    # 내용은 그대로이고 mtime만 바뀐 경우 (touch, 복원 등)
+                    _write_csv_cache(cache_path, file_path, stat, digest, payload)
+                    result = 'refreshed'
+    except (OSError, ValueError, EOFError, TypeError, struct.error):
+        data = None  # 캐시가 없거나 깨졌으면 다시 만든다
+    
+    if data is None:
+        digest = _file_digest(file_path)
+        data = read_csv_file(file_path)
+        if data:
+            fieldnames = list(data[0].keys())
+            columns = [[item[name] for item in data] for name in fieldnames]
+            _write_csv_cache(cache_path, file_path, stat, digest, marshal.dumps((fieldnames, columns)))
+    
+    if stats is not None:
+        stats['cache'] = result
+        stats['seconds'] = time.perf_counter() - started
+    return data
+
+
+def iter_csv_file(file_path):
+    """
+    CSV 파일을 한 행씩 읽어 딕셔너리로 돌려주는 제너레이터
+    
+    read_csv_file과 같은 딕셔너리를 만들지만 전체를 리스트로 모으지
+    않으므로, 큰 인벤토리도 메모리를 거의 쓰지 않고 훑을 수 있습니다.
+    
+    Args:
+        file_path (str): CSV 파일 경로
+        
+    Yields:
+        dict: 인화성을 float로 바꾼 행 딕셔너리
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for row in csv.DictReader(file):
+                row['Flammability'] = float(row['Flammability'])
+                yield row
+    except FileNotFoundError:
+        print(f'오류: 파일 {file_path}을(를) 찾을 수 없습니다.')
+    except Exception as e:
+        print(f'파일 읽기 오류: {str(e)}')
+
+
 def sort_by_flammability(inventory_list):
     """
     인벤토리 목록을 인화성 순으로 내림차순 정렬합니다.
@@ -51,25 +392,224 @@ def sort_by_flammability(inventory_list):
         inventory_list (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
         
     Returns:
-        list: 정렬된 딕셔너리 리스트
+        list: 정렬된 딕셔너리 리스트 (Inventory를 받으면 정렬된 Inventory)
     """
+    if isinstance(inventory_list, Inventory):
+        return inventory_list.sort_by('Flammability', reverse=True)
     return sorted(inventory_list, key=lambda x: x['Flammability'], reverse=True)
 
 
-def filter_dangerous_items(inventory_list, threshold=0.7):
+def filter_dangerous_items(inventory_list, threshold=0.7, index=None):
     """
     인화성이 임계값 이상인 항목을 필터링합니다.
     
     Args:
         inventory_list (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
         threshold (float): 인화성 임계값 (기본값 0.7)
+        index (FlammabilityIndex): inventory_list의 인화성 색인 (선택 사항).
+            주면 전체를 훑지 않고 색인에서 O(log n + k)로 찾습니다.
         
     Returns:
-        list: 필터링된 딕셔너리 리스트
+        list: 필터링된 딕셔너리 리스트 (Inventory를 받으면 필터링된 Inventory)
     """
+    if index is not None:
+        # 행 번호 순으로 되돌려서 훑었을 때와 같은 순서를 유지
+        rows = sorted(index.at_least(threshold))
+        if isinstance(inventory_list, Inventory):
+            return inventory_list.take(rows)
+        return [inventory_list[row] for row in rows]
+    if isinstance(inventory_list, Inventory):
+        return inventory_list.compress(inventory_list.mask('Flammability', '>=', threshold))
     return [item for item in inventory_list if item['Flammability'] >= threshold]
 
 
+def top_dangerous_items(inventory_list, count=20):
+    """
+    인화성이 가장 높은 항목 count개를 인화성 내림차순으로 돌려줍니다.
+    
+    전체를 정렬하지 않고 heapq.nlargest로 O(n log k) 시간, O(k) 메모리에
+    찾으므로 iter_csv_file이나 iter_binary_file 같은 스트리밍 읽기 결과를
+    그대로 넘길 수 있습니다. 인화성이 같으면 앞에 나온 항목이 먼저 오므로
+    sort_by_flammability(inventory_list)[:count]와 결과가 같습니다.
+    
+    Args:
+        inventory_list (iterable): 인벤토리 항목 (리스트, 제너레이터, Inventory 등)
+        count (int): 돌려줄 항목 수
+        
+    Returns:
+        list: 딕셔너리 리스트 (Inventory를 받으면 Inventory)
+    """
+    if isinstance(inventory_list, Inventory):
+        values = inventory_list.column('Flammability')
+        return inventory_list.take(
+            heapq.nlargest(count, range(len(inventory_list)), key=values.__getitem__)
+        )
+    return heapq.nlargest(count, inventory_list, key=itemgetter('Flammability'))
+
+
+class FlammabilityIndex:
+    """
+    인화성 순으로 정렬해서 유지하는 색인
+    
+    (인화성, 행 번호) 쌍을 오름차순으로 두 병렬 배열에 저장합니다.
+    임계값·범위 질의는 bisect로 경계를 찾아 O(log n + k)에 답하고,
+    항목을 넣고 뺄 때도 색인을 다시 만들지 않고 그 자리에 끼워 넣습니다.
+    
+    넣고 빼기는 배열 중간에 끼워 넣거나 지우므로 O(n)입니다. 바꾼 색인은
+    write_flammability_index로 인벤토리 파일(MINV)의 FIDX 섹션에 다시
+    저장할 수 있습니다. write_binary_file로 쓴 이전 형식 파일에는 색인을
+    저장할 곳이 없으므로 읽은 레코드로 메모리에서만 만들어 씁니다.
+    
+    행 번호는 색인을 만든 인벤토리에서의 위치입니다. 항목을 빼더라도
+    다른 행의 번호가 바뀌지 않도록, 인벤토리 쪽에서도 위치를 당기지
+    말아야 합니다.
+    """
+    
+    def __init__(self, inventory_list=()):
+        """
+        FlammabilityIndex 초기화
+        
+        Args:
+            inventory_list (list): 색인을 만들 인벤토리 (딕셔너리 리스트,
+                Inventory 또는 InventoryFile)
+        """
+        if isinstance(inventory_list, Inventory):
+            values = inventory_list.column('Flammability')
+        else:
+            values = [float(item['Flammability']) for item in inventory_list]
+        # 안정 정렬이라 인화성이 같은 행은 행 번호 순
+        order = sorted(range(len(values)), key=values.__getitem__)
+        self._keys = array('d', (values[row] for row in order))
+        self._rows = array('I', order)
+    
+    @classmethod
+    def from_bytes(cls, data, byte_order='<', values=None):
+        """
+        to_bytes로 직렬화한 색인을 다시 만듭니다 (다시 정렬하지 않음).
+        
+        Args:
+            data (bytes): 인화성 float64 배열 다음에 행 번호 u32 배열
+                (values를 주면 행 번호 배열만)
+            byte_order (str): '<'(리틀 엔디언) 또는 '>'(빅 엔디언)
+            values (sequence): 행 번호별 인화성 (with_keys=False로 직렬화한 경우)
+            
+        Returns:
+            FlammabilityIndex: 색인
+        """
+        entry_size = 4 if values is not None else 12
+        count, remainder = divmod(len(data), entry_size)
+        if remainder:
+            raise ValueError('인화성 색인의 크기가 올바르지 않습니다.')
+        index = cls()
+        if values is None:
+            index._keys.frombytes(data[:count * 8])
+            data = data[count * 8:]
+        index._rows.frombytes(data)
+        if byte_order != ('<' if sys.byteorder == 'little' else '>'):
+            index._keys.byteswap()
+            index._rows.byteswap()
+        if values is not None:
+            index._keys.extend(values[row] for row in index._rows)
+        return index
+    
+    def to_bytes(self, byte_order='<', with_keys=True):
+        """
+        색인을 인화성 float64 배열과 행 번호 u32 배열로 직렬화합니다.
+        
+        Args:
+            byte_order (str): '<'(리틀 엔디언) 또는 '>'(빅 엔디언)
+            with_keys (bool): False이면 행 번호 배열만 씁니다. 인화성은 읽을 때
+                레코드에서 다시 가져와야 합니다 (from_bytes의 values).
+            
+        Returns:
+            bytes: 직렬화한 색인
+        """
+        keys = array('d', self._keys if with_keys else ())
+        rows = array('I', self._rows)
+        if byte_order != ('<' if sys.byteorder == 'little' else '>'):
+            keys.byteswap()
+            rows.byteswap()
+        return keys.tobytes() + rows.tobytes()
+    
+    def __len__(self):
+        return len(self._rows)
+    
+    def _position(self, flammability, row):
+        """(인화성, 행 번호) 쌍이 들어갈 위치"""
+        low = bisect_left(self._keys, flammability)
+        high = bisect_right(self._keys, flammability, low)
+        return bisect_left(self._rows, row, low, high), high
+    
+    def insert(self, row, flammability):
+        """
+        행 하나를 색인에 넣습니다 (뒤쪽 항목을 미루므로 O(n)).
+        
+        Args:
+            row (int): 인벤토리에서의 행 번호
+            flammability (float): 인화성
+        """
+        flammability = float(flammability)
+        position, _ = self._position(flammability, row)
+        self._keys.insert(position, flammability)
+        self._rows.insert(position, row)
+    
+    def remove(self, row, flammability):
+        """
+        행 하나를 색인에서 뺍니다 (뒤쪽 항목을 당기므로 O(n)).
+        
+        Args:
+            row (int): 인벤토리에서의 행 번호
+            flammability (float): 그 행의 인화성
+        
+        Raises:
+            KeyError: 색인에 그 행이 없는 경우
+        """
+        flammability = float(flammability)
+        position, high = self._position(flammability, row)
+        if position == high or self._rows[position] != row:
+            raise KeyError((row, flammability))
+        del self._keys[position]
+        del self._rows[position]
+    
+    def at_least(self, threshold):
+        """
+        인화성이 threshold 이상인 행 번호를 인화성 오름차순으로 돌려줍니다.
+        
+        Args:
+            threshold (float): 인화성 임계값
+            
+        Returns:
+            list: 행 번호 리스트
+        """
+        return self._rows[bisect_left(self._keys, threshold):].tolist()
+    
+    def between(self, low, high):
+        """
+        인화성이 low 이상 high 이하인 행 번호를 인화성 오름차순으로 돌려줍니다.
+        
+        Args:
+            low (float): 하한 (포함)
+            high (float): 상한 (포함)
+            
+        Returns:
+            list: 행 번호 리스트
+        """
+        start = bisect_left(self._keys, low)
+        return self._rows[start:bisect_right(self._keys, high, start)].tolist()
+    
+    def count_at_least(self, threshold):
+        """
+        인화성이 threshold 이상인 행 수를 O(log n)으로 셉니다.
+        
+        Args:
+            threshold (float): 인화성 임계값
+            
+        Returns:
+            int: 행 수
+        """
+        return len(self._keys) - bisect_left(self._keys, threshold)
+
+
 def write_csv_file(data, file_path, fieldnames=None):
     """
     데이터를 CSV 파일에 씁니다.
@@ -189,77 +729,2378 @@ def read_binary_file(file_path):
         return []
 
 
-def print_inventory(inventory_list):
+def iter_binary_file(file_path):
     """
-    인벤토리 항목을 형식에 맞게 출력합니다.
+    이진 인벤토리 파일을 한 레코드씩 읽어 딕셔너리로 돌려주는 제너레이터
+    
+    write_binary_file 형식은 버퍼가 있는 파일에서 레코드를 하나씩 읽고,
+    MINV 형식(write_inventory_file)은 InventoryFile로, 블록 압축 형식
+    (write_compressed_binary_file)은 CompressedInventoryFile로 읽습니다.
     
     Args:
-        inventory_list (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        file_path (str): 이진 파일 경로
+        
+    Yields:
+        dict: 레코드 딕셔너리
     """
-    if not inventory_list:
-        print('표시할 인벤토리 항목이 없습니다.')
-        return
+    try:
+        yield from _iter_binary_records(file_path)
+    except FileNotFoundError:
+        print(f'오류: 이진 파일 {file_path}을(를) 찾을 수 없습니다.')
+    except Exception as e:
+        print(f'이진 파일 읽기 오류: {str(e)}')
+
+
+def _iter_binary_records(file_path):
+    """
+    iter_binary_file과 같지만 오류를 출력하지 않고 그대로 냅니다.
     
-    # 더 나은 형식을 위한 열 너비 정의
-    col_widths = {
-        'Substance': 25,
-        'Weight (g/cm³)': 15,
-        'Specific Gravity': 18,
-        'Strength': 15,
-        'Flammability': 12
-    }
+    레코드 수보다 파일이 짧으면 ValueError를 내므로, 잘린 파일을 끝까지
+    읽은 것처럼 넘어가면 안 되는 곳(merge_binary_files 등)에서 씁니다.
     
-    # 헤더 출력
-    header = '|'.join(
-        f' {name:<{col_widths[name]}} '
-        for name in col_widths.keys()
-    )
-    separator = '+'.join(
-        '-' * (col_widths[name] + 2)
-        for name in col_widths.keys()
-    )
+    Args:
+        file_path (str): 이진 파일 경로
+        
+    Yields:
+        dict: 레코드 딕셔너리
+        
+    Raises:
+        ValueError: 파일이 잘렸거나 형식이 맞지 않는 경우
+    """
+    with open(file_path, 'rb') as file:
+        head = file.read(len(INVENTORY_MAGIC))
+        if head == INVENTORY_MAGIC:
+            with InventoryFile(file_path) as inventory:
+                yield from inventory
+            return
+        if head == BLOCK_MAGIC:
+            with CompressedInventoryFile(file_path) as inventory:
+                yield from inventory
+            return
+        if len(head) < _U32.size:
+            raise ValueError(f'{file_path}에 레코드 수가 없습니다.')
+        
+        def read(size):
+            data = file.read(size)
+            if len(data) != size:
+                raise ValueError(f'{file_path}이(가) 레코드 수보다 짧습니다.')
+            return data
+        
+        unpack_length = _U32.unpack
+        for _ in range(unpack_length(head)[0]):
+            item = {}
+            for field in LEGACY_STRING_FIELDS:
+                item[field] = read(unpack_length(read(4))[0]).decode('utf-8')
+            item['Flammability'] = _F32.unpack(read(4))[0]
+            yield item
+
+
+def iter_inventory_file(file_path):
+    """
+    확장자가 .csv이면 iter_csv_file, 아니면 iter_binary_file로 읽습니다.
     
-    print(separator)
-    print(header)
-    print(separator)
+    Args:
+        file_path (str): 인벤토리 파일 경로
+        
+    Returns:
+        generator: 행 딕셔너리를 돌려주는 제너레이터
+    """
+    if file_path.lower().endswith('.csv'):
+        return iter_csv_file(file_path)
+    return iter_binary_file(file_path)
+
+
+class BinaryRecord(Mapping):
+    """
+    write_binary_file 형식 버퍼 안의 레코드 하나를 가리키는 지연 뷰
     
-    # 각 항목 출력
-    for item in inventory_list:
-        row = '|'.join(
-            f' {str(item[name]):<{col_widths[name]}} '
-            for name in col_widths.keys()
-        )
-        print(row)
+    레코드의 시작 위치만 들고 있다가, 열에 접근할 때 그 열의 바이트만
+    해석합니다. 읽기 전용 매핑이라 딕셔너리처럼 item['Flammability'],
+    keys(), get()을 쓸 수 있고, dict(record)로 일반 딕셔너리가 됩니다.
+    """
+    
+    __slots__ = ('_buffer', '_offset')
+    
+    def __init__(self, buffer, offset):
+        """
+        BinaryRecord 초기화
+        
+        Args:
+            buffer (memoryview): 이진 파일 전체 내용
+            offset (int): 레코드가 시작하는 바이트 위치
+        """
+        self._buffer = buffer
+        self._offset = offset
+    
+    def _field_offset(self, field):
+        """field번째 필드(문자열 4개 다음이 인화성)가 시작하는 위치"""
+        offset = self._offset
+        for _ in range(field):
+            offset += 4 + _U32.unpack_from(self._buffer, offset)[0]
+        return offset
+    
+    def __getitem__(self, key):
+        if key == 'Flammability':
+            return _F32.unpack_from(self._buffer, self._field_offset(len(LEGACY_STRING_FIELDS)))[0]
+        field = _LEGACY_FIELD_INDEX.get(key)
+        if field is None:
+            raise KeyError(key)
+        offset = self._field_offset(field)
+        length = _U32.unpack_from(self._buffer, offset)[0]
+        return str(self._buffer[offset + 4:offset + 4 + length], 'utf-8')
+    
+    def to_dict(self):
+        """
+        모든 열을 한 번에 디코딩해서 일반 딕셔너리로 돌려줍니다.
+        
+        dict(record)는 열마다 길이 필드를 처음부터 다시 따라가므로,
+        모든 열이 필요할 때는 레코드를 한 번만 훑는 이 메서드가 빠릅니다.
+        
+        Returns:
+            dict: read_binary_file이 돌려주는 것과 같은 딕셔너리
+        """
+        buffer = self._buffer
+        offset = self._offset
+        item = {}
+        for field in LEGACY_STRING_FIELDS:
+            length = _U32.unpack_from(buffer, offset)[0]
+            item[field] = str(buffer[offset + 4:offset + 4 + length], 'utf-8')
+            offset += 4 + length
+        item['Flammability'] = _F32.unpack_from(buffer, offset)[0]
+        return item
+    
+    def __iter__(self):
+        yield from LEGACY_STRING_FIELDS
+        yield 'Flammability'
+    
+    def __len__(self):
+        return len(LEGACY_STRING_FIELDS) + 1
+    
+    def __repr__(self):
+        return f'BinaryRecord({dict(self)!r})'
+
+
+def decode_binary_file(file_path):
+    """
+    write_binary_file 형식 파일을 한 번에 읽어 지연 레코드 뷰 리스트로 돌려줍니다.
+    
+    read_binary_file은 레코드마다 file.read와 struct.unpack을 열 번 가까이
+    부르고 문자열을 모두 디코딩합니다. 이 함수는 파일 전체를 한 번 읽어
+    memoryview로 감싼 뒤, 미리 컴파일한 struct로 길이 필드만 따라가며
+    레코드 시작 위치를 찾습니다. 문자열은 접근할 때만 디코딩합니다.
+    (레코드 길이가 제각각이라 iter_unpack은 쓸 수 없습니다.)
+    
+    MINV 형식(write_inventory_file)과 블록 압축 형식
+    (write_compressed_binary_file) 파일은 각자의 읽기 함수로 읽습니다.
+    
+    Args:
+        file_path (str): 이진 파일 경로
+        
+    Returns:
+        list: BinaryRecord(기존 형식) 또는 딕셔너리(MINV·블록 압축 형식) 리스트
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            buffer = memoryview(file.read())
+        if buffer[:len(INVENTORY_MAGIC)] == INVENTORY_MAGIC:
+            return read_inventory_file(file_path)
+        if buffer[:len(BLOCK_MAGIC)] == BLOCK_MAGIC:
+            return read_compressed_binary_file(file_path)
+        
+        unpack_length = _U32.unpack_from
+        num_records = unpack_length(buffer, 0)[0]
+        records = []
+        offset = 4
+        for _ in range(num_records):
+            start = offset
+            for _ in LEGACY_STRING_FIELDS:
+                offset += 4 + unpack_length(buffer, offset)[0]
+            offset += 4  # 인화성 float
+            records.append(BinaryRecord(buffer, start))
+        if offset > len(buffer):
+            raise ValueError('파일이 레코드 수보다 짧습니다.')
+        return records
+    except FileNotFoundError:
+        print(f'오류: 이진 파일 {file_path}을(를) 찾을 수 없습니다.')
+        return []
+    except Exception as e:
+        print(f'이진 파일 읽기 오류: {str(e)}')
+        return []
+
+
+def _pack_legacy_record(substance, weight, gravity, strength, flammability):
+    """write_binary_file 형식 레코드 하나를 bytes로 만듭니다."""
+    parts = []
+    for text in (substance, weight, gravity, strength):
+        encoded = text.encode('utf-8')
+        parts.append(_U32.pack(len(encoded)))
+        parts.append(encoded)
+    parts.append(_F32.pack(flammability))
+    return b''.join(parts)
+
+
+def split_csv_ranges(file_path, chunk_size=CONVERT_CHUNK_SIZE):
+    """
+    CSV 파일을 행 경계에 맞춘 바이트 범위로 나눕니다.
+    
+    따옴표 안의 줄바꿈에서 자르지 않도록, 줄마다 따옴표 수의 홀짝을
+    따라가며 따옴표 밖에서 끝나는 줄에서만 범위를 끊습니다.
+    
+    Args:
+        file_path (str): CSV 파일 경로
+        chunk_size (int): 범위 하나의 대략적인 바이트 크기
+        
+    Returns:
+        tuple: (헤더 필드 이름 리스트, [(시작, 끝), ...])
+    """
+    ranges = []
+    with open(file_path, 'rb') as file:
+        header = file.readline()
+        fieldnames = next(csv.reader([header.decode('utf-8')]), [])
+        start = position = len(header)
+        in_quotes = False
+        for line in file:
+            position += len(line)
+            if line.count(b'"') & 1:
+                in_quotes = not in_quotes
+            if not in_quotes and position - start >= chunk_size:
+                ranges.append((start, position))
+                start = position
+        if position > start:
+            ranges.append((start, position))
+    return fieldnames, ranges
+
+
+def _sort_csv_range(csv_path, start, end, fieldnames, run_path):
+    """
+    변환 작업: CSV 바이트 범위 하나를 파싱해 인화성 내림차순 런 파일로 씁니다.
+    
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 둡니다. 런 파일의
+    항목은 (float64 인화성, 레코드 길이) 머리 다음에 write_binary_file
+    형식 레코드가 옵니다.
+    
+    Returns:
+        tuple: (런 파일 경로, 레코드 수)
+    """
+    with open(csv_path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    positions = [fieldnames.index(name) for name in LEGACY_STRING_FIELDS]
+    flammability = fieldnames.index('Flammability')
+    
+    entries = []
+    # read_csv_file처럼 텍스트 모드의 줄바꿈 변환(\r\n -> \n)을 거친다
+    for row in csv.reader(io.StringIO(data.decode('utf-8'), newline=None)):
+        if not row:
+            continue
+        key = float(row[flammability])
+        entries.append((key, _pack_legacy_record(*(row[position] for position in positions), key)))
+    del data
+    # sort_by_flammability와 같은 안정 내림차순 정렬
+    entries.sort(key=itemgetter(0), reverse=True)
+    
+    with open(run_path, 'wb') as run:
+        for key, record in entries:
+            run.write(_RUN_ENTRY.pack(key, len(record)))
+            run.write(record)
+    return run_path, len(entries)
+
+
+def _read_sorted_run(run_path):
+    """_sort_csv_range로 쓴 런 파일에서 (인화성, 레코드 bytes)를 하나씩 돌려줍니다."""
+    with open(run_path, 'rb') as run:
+        while True:
+            head = run.read(_RUN_ENTRY.size)
+            if not head:
+                return
+            key, length = _RUN_ENTRY.unpack(head)
+            yield key, run.read(length)
+
+
+def convert_csv_to_binary(csv_path, binary_path, workers=None, chunk_size=CONVERT_CHUNK_SIZE,
+                          temp_dir=None):
+    """
+    CSV를 인화성 내림차순으로 정렬한 write_binary_file 형식 파일로 스트리밍 변환합니다.
+    
+    read_csv_file → sort_by_flammability → write_binary_file과 결과 파일이
+    바이트 단위로 같지만, 모든 행을 한꺼번에 메모리에 올리지 않습니다.
+    CSV를 행 경계에 맞춘 바이트 범위로 나누고, 작업 프로세스가 범위마다
+    파싱·정렬한 런 파일을 임시 디렉터리에 씁니다. 마지막으로 heapq.merge로
+    런들을 k-way 병합하며 결과 파일에 이어 씁니다. 인화성이 같은 행은
+    앞선 런이 먼저 나오므로 sorted()와 같은 안정 정렬이 됩니다.
+    
+    메모리에는 작업 중인 범위(작업 프로세스 수 x chunk_size 정도)와
+    병합할 때 런마다 레코드 하나씩만 올라갑니다. 런 수만큼 파일을 동시에
+    열므로 행이 아주 많으면 chunk_size를 키워 런 수를 줄입니다.
+    
+    Args:
+        csv_path (str): 입력 CSV 파일 경로
+        binary_path (str): 출력 이진 파일 경로
+        workers (int): 작업 프로세스 수 (기본값 CPU 코어 수, 1이면 현재 프로세스에서 실행)
+        chunk_size (int): 작업 하나가 맡는 CSV 바이트 범위 크기
+        temp_dir (str): 런 파일을 만들 디렉터리 (기본값은 시스템 임시 디렉터리)
+        
+    Returns:
+        bool: 변환 성공 시 True, 그렇지 않으면 False
+    """
+    try:
+        fieldnames, ranges = split_csv_ranges(csv_path, chunk_size)
+    except FileNotFoundError:
+        print(f'오류: 파일 {csv_path}을(를) 찾을 수 없습니다.')
+        return False
     
-    print(separator)
-    print(f'총 항목 수: {len(inventory_list)}')
+    try:
+        with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+            tasks = [
+                (csv_path, start, end, fieldnames, os.path.join(run_dir, f'run{number}'))
+                for number, (start, end) in enumerate(ranges)
+            ]
+            if workers == 1:
+                runs = [_sort_csv_range(*task) for task in tasks]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    # executor.map은 제출한 순서대로 결과를 돌려준다
+                    runs = list(executor.map(_sort_csv_range, *zip(*tasks))) if tasks else []
+            
+            with open(binary_path, 'wb') as file:
+                file.write(_U32.pack(sum(count for _, count in runs)))
+                merged = heapq.merge(
+                    *(_read_sorted_run(run_path) for run_path, _ in runs),
+                    key=itemgetter(0),
+                    reverse=True
+                )
+                for _, record in merged:
+                    file.write(record)
+        return True
+    except Exception as e:
+        print(f'{csv_path}을(를) 이진 파일로 변환하는 중 오류: {str(e)}')
+        return False
 
 
-def main():
-    """스크립트를 실행하는 메인 함수입니다."""
-    input_file = 'Mars_Base_Inventory_List.csv'
+class InventoryDeltaLog:
+    """
+    write_binary_file 형식 인벤토리에 대한 추가 전용 변경 로그
+    
+    항목을 넣고(I), 고치고(U), 지울(D) 때마다 기본 파일을 다시 쓰지 않고
+    '<기본 파일>.delta'에 항목 하나만 덧붙이므로 비용이 변경 크기에
+    비례합니다. 변경은 Substance를 키로 하고, 넣기와 고치기는 모두 같은
+    이름의 항목을 바꾸거나 새로 더하는 upsert로 적용합니다. 그래서 같은
+    로그를 두 번 적용해도 결과가 같습니다.
+    
+    읽을 때는 변경 로그만 메모리에 올리고, 인화성 내림차순으로 정렬된
+    기본 파일을 한 레코드씩 읽으면서 변경을 heapq.merge로 섞어 정렬된
+    결과를 돌려줍니다. compact()는 이 결과로 기본 파일을 다시 쓰고
+    변경 로그를 비웁니다.
+    
+    마지막 항목을 쓰다가 중단돼 잘린 꼬리는 읽을 때 무시하고, 다음에
+    항목을 덧붙이기 전에 잘라 내서 뒤의 항목이 그 꼬리에 묻히지 않게 합니다.
+    """
+    
+    def __init__(self, binary_path):
+        """
+        InventoryDeltaLog 초기화
+        
+        Args:
+            binary_path (str): 기본 이진 파일 경로 (sort_by_flammability로
+                정렬해서 write_binary_file로 쓴 파일)
+        """
+        self.binary_path = binary_path
+        self.delta_path = binary_path + DELTA_SUFFIX
+        self._checked_size = None  # 이 객체가 마지막으로 확인·기록한 로그 크기
+    
+    @staticmethod
+    def _complete_size(data):
+        """
+        변경 로그 내용에서 마지막 완전한 항목이 끝나는 위치를 구합니다.
+        
+        Args:
+            data (bytes): 변경 로그 내용
+            
+        Returns:
+            int: 완전한 부분의 크기 (매직부터 잘렸으면 0)
+            
+        Raises:
+            ValueError: 변경 로그 형식이 아닌 경우
+        """
+        if len(data) < len(DELTA_MAGIC):
+            if DELTA_MAGIC.startswith(data):
+                return 0
+            raise ValueError('인벤토리 변경 로그가 아닙니다.')
+        if data[:len(DELTA_MAGIC)] != DELTA_MAGIC:
+            raise ValueError('인벤토리 변경 로그가 아닙니다.')
+        offset = len(DELTA_MAGIC)
+        while offset + _DELTA_ENTRY.size <= len(data):
+            length = _DELTA_ENTRY.unpack_from(data, offset)[1]
+            if offset + _DELTA_ENTRY.size + length > len(data):
+                break
+            offset += _DELTA_ENTRY.size + length
+        return offset
+    
+    def _append(self, op, payload):
+        """
+        변경 항목 하나를 로그 끝에 덧붙입니다.
+        
+        로그 끝에 쓰다가 중단된 항목이 남아 있으면 먼저 잘라 냅니다. 로그
+        전체를 훑는 확인은 이 객체가 마지막으로 쓴 뒤 크기가 바뀐 경우에만 합니다.
+        """
+        try:
+            with open(self.delta_path, 'ab') as file:
+                size = file.tell()
+                if size and size != self._checked_size:
+                    with open(self.delta_path, 'rb') as reader:
+                        complete = self._complete_size(reader.read())
+                    if complete < size:
+                        file.truncate(complete)
+                        size = complete
+                entry = _DELTA_ENTRY.pack(op, len(payload)) + payload
+                if size == 0:
+                    entry = DELTA_MAGIC + entry
+                file.write(entry)
+            self._checked_size = size + len(entry)
+            return True
+        except Exception as e:
+            print(f'변경 로그 {self.delta_path}에 쓰기 오류: {str(e)}')
+            return False
+    
+    @staticmethod
+    def _pack_item(item):
+        return _pack_legacy_record(
+            *(str(item[field]) for field in LEGACY_STRING_FIELDS), item['Flammability']
+        )
+    
+    def insert(self, item):
+        """
+        새 항목을 넣습니다 (같은 이름이 있으면 바꿈).
+        
+        Args:
+            item (dict): 인벤토리 항목
+            
+        Returns:
+            bool: 쓰기 성공 시 True, 그렇지 않으면 False
+        """
+        return self._append(b'I', self._pack_item(item))
+    
+    def update(self, item):
+        """
+        같은 이름의 항목을 바꿉니다 (없으면 새로 더함).
+        
+        Args:
+            item (dict): 바뀐 인벤토리 항목
+            
+        Returns:
+            bool: 쓰기 성공 시 True, 그렇지 않으면 False
+        """
+        return self._append(b'U', self._pack_item(item))
+    
+    def delete(self, substance):
+        """
+        이름이 substance인 항목을 지웁니다 (삭제 표시를 덧붙임).
+        
+        Args:
+            substance (str): 지울 물질 이름
+            
+        Returns:
+            bool: 쓰기 성공 시 True, 그렇지 않으면 False
+        """
+        return self._append(b'D', substance.encode('utf-8'))
+    
+    def changes(self):
+        """
+        변경 로그를 읽어 이름별 최종 상태로 모읍니다.
+        
+        Returns:
+            dict: {물질 이름: 최종 항목 딕셔너리 또는 None(삭제)}
+        """
+        try:
+            with open(self.delta_path, 'rb') as file:
+                data = memoryview(file.read())
+        except FileNotFoundError:
+            return {}
+        if len(data) < len(DELTA_MAGIC) and DELTA_MAGIC.startswith(data):
+            return {}  # 매직을 쓰다가 중단된 빈 로그 (_append가 잘라 냄)
+        if data[:len(DELTA_MAGIC)] != DELTA_MAGIC:
+            raise ValueError(f'{self.delta_path}은(는) 인벤토리 변경 로그가 아닙니다.')
+        
+        changes = {}
+        offset = len(DELTA_MAGIC)
+        while offset + _DELTA_ENTRY.size <= len(data):
+            op, length = _DELTA_ENTRY.unpack_from(data, offset)
+            offset += _DELTA_ENTRY.size
+            if offset + length > len(data):
+                break  # 쓰다가 중단된 마지막 항목
+            payload = data[offset:offset + length]
+            offset += length
+            if op == b'D':
+                changes[str(payload, 'utf-8')] = None
+            elif op in (b'I', b'U'):
+                item = BinaryRecord(payload, 0).to_dict()
+                changes[item['Substance']] = item
+            else:
+                raise ValueError(f'알 수 없는 변경 작업입니다: {op!r}')
+        return changes
+    
+    def __iter__(self):
+        """
+        기본 파일과 변경 로그를 합친 인벤토리를 인화성 내림차순으로 돌려줍니다.
+        
+        Yields:
+            dict: 인벤토리 항목
+        
+        Raises:
+            ValueError: 기본 파일이 잘렸거나 손상됐거나 인화성 내림차순이 아닌 경우
+        """
+        changes = self.changes()
+        upserts = sorted(
+            (item for item in changes.values() if item is not None),
+            key=itemgetter('Flammability'), reverse=True
+        )
+        base = ()
+        if os.path.exists(self.binary_path):
+            # 기본 파일이 잘렸으면 중간에 끊긴 채로 합치지 않도록 오류를 그대로 낸다
+            base = _check_flammability_order(_iter_binary_records(self.binary_path), self.binary_path)
+        yield from heapq.merge(
+            (item for item in base if item['Substance'] not in changes),
+            upserts,
+            key=itemgetter('Flammability'),
+            reverse=True
+        )
+    
+    def pending_bytes(self):
+        """
+        아직 기본 파일에 합치지 않은 변경 로그의 크기를 돌려줍니다.
+        
+        Returns:
+            int: 변경 로그 바이트 수 (로그가 없으면 0)
+        """
+        try:
+            return os.path.getsize(self.delta_path)
+        except FileNotFoundError:
+            return 0
+    
+    def compact(self, min_ratio=None):
+        """
+        변경을 합친 결과로 기본 파일을 다시 쓰고 변경 로그를 지웁니다.
+        
+        새 파일을 임시 파일에 다 쓴 뒤 os.replace로 바꾸므로 중간에
+        중단돼도 기본 파일은 온전합니다. 바꾼 뒤 로그를 지우기 전에
+        중단되면 다음 번에 같은 로그가 다시 적용되지만, 변경이 upsert와
+        삭제라서 결과는 같습니다.
+        
+        Args:
+            min_ratio (float): 주면 변경 로그가 기본 파일 크기의 이 비율
+                이상일 때만 합칩니다 (예: 0.1).
+            
+        Returns:
+            bool: 합쳤으면 True, 합칠 필요가 없거나 실패하면 False
+        """
+        pending = self.pending_bytes()
+        if not pending:
+            return False
+        if min_ratio is not None and os.path.exists(self.binary_path):
+            if pending < min_ratio * os.path.getsize(self.binary_path):
+                return False
+        
+        temp_path = self.binary_path + '.compact'
+        try:
+            with open(temp_path, 'wb') as file:
+                file.write(_U32.pack(0))
+                count = 0
+                for item in self:
+                    file.write(self._pack_item(item))
+                    count += 1
+                file.seek(0)
+                file.write(_U32.pack(count))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.binary_path)
+            os.remove(self.delta_path)
+            return True
+        except Exception as e:
+            print(f'{self.binary_path} 합치기 오류: {str(e)}')
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+
+def _check_flammability_order(items, file_path):
+    """인화성 내림차순이 아닌 레코드를 만나면 ValueError를 내며 items를 그대로 돌려줍니다."""
+    previous = float('inf')
+    for item in items:
+        flammability = item['Flammability']
+        if flammability > previous:
+            raise ValueError(f'{file_path}이(가) 인화성 내림차순으로 정렬되어 있지 않습니다.')
+        previous = flammability
+        yield item
+
+
+def merge_binary_files(input_paths, output_path, deduplicate=False):
+    """
+    인화성 내림차순으로 정렬된 이진 인벤토리 파일 N개를 하나로 합칩니다.
+    
+    파일마다 iter_binary_file로 한 레코드씩 읽으면서 heapq.merge로 섞으므로
+    전체 레코드 수에 비례하는 시간(힙 연산은 레코드마다 O(log N))에,
+    메모리는 파일마다 레코드 하나와 읽기 버퍼만 씁니다. 입력은
+    write_binary_file 형식과 MINV 형식(write_inventory_file)을 섞어 써도
+    되고, 결과는 write_binary_file 형식으로 씁니다.
+    
+    인화성이 같으면 input_paths에서 앞에 있는 파일의 레코드가 먼저
+    나옵니다. deduplicate이면 Substance마다 처음 나온 레코드, 즉 인화성이
+    가장 높은 레코드만 남깁니다. 이때는 이미 쓴 이름의 집합을 들고 있어야
+    하므로 메모리가 서로 다른 이름 수만큼 늘어납니다.
+    
+    결과는 임시 파일에 다 쓴 뒤 os.replace로 바꾸므로 output_path가 입력
+    파일 중 하나여도 됩니다. 입력이 잘렸거나 손상됐으면 짧은 결과를 남기지
+    않고 임시 파일을 지운 뒤 False를 돌려줍니다.
+    
+    Args:
+        input_paths (list): 입력 이진 파일 경로 리스트 (각각 sort_by_flammability로
+            정렬해서 쓴 파일)
+        output_path (str): 출력 이진 파일 경로
+        deduplicate (bool): Substance가 같은 레코드를 하나만 남길지 여부
+        
+    Returns:
+        bool: 쓰기 성공 시 True, 그렇지 않으면 False
+    """
+    temp_path = output_path + '.merge'
+    try:
+        for input_path in input_paths:
+            if not os.path.exists(input_path):
+                print(f'오류: 이진 파일 {input_path}을(를) 찾을 수 없습니다.')
+                return False
+        
+        merged = heapq.merge(
+            *(_check_flammability_order(_iter_binary_records(path), path) for path in input_paths),
+            key=itemgetter('Flammability'),
+            reverse=True
+        )
+        seen = set()
+        with open(temp_path, 'wb') as file:
+            file.write(_U32.pack(0))
+            count = 0
+            for item in merged:
+                if deduplicate:
+                    if item['Substance'] in seen:
+                        continue
+                    seen.add(item['Substance'])
+                file.write(_pack_legacy_record(
+                    *(str(item[field]) for field in LEGACY_STRING_FIELDS), item['Flammability']
+                ))
+                count += 1
+            file.seek(0)
+            file.write(_U32.pack(count))
+        os.replace(temp_path, output_path)
+        return True
+    except Exception as e:
+        print(f'이진 파일 {output_path}에 합치기 오류: {str(e)}')
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+
+def _inventory_structs(byte_order):
+    """엔디언에 맞는 헤더, 열 정의, 섹션 표 struct를 돌려줍니다."""
+    return (
+        struct.Struct(f'{byte_order}BHQIHH'),  # 버전, 플래그, 레코드 수, 레코드 크기, 열 수, 섹션 수
+        struct.Struct(f'{byte_order}cH'),      # 열 형식 코드, 이름 길이
+        struct.Struct(f'{byte_order}4sQQ')     # 섹션 태그, 위치, 길이
+    )
+
+
+def _inventory_version(columns):
+    """열 형식 코드들을 읽을 수 있는 가장 낮은 파일 버전"""
+    return max(COLUMN_VERSIONS[code] for _, code in columns)
+
+
+def _fidx_has_keys(columns):
+    """
+    FIDX 섹션에 인화성 배열도 저장하는지 여부
+    
+    버전 3부터는 Flammability가 float64(d) 열이면 인화성을 ROWS에서 다시
+    읽을 수 있으므로 FIDX에는 행 번호만 저장합니다.
+    """
+    return _inventory_version(columns) < 3 or ('Flammability', 'd') not in columns
+
+
+def _row_struct(columns, byte_order):
+    """열 정의에 맞는 고정 폭 레코드 struct를 돌려줍니다."""
+    return struct.Struct(byte_order + ''.join(COLUMN_FORMATS[code] for _, code in columns))
+
+
+def _write_inventory_sections(file_path, columns, record_count, sections, byte_order='<', flags=0):
+    """
+    헤더, 열 정의, 섹션 표와 섹션들을 인벤토리 파일로 씁니다.
+    
+    섹션은 8바이트 경계에 맞춰 주어진 순서대로 이어 씁니다. 버전은 쓰인 열
+    형식 코드 중 가장 높은 COLUMN_VERSIONS로 정해서, 예를 들어 s와 d 열만
+    있으면 버전 1로 써서 이전 읽기 도구로도 읽을 수 있게 합니다.
+    
+    Args:
+        file_path (str): 출력 파일 경로
+        columns (list): (열 이름, 형식 코드) 리스트
+        record_count (int): 레코드 수
+        sections (list): (태그 bytes, 내용 bytes) 리스트
+        byte_order (str): '<'(리틀 엔디언) 또는 '>'(빅 엔디언)
+        flags (int): 헤더 플래그
+    """
+    header, column_struct, section_struct = _inventory_structs(byte_order)
+    column_bytes = b''.join(
+        column_struct.pack(code.encode('ascii'), len(name.encode('utf-8'))) + name.encode('utf-8')
+        for name, code in columns
+    )
+    position = (len(INVENTORY_MAGIC) + 1 + header.size + len(column_bytes)
+                + section_struct.size * len(sections))
+    
+    table = []
+    layout = []
+    for tag, content in sections:
+        padding = -position % 8
+        position += padding
+        table.append(section_struct.pack(tag, position, len(content)))
+        layout.append((padding, content))
+        position += len(content)
+    
+    with open(file_path, 'wb') as file:
+        file.write(INVENTORY_MAGIC + byte_order.encode('ascii'))
+        file.write(header.pack(
+            _inventory_version(columns),
+            flags, record_count, _row_struct(columns, byte_order).size,
+            len(columns), len(sections)
+        ))
+        file.write(column_bytes)
+        file.writelines(table)
+        for padding, content in layout:
+            file.write(b'\0' * padding)
+            file.write(content)
+
+
+def _pack_enum_levels(enums, byte_order):
+    """열거형 열들의 {값: 코드} 사전을 ENUM 섹션 bytes로 만듭니다."""
+    parts = []
+    for levels in enums:
+        parts.append(struct.pack(f'{byte_order}H', len(levels)))
+        for level in sorted(levels, key=levels.get):
+            encoded = level.encode('utf-8')
+            parts.append(struct.pack(f'{byte_order}H', len(encoded)) + encoded)
+    return b''.join(parts)
+
+
+def write_inventory_file(data, file_path, columns=None, byte_order='<', name_index=True,
+                         flammability_index=True):
+    """
+    인벤토리를 임의 접근이 가능한 고정 레이아웃 이진 형식으로 씁니다.
+    
+    write_binary_file은 문자열을 길이 접두사와 함께 이어 쓰기 때문에
+    N번째 레코드를 읽으려면 앞의 레코드를 모두 읽어야 합니다. 이 형식은
+    모든 레코드의 크기가 같아서 N번째 레코드를 O(1)로 읽을 수 있습니다.
+    
+    파일 구성:
+        헤더     매직 'MINV', 엔디언 문자('<' 또는 '>'), 버전, 플래그,
+                 레코드 수, 레코드 크기, 열 수, 섹션 수
+        열 정의  (형식 코드, 이름 길이, 이름) x 열 수
+        섹션 표  (태그, 위치, 길이) x 섹션 수
+        ROWS     고정 폭 레코드 (COLUMN_FORMATS, 문자열은 HEAP의 u32 위치·길이,
+                 인화성은 float64, 측정값은 float32, 열거형은 u8 코드)
+        HEAP     UTF-8 문자열 힙 (같은 문자열은 한 번만 저장)
+        ENUM     열거형 열마다 (값 수 u16, (길이 u16, 값) x 값 수) (열거형 열이 있을 때)
+        NAME     Substance 순으로 정렬한 레코드 번호 (u32, 이름으로 찾기용)
+        FIDX     인화성 색인 (FlammabilityIndex.to_bytes, 임계값 질의용,
+                 버전 3부터는 인화성 순 레코드 번호 u32만)
+    
+    TYPED_INVENTORY_COLUMNS(또는 infer_inventory_columns의 결과)를 넘기면
+    무게·비중은 float32('Various'는 NaN), 강도는 u8 코드로 저장해서 레코드가
+    작아지고 숫자로 비교할 수 있습니다. 읽을 때는 원래 CSV 텍스트로 돌아옵니다.
+    
+    크기는 write_binary_file(문자열마다 u32 길이 + 본문, 인화성 float32)과
+    비교해 숫자·열거형 열이면 더 작고, 문자열 열만 쓰면 더 큽니다 (함께
+    들어 있는 CSV 79행 기준 3,746바이트 대비 숫자·열거형 3,596바이트,
+    색인 제외 2,916바이트 / 문자열 4,900바이트, 색인 제외 4,220바이트).
+    두 색인은 레코드마다 8바이트를 더합니다.
+    
+    Args:
+        data (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        file_path (str): 출력 파일 경로
+        columns (list): (열 이름, 형식 코드) 리스트 (기본값 INVENTORY_COLUMNS)
+        byte_order (str): '<'(리틀 엔디언) 또는 '>'(빅 엔디언)
+        name_index (bool): Substance 이름 색인(NAME 섹션)을 만들지 여부
+        flammability_index (bool): 인화성 색인(FIDX 섹션)을 만들지 여부
+        
+    Returns:
+        bool: 쓰기 성공 시 True, 그렇지 않으면 False
+    """
+    columns = columns or INVENTORY_COLUMNS
+    try:
+        if byte_order not in ('<', '>'):
+            raise ValueError(f'엔디언은 \'<\' 또는 \'>\'여야 합니다: {byte_order!r}')
+        row = _row_struct(columns, byte_order)
+        rows = bytearray()
+        heap = bytearray()
+        heap_offsets = {}
+        # 열거형 열마다 {값: 코드}, 기본 순서(ENUM_LEVELS) 다음에 처음 나온 순서로 추가
+        enums = {
+            name: {level: code for code, level in enumerate(ENUM_LEVELS.get(name, ()))}
+            for name, code in columns if code == 'e'
+        }
+        
+        for item in data:
+            values = []
+            for name, code in columns:
+                if code in _STRING_CODES:
+                    text = str(item[name])
+                    location = heap_offsets.get(text)
+                    if location is None:
+                        encoded = text.encode('utf-8')
+                        location = heap_offsets[text] = (len(heap), len(encoded))
+                        heap += encoded
+                    values.extend(location)
+                elif code in _MEASUREMENT_CODES:
+                    values.append(parse_measurement(str(item[name]), code == 'f'))
+                elif code == 'e':
+                    levels = enums[name]
+                    text = str(item[name])
+                    level = levels.get(text)
+                    if level is None:
+                        if len(levels) > 255:
+                            raise ValueError(f'{name} 열의 값이 256가지를 넘습니다.')
+                        level = levels[text] = len(levels)
+                    values.append(level)
+                else:
+                    values.append(float(item[name]))
+            rows += row.pack(*values)
+        
+        sections = [(b'ROWS', rows), (b'HEAP', heap)]
+        if enums:
+            sections.append((b'ENUM', _pack_enum_levels(enums.values(), byte_order)))
+        if name_index:
+            order = sorted(range(len(data)), key=lambda index: str(data[index]['Substance']))
+            sections.append((b'NAME', struct.pack(f'{byte_order}{len(order)}I', *order)))
+        if flammability_index and any(name == 'Flammability' for name, _ in columns):
+            sections.append((b'FIDX', FlammabilityIndex(data).to_bytes(byte_order, _fidx_has_keys(columns))))
+        _write_inventory_sections(file_path, columns, len(data), sections, byte_order)
+        return True
+    except Exception as e:
+        print(f'이진 파일 {file_path}에 쓰기 오류: {str(e)}')
+        return False
+
+
+class InventoryFile:
+    """
+    write_inventory_file로 쓴 고정 레이아웃 이진 인벤토리 읽기 도구
+    
+    파일을 mmap으로 열고 헤더만 해석하므로, 여는 비용은 레코드 수와
+    관계없고 N번째 레코드는 위치를 계산해서 바로 읽습니다.
+    """
+    
+    def __init__(self, file_path):
+        """
+        InventoryFile 초기화
+        
+        Args:
+            file_path (str): 인벤토리 파일 경로
+            
+        Raises:
+            ValueError: 인벤토리 형식이 아니거나 지원하지 않는 버전인 경우
+        """
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        try:
+            self._view = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._parse_header()
+        except Exception:
+            self.close()
+            raise
+    
+    def _parse_header(self):
+        """헤더, 열 정의, 섹션 표를 읽습니다."""
+        view = self._view
+        magic_size = len(INVENTORY_MAGIC)
+        if view[:magic_size] != INVENTORY_MAGIC:
+            raise ValueError(f'{self.file_path}은(는) 인벤토리 이진 파일이 아닙니다.')
+        byte_order = view[magic_size:magic_size + 1].decode('ascii')
+        if byte_order not in ('<', '>'):
+            raise ValueError(f'알 수 없는 엔디언 표시입니다: {byte_order!r}')
+        
+        header, column_struct, section_struct = _inventory_structs(byte_order)
+        position = magic_size + 1
+        version, self.flags, self.record_count, row_size, column_count, section_count = (
+            header.unpack_from(view, position)
+        )
+        if version > INVENTORY_VERSION:
+            raise ValueError(f'지원하지 않는 인벤토리 파일 버전입니다: {version}')
+        position += header.size
+        
+        self.columns = []
+        for _ in range(column_count):
+            code, name_length = column_struct.unpack_from(view, position)
+            position += column_struct.size
+            name = view[position:position + name_length].decode('utf-8')
+            position += name_length
+            code = code.decode('ascii')
+            if code not in COLUMN_FORMATS:
+                raise ValueError(f'알 수 없는 열 형식입니다: {name} ({code!r})')
+            self.columns.append((name, code))
+        
+        self.sections = {}
+        for _ in range(section_count):
+            tag, offset, length = section_struct.unpack_from(view, position)
+            position += section_struct.size
+            self.sections[tag] = (offset, length)
+        
+        self.byte_order = byte_order
+        self.version = version
+        self._row = _row_struct(self.columns, byte_order)
+        if self._row.size != row_size:
+            raise ValueError('레코드 크기가 열 정의와 맞지 않습니다.')
+        self._rows_offset = self.sections[b'ROWS'][0]
+        self._heap_offset = self.sections[b'HEAP'][0]
+        
+        # 열마다 레코드 안에서 값이 시작하는 필드 번호
+        self._fields = {}
+        field = 0
+        for name, code in self.columns:
+            self._fields[name] = (field, code)
+            field += len(COLUMN_FORMATS[code])
+        self._parse_enums()
+    
+    def _parse_enums(self):
+        """ENUM 섹션에서 열거형 열마다 코드 순서의 값 리스트를 읽습니다."""
+        self._enums = {}
+        names = [name for name, code in self.columns if code == 'e']
+        if not names:
+            return
+        if b'ENUM' not in self.sections:
+            raise ValueError('열거형 열이 있는데 ENUM 섹션이 없습니다.')
+        length_struct = struct.Struct(f'{self.byte_order}H')
+        position = self.sections[b'ENUM'][0]
+        for name in names:
+            count = length_struct.unpack_from(self._view, position)[0]
+            position += length_struct.size
+            levels = []
+            for _ in range(count):
+                length = length_struct.unpack_from(self._view, position)[0]
+                position += length_struct.size
+                levels.append(self._view[position:position + length].decode('utf-8'))
+                position += length
+            self._enums[name] = levels
+    
+    def close(self):
+        """mmap과 파일을 닫습니다."""
+        view = getattr(self, '_view', None)
+        if view is not None:
+            view.close()
+            self._view = None
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __len__(self):
+        return self.record_count
+    
+    def _string(self, offset, length):
+        """문자열 힙에서 문자열 하나를 읽습니다."""
+        start = self._heap_offset + offset
+        return self._view[start:start + length].decode('utf-8')
+    
+    def _check_index(self, index):
+        if index < 0:
+            index += self.record_count
+        if not 0 <= index < self.record_count:
+            raise IndexError('레코드 번호가 범위를 벗어났습니다.')
+        return index
+    
+    def record(self, index):
+        """
+        N번째 레코드를 O(1)로 읽습니다.
+        
+        Args:
+            index (int): 레코드 번호 (음수면 뒤에서부터)
+            
+        Returns:
+            dict: 레코드 딕셔너리
+        """
+        index = self._check_index(index)
+        values = self._row.unpack_from(self._view, self._rows_offset + index * self._row.size)
+        item = {}
+        field = 0
+        for name, code in self.columns:
+            if code in _STRING_CODES:
+                item[name] = self._string(values[field], values[field + 1])
+                field += 2
+            else:
+                item[name] = self._decode(name, code, values[field])
+                field += 1
+        return item
+    
+    def _decode(self, name, code, value):
+        """숫자·열거형 필드 값을 CSV에서 읽었을 때와 같은 값으로 되돌립니다."""
+        if code in _MEASUREMENT_CODES:
+            return format_measurement(value, code == 'f')
+        if code == 'e':
+            return self._enums[name][value]
+        return value
+    
+    def value(self, index, column, raw=False):
+        """
+        N번째 레코드의 열 하나만 읽습니다 (다른 열의 문자열은 해석하지 않음).
+        
+        Args:
+            index (int): 레코드 번호
+            column (str): 열 이름
+            raw (bool): True이면 측정값(f, n)은 float('Various'는 NaN, f 열은
+                float32로 반올림된 값), 열거형(e)은 코드 그대로 돌려줍니다.
+            
+        Returns:
+            str | float | int: 열 값
+        """
+        index = self._check_index(index)
+        field, code = self._fields[column]
+        values = self._row.unpack_from(self._view, self._rows_offset + index * self._row.size)
+        if code in _STRING_CODES:
+            return self._string(values[field], values[field + 1])
+        if raw:
+            return values[field]
+        return self._decode(column, code, values[field])
+    
+    def enum_levels(self, column):
+        """
+        열거형 열의 값 리스트를 코드 순서로 돌려줍니다.
+        
+        Args:
+            column (str): 열거형 열 이름
+            
+        Returns:
+            list: 코드 순서의 값 리스트
+        """
+        return list(self._enums[column])
+    
+    def __getitem__(self, index):
+        return self.record(index)
+    
+    def __iter__(self):
+        for index in range(self.record_count):
+            yield self.record(index)
+    
+    def find(self, substance):
+        """
+        Substance 이름으로 레코드를 찾습니다 (NAME 색인 이분 탐색, O(log n)).
+        
+        Args:
+            substance (str): 찾을 물질 이름
+            
+        Returns:
+            dict: 찾은 레코드 (없으면 None)
+        """
+        if b'NAME' not in self.sections:
+            return next((item for item in self if item['Substance'] == substance), None)
+        
+        offset = self.sections[b'NAME'][0]
+        entry = struct.Struct(f'{self.byte_order}I')
+        
+        def record_at(position):
+            return entry.unpack_from(self._view, offset + position * entry.size)[0]
+        
+        position = bisect_left(
+            range(self.record_count), substance,
+            key=lambda position: self.value(record_at(position), 'Substance')
+        )
+        if position < self.record_count:
+            index = record_at(position)
+            if self.value(index, 'Substance') == substance:
+                return self.record(index)
+        return None
+    
+    def flammability_index(self):
+        """
+        파일에 저장된 인화성 색인(FIDX 섹션)을 읽습니다.
+        
+        섹션이 없는 파일이면 레코드를 읽어 색인을 새로 만듭니다.
+        돌려받은 색인의 행 번호는 이 파일의 레코드 번호입니다.
+        
+        Returns:
+            FlammabilityIndex: 인화성 색인
+        """
+        if b'FIDX' not in self.sections:
+            return FlammabilityIndex(self)
+        offset, length = self.sections[b'FIDX']
+        values = None
+        if not _fidx_has_keys(self.columns):
+            field = self._fields['Flammability'][0]
+            rows = self._view[self._rows_offset:self._rows_offset + self.record_count * self._row.size]
+            values = [record[field] for record in self._row.iter_unpack(rows)]
+        return FlammabilityIndex.from_bytes(self._view[offset:offset + length], self.byte_order, values)
+
+
+def write_flammability_index(file_path, index):
+    """
+    인벤토리 파일의 FIDX 섹션을 주어진 인화성 색인으로 바꿔 씁니다.
+    
+    insert/remove로 고친 색인을 저장할 때 씁니다. 레코드와 다른 섹션은
+    그대로 두고 임시 파일에 새로 쓴 뒤 교체합니다. 이 형식은 레코드를
+    덧붙일 수 없으므로 색인의 행 번호는 모두 파일의 레코드 번호여야 합니다.
+    
+    Args:
+        file_path (str): write_inventory_file로 쓴 인벤토리 파일 경로
+        index (FlammabilityIndex): 저장할 색인
+        
+    Returns:
+        bool: 쓰기 성공 시 True, 그렇지 않으면 False
+    """
+    temp_path = file_path + '.tmp'
+    try:
+        with InventoryFile(file_path) as inventory:
+            if not any(name == 'Flammability' for name, _ in inventory.columns):
+                raise ValueError('Flammability 열이 없는 파일입니다.')
+            if len(index) and max(index._rows) >= inventory.record_count:
+                raise ValueError('색인에 파일에 없는 행 번호가 있습니다.')
+            sections = [
+                (tag, bytes(inventory._view[offset:offset + length]))
+                for tag, (offset, length) in sorted(inventory.sections.items(), key=lambda entry: entry[1][0])
+                if tag != b'FIDX'
+            ]
+            sections.append((b'FIDX', index.to_bytes(inventory.byte_order, _fidx_has_keys(inventory.columns))))
+            columns, record_count = inventory.columns, inventory.record_count
+            byte_order, flags = inventory.byte_order, inventory.flags
+        _write_inventory_sections(temp_path, columns, record_count, sections, byte_order, flags)
+        os.replace(temp_path, file_path)
+        return True
+    except FileNotFoundError:
+        print(f'오류: 이진 파일 {file_path}을(를) 찾을 수 없습니다.')
+        return False
+    except Exception as e:
+        print(f'인화성 색인 {file_path}에 쓰기 오류: {str(e)}')
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+
+def read_inventory_file(file_path):
+    """
+    고정 레이아웃 이진 인벤토리 파일의 모든 레코드를 읽습니다.
+    
+    Args:
+        file_path (str): 인벤토리 파일 경로
+        
+    Returns:
+        list: 인벤토리 데이터를 포함하는 딕셔너리 리스트
+    """
+    try:
+        with InventoryFile(file_path) as inventory:
+            return list(inventory)
+    except FileNotFoundError:
+        print(f'오류: 이진 파일 {file_path}을(를) 찾을 수 없습니다.')
+        return []
+    except Exception as e:
+        print(f'이진 파일 읽기 오류: {str(e)}')
+        return []
+
+
+def _compress_block(payload, codec, level):
+    """블록 내용 하나를 codec으로 압축합니다 (level이 None이면 코덱 기본값)."""
+    if codec == 'zlib':
+        return zlib.compress(payload, -1 if level is None else level)
+    # 블록은 작으므로 사전 크기를 블록 크기로 줄여 블록마다 푸는 쪽의 준비 비용을 줄임
+    filters = [{'id': lzma.FILTER_LZMA2, 'preset': 6 if level is None else level,
+                'dict_size': max(len(payload), 4096)}]
+    return lzma.compress(payload, filters=filters)
+
+
+def write_compressed_binary_file(data, file_path, codec='zlib', block_records=COMPRESSED_BLOCK_RECORDS,
+                                 level=None, sort_by_name=True):
+    """
+    인벤토리 데이터를 블록 단위로 압축한 이진 파일에 씁니다 (보관용 스냅숏).
+    
+    레코드를 block_records개씩 묶어 write_binary_file과 같은 레코드 인코딩으로
+    이어 붙인 뒤 블록마다 zlib 또는 lzma로 압축하고, 압축 전 내용의 CRC32를
+    함께 적습니다. 파일 끝의 블록 색인에는 블록마다 위치, 압축 길이, 레코드
+    수, CRC32와 블록 안의 가장 작은·큰 Substance 이름을 저장합니다.
+    
+    sort_by_name이면 레코드를 Substance 순서로 정렬해서 쓰므로, 이름 하나를
+    찾을 때 색인을 이분 탐색해서 블록 하나만 풀면 됩니다
+    (CompressedInventoryFile.find). 인화성 순서가 필요하면 읽은 뒤
+    sort_by_flammability나 top_dangerous_items를 쓰면 됩니다.
+    
+    기존 write_binary_file 출력과 비교 (benchmark.py 'compressed' 항목,
+    합성 레코드 100만 개, 원본 55MB 기준):
+    
+    - 크기: 길이 접두사와 반복되는 측정값·강도 문자열이 잘 압축돼 zlib은
+      약 1/8(6.5MB), lzma는 약 1/12(4.7MB)입니다.
+    - 쓰기: 정렬과 압축 비용이 더해져 zlib은 원본의 2~3배, lzma는 10배
+      넘게 걸립니다.
+    - 전체 읽기: zlib은 read_binary_file의 1.3배, lzma는 풀기가 느려
+      1.6배 정도 걸립니다. 디스크에서 읽는 바이트는 크기만큼 줄어듭니다.
+    - 이름 하나 찾기: 블록 하나(기본 1024개 레코드)만 읽고 풀므로 파일
+      크기와 관계없이 1ms 안쪽입니다. 원본 형식은 처음부터 훑어야 합니다.
+    
+    block_records를 키우면 압축률이 조금 좋아지는 대신 찾기 한 번에 푸는
+    양이 늘어납니다.
+    
+    Args:
+        data (iterable): 인벤토리 데이터를 포함하는 딕셔너리들
+        file_path (str): 출력 이진 파일 경로
+        codec (str): 'zlib' 또는 'lzma'
+        block_records (int): 블록 하나에 넣는 레코드 수
+        level (int): 압축 수준 (zlib 0~9, lzma 0~9, None이면 코덱 기본값)
+        sort_by_name (bool): Substance 순서로 정렬해서 쓸지 여부
+        
+    Returns:
+        bool: 쓰기 성공 시 True, 그렇지 않으면 False
+    """
+    try:
+        if codec not in BLOCK_CODECS:
+            raise ValueError(f'지원하지 않는 압축 방식입니다: {codec}')
+        if block_records < 1:
+            raise ValueError('블록당 레코드 수는 1 이상이어야 합니다.')
+        if sort_by_name:
+            data = sorted(data, key=itemgetter('Substance'))
+        
+        records = iter(data)
+        record_count = 0
+        index = []
+        with open(file_path, 'wb') as file:
+            file.write(bytes(_BLOCK_HEADER.size))
+            while True:
+                block = list(islice(records, block_records))
+                if not block:
+                    break
+                payload = b''.join(
+                    _pack_legacy_record(
+                        *(str(item[field]) for field in LEGACY_STRING_FIELDS), item['Flammability']
+                    )
+                    for item in block
+                )
+                compressed = _compress_block(payload, codec, level)
+                names = [str(item['Substance']) for item in block]
+                index.append((file.tell(), len(compressed), len(block), zlib.crc32(payload),
+                              min(names).encode('utf-8'), max(names).encode('utf-8')))
+                file.write(compressed)
+                record_count += len(block)
+            
+            index_offset = file.tell()
+            for offset, length, count, crc, first, last in index:
+                file.write(_BLOCK_ENTRY.pack(offset, length, count, crc, len(first), len(last)))
+                file.write(first)
+                file.write(last)
+            
+            flags = BLOCK_SORTED_BY_NAME if sort_by_name else 0
+            file.seek(0)
+            file.write(_BLOCK_HEADER.pack(BLOCK_MAGIC, BLOCK_VERSION, BLOCK_CODECS[codec], flags,
+                                          block_records, record_count, index_offset, len(index)))
+        return True
+    except Exception as e:
+        print(f'이진 파일 {file_path}에 쓰기 오류: {str(e)}')
+        return False
+
+
+class CompressedInventoryFile:
+    """
+    write_compressed_binary_file로 쓴 블록 압축 인벤토리 읽기 도구
+    
+    열 때는 헤더와 블록 색인만 읽고, 블록은 필요할 때 하나씩 읽어서
+    CRC32를 확인한 뒤 풉니다. 마지막으로 푼 블록 하나는 기억해 두므로
+    같은 블록 안의 이름을 이어서 찾으면 다시 풀지 않습니다.
+    """
+    
+    def __init__(self, file_path):
+        """
+        CompressedInventoryFile 초기화
+        
+        Args:
+            file_path (str): 블록 압축 인벤토리 파일 경로
+            
+        Raises:
+            ValueError: 블록 압축 형식이 아니거나 지원하지 않는 버전·코덱인 경우
+        """
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        try:
+            self._parse_header()
+        except Exception:
+            self.close()
+            raise
+        self._cached = (None, None)
+    
+    def _parse_header(self):
+        """헤더와 블록 색인을 읽습니다."""
+        file = self._file
+        header = file.read(_BLOCK_HEADER.size)
+        if len(header) < _BLOCK_HEADER.size or header[:len(BLOCK_MAGIC)] != BLOCK_MAGIC:
+            raise ValueError(f'{self.file_path}은(는) 블록 압축 인벤토리 파일이 아닙니다.')
+        (_, version, codec, self.flags, self.block_records, self.record_count,
+         index_offset, block_count) = _BLOCK_HEADER.unpack(header)
+        if version > BLOCK_VERSION:
+            raise ValueError(f'지원하지 않는 블록 압축 파일 버전입니다: {version}')
+        codecs = {code: name for name, code in BLOCK_CODECS.items()}
+        if codec not in codecs:
+            raise ValueError(f'알 수 없는 압축 방식입니다: {codec}')
+        self.codec = codecs[codec]
+        
+        file.seek(index_offset)
+        view = memoryview(file.read())
+        self._blocks = []
+        self._min_names = []
+        self._max_names = []
+        position = 0
+        for _ in range(block_count):
+            offset, length, count, crc, first_length, last_length = (
+                _BLOCK_ENTRY.unpack_from(view, position)
+            )
+            position += _BLOCK_ENTRY.size
+            self._min_names.append(str(view[position:position + first_length], 'utf-8'))
+            position += first_length
+            self._max_names.append(str(view[position:position + last_length], 'utf-8'))
+            position += last_length
+            self._blocks.append((offset, length, count, crc))
+    
+    def close(self):
+        """파일을 닫습니다."""
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __len__(self):
+        return self.record_count
+    
+    @property
+    def block_count(self):
+        """블록 수"""
+        return len(self._blocks)
+    
+    def _payload(self, index):
+        """index번째 블록을 읽어 CRC32를 확인하고 푼 내용을 돌려줍니다 (마지막 블록은 기억함)."""
+        cached_index, payload = self._cached
+        if cached_index == index:
+            return payload
+        offset, length, count, crc = self._blocks[index]
+        self._file.seek(offset)
+        compressed = self._file.read(length)
+        if self.codec == 'zlib':
+            payload = zlib.decompress(compressed)
+        else:
+            payload = lzma.decompress(compressed)
+        if zlib.crc32(payload) != crc:
+            raise ValueError(f'{index}번째 블록의 CRC32가 맞지 않습니다.')
+        self._cached = (index, payload)
+        return payload
+    
+    @staticmethod
+    def _decode_record(payload, position):
+        """payload의 position에서 레코드 하나를 디코딩해서 (레코드, 다음 위치)를 돌려줍니다."""
+        # memoryview 조각을 str()로 디코딩하는 것보다 bytes 조각의 decode가 빠름
+        unpack_length = _U32.unpack_from
+        item = {}
+        for field in LEGACY_STRING_FIELDS:
+            length = unpack_length(payload, position)[0]
+            position += 4
+            item[field] = payload[position:position + length].decode('utf-8')
+            position += length
+        item['Flammability'] = _F32.unpack_from(payload, position)[0]
+        return item, position + 4
+    
+    def block(self, index):
+        """
+        index번째 블록의 레코드를 읽습니다.
+        
+        Args:
+            index (int): 블록 번호
+            
+        Returns:
+            list: 레코드 딕셔너리 리스트
+            
+        Raises:
+            ValueError: 블록 내용의 CRC32가 색인과 다른 경우
+        """
+        payload = self._payload(index)
+        decode_record = self._decode_record
+        records = []
+        position = 0
+        for _ in range(self._blocks[index][2]):
+            item, position = decode_record(payload, position)
+            records.append(item)
+        return records
+    
+    def find(self, substance):
+        """
+        Substance 이름으로 레코드를 찾습니다.
+        
+        이름 순서로 쓴 파일은 블록 색인을 이분 탐색해서 블록 하나만 풉니다.
+        그렇지 않은 파일은 이름 범위에 substance가 들어가는 블록만 풉니다.
+        블록 안에서는 이름 바이트만 비교하고 찾은 레코드만 디코딩합니다.
+        
+        Args:
+            substance (str): 찾을 물질 이름
+            
+        Returns:
+            dict: 찾은 레코드 (없으면 None)
+        """
+        if self.flags & BLOCK_SORTED_BY_NAME:
+            start = bisect_left(self._max_names, substance)
+            candidates = range(start, min(start + 1, self.block_count))
+        else:
+            candidates = range(self.block_count)
+        
+        key = substance.encode('utf-8')
+        unpack_length = _U32.unpack_from
+        for index in candidates:
+            if not self._min_names[index] <= substance <= self._max_names[index]:
+                continue
+            payload = self._payload(index)
+            position = 0
+            for _ in range(self._blocks[index][2]):
+                length = unpack_length(payload, position)[0]
+                if payload[position + 4:position + 4 + length] == key:
+                    return self._decode_record(payload, position)[0]
+                position += 4 + length
+                for _ in range(len(LEGACY_STRING_FIELDS) - 1):
+                    position += 4 + unpack_length(payload, position)[0]
+                position += 4  # 인화성 float
+        return None
+    
+    def __iter__(self):
+        for index in range(self.block_count):
+            yield from self.block(index)
+
+
+def read_compressed_binary_file(file_path):
+    """
+    블록 압축 이진 인벤토리 파일의 모든 레코드를 읽습니다.
+    
+    Args:
+        file_path (str): 블록 압축 인벤토리 파일 경로
+        
+    Returns:
+        list: 인벤토리 데이터를 포함하는 딕셔너리 리스트
+    """
+    try:
+        with CompressedInventoryFile(file_path) as inventory:
+            return list(inventory)
+    except FileNotFoundError:
+        print(f'오류: 이진 파일 {file_path}을(를) 찾을 수 없습니다.')
+        return []
+    except Exception as e:
+        print(f'이진 파일 읽기 오류: {str(e)}')
+        return []
+
+
+class Inventory:
+    """
+    열 단위(columnar)로 저장하는 인벤토리 컨테이너
+    
+    딕셔너리 리스트 대신 열마다 하나의 시퀀스를 둡니다. 숫자 열
+    (NUMERIC_FIELDS)은 array('d') 또는 NumPy 배열에, 문자열 열은 intern한
+    문자열 리스트에 저장합니다. 정렬은 행 번호만 정렬하는 argsort로,
+    필터는 열 하나를 비교한 마스크로 하고, 결과는 take/compress로 열마다
+    한 번에 모읍니다.
+    
+    측정값 열(MEASUREMENT_FIELDS)은 모든 값이 parse_measurement를 통과하면
+    float 배열('Various'는 NaN)로 저장해서 숫자로 정렬·비교할 수 있습니다.
+    NaN은 정렬 방향과 관계없이 맨 뒤에 오고, '!='을 뺀 비교에서는 항상
+    False입니다. 행으로 꺼낼 때는 원래 CSV 텍스트로 되돌립니다.
+    
+    반복하거나 정수 인덱스로 접근하면 행을 딕셔너리로 돌려주므로
+    print_inventory, write_csv_file, write_binary_file에 그대로 넘길 수 있고,
+    sort_by_flammability와 filter_dangerous_items는 Inventory를 받으면
+    열 단위 경로를 씁니다.
+    """
+    
+    def __init__(self, columns, backend=None):
+        """
+        Inventory 초기화
+        
+        Args:
+            columns (dict): {열 이름: 값 시퀀스} (열 순서가 곧 필드 순서)
+            backend (str): 'array', 'numpy' 또는 None(NumPy가 있으면 'numpy')
+        
+        Raises:
+            ValueError: 백엔드 이름이 잘못됐거나 열 길이가 서로 다른 경우
+            ImportError: 'numpy' 백엔드를 골랐는데 NumPy가 없는 경우
+        """
+        if backend is None:
+            backend = 'numpy' if np is not None else 'array'
+        if backend not in ('array', 'numpy'):
+            raise ValueError(f'알 수 없는 백엔드입니다: {backend!r}')
+        if backend == 'numpy' and np is None:
+            raise ImportError('numpy 백엔드를 쓰려면 NumPy가 설치되어 있어야 합니다.')
+        
+        self.backend = backend
+        self.fieldnames = list(columns)
+        self._columns = {}
+        self._numeric = set()
+        self._measurements = set()
+        for name, values in columns.items():
+            if name in NUMERIC_FIELDS:
+                self._columns[name] = self._float_column(map(float, values))
+                self._numeric.add(name)
+                continue
+            if name in MEASUREMENT_FIELDS:
+                values = list(values)
+                try:
+                    numbers = [
+                        value if isinstance(value, float) else parse_measurement(value)
+                        for value in values
+                    ]
+                except ValueError:
+                    pass  # 텍스트로 되돌릴 수 없는 값이 있으면 문자열 열로 둔다
+                else:
+                    self._columns[name] = self._float_column(numbers)
+                    self._numeric.add(name)
+                    self._measurements.add(name)
+                    continue
+            self._columns[name] = [sys.intern(str(value)) for value in values]
+        
+        lengths = {len(values) for values in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError('열의 길이가 서로 다릅니다.')
+        self._length = lengths.pop() if lengths else 0
+    
+    @classmethod
+    def from_records(cls, records, fieldnames=None, backend=None):
+        """
+        딕셔너리 리스트(read_csv_file의 결과 등)로 Inventory를 만듭니다.
+        
+        Args:
+            records (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+            fieldnames (list): 열 이름 리스트 (기본값은 첫 레코드의 키)
+            backend (str): 'array', 'numpy' 또는 None
+            
+        Returns:
+            Inventory: 열 단위 인벤토리
+        """
+        records = list(records)
+        if fieldnames is None:
+            fieldnames = list(records[0].keys()) if records else []
+        columns = {name: [item[name] for item in records] for name in fieldnames}
+        return cls(columns, backend)
+    
+    def _float_column(self, values):
+        """백엔드에 맞는 float64 열을 만듭니다."""
+        if self.backend == 'numpy':
+            return np.fromiter(values, dtype=np.float64)
+        return array('d', values)
+    
+    def _derive(self, columns):
+        """변환 없이 같은 백엔드·필드 순서로 새 Inventory를 만듭니다."""
+        inventory = object.__new__(Inventory)
+        inventory.backend = self.backend
+        inventory.fieldnames = self.fieldnames
+        inventory._columns = columns
+        inventory._numeric = self._numeric
+        inventory._measurements = self._measurements
+        inventory._length = len(next(iter(columns.values()))) if columns else 0
+        return inventory
+    
+    def __len__(self):
+        return self._length
+    
+    def _python_columns(self):
+        """행을 만들 때 쓸, 값이 파이썬 객체(측정값은 CSV 텍스트)인 열 리스트"""
+        columns = []
+        for name, values in self._columns.items():
+            if self.backend == 'numpy' and name in self._numeric:
+                values = values.tolist()
+            if name in self._measurements:
+                values = list(map(format_measurement, values))
+            columns.append(values)
+        return columns
+    
+    def row(self, index):
+        """
+        index번째 행을 딕셔너리로 돌려줍니다.
+        
+        Args:
+            index (int): 행 번호 (음수면 뒤에서부터)
+            
+        Returns:
+            dict: 행 딕셔너리
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('행 번호가 범위를 벗어났습니다.')
+        item = {}
+        for name, values in self._columns.items():
+            value = values[index]
+            if name in self._measurements:
+                value = format_measurement(float(value))
+            elif name in self._numeric:
+                value = float(value)
+            item[name] = value
+        return item
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(self._length)))
+        return self.row(index)
+    
+    def __iter__(self):
+        names = self.fieldnames
+        for values in zip(*self._python_columns()):
+            yield dict(zip(names, values))
+    
+    def __repr__(self):
+        return f'Inventory({self._length} rows, backend={self.backend!r})'
+    
+    def is_numeric(self, name):
+        """
+        열이 float 배열로 저장되어 있는지 돌려줍니다.
+        
+        Args:
+            name (str): 열 이름
+            
+        Returns:
+            bool: 숫자 열(NUMERIC_FIELDS, 숫자로 바꾼 측정값 열)이면 True
+        """
+        return name in self._numeric
+    
+    def column(self, name):
+        """
+        열 하나를 그대로 돌려줍니다 (복사하지 않음).
+        
+        Args:
+            name (str): 열 이름
+            
+        Returns:
+            array, numpy.ndarray 또는 list: 열 값
+        """
+        return self._columns[name]
+    
+    def argsort(self, name, reverse=False):
+        """
+        열 값 순서대로 행 번호를 정렬합니다.
+        
+        sorted()와 같은 안정 정렬이라, reverse=True여도 값이 같은 행은
+        원래 순서를 유지합니다. 측정값 열의 'Various'(NaN)는 맨 뒤에 옵니다.
+        
+        Args:
+            name (str): 정렬 기준 열 이름
+            reverse (bool): 내림차순 여부
+            
+        Returns:
+            list 또는 numpy.ndarray: 정렬된 행 번호
+        """
+        values = self._columns[name]
+        if self.backend == 'numpy' and name in self._numeric:
+            # NumPy는 NaN을 오름차순 맨 뒤에 두고, 부호를 바꿔도 NaN은 그대로다
+            return np.argsort(-values if reverse else values, kind='stable')
+        if name in self._measurements:
+            known = [row for row, value in enumerate(values) if value == value]
+            various = [row for row, value in enumerate(values) if value != value]
+            return sorted(known, key=values.__getitem__, reverse=reverse) + various
+        return sorted(range(self._length), key=values.__getitem__, reverse=reverse)
+    
+    def take(self, indices):
+        """
+        주어진 행 번호의 행들로 새 Inventory를 만듭니다.
+        
+        Args:
+            indices (iterable): 행 번호
+            
+        Returns:
+            Inventory: 선택한 행으로 이루어진 Inventory
+        """
+        if self.backend == 'numpy':
+            indices = np.asarray(indices, dtype=np.intp)
+            positions = indices.tolist()
+        else:
+            positions = indices if isinstance(indices, (list, range)) else list(indices)
+        columns = {}
+        for name, values in self._columns.items():
+            if name not in self._numeric:
+                columns[name] = list(map(values.__getitem__, positions))
+            elif self.backend == 'numpy':
+                columns[name] = values[indices]
+            else:
+                columns[name] = array('d', map(values.__getitem__, positions))
+        return self._derive(columns)
+    
+    def sort_by(self, name, reverse=False):
+        """
+        열 값 순서대로 정렬한 새 Inventory를 돌려줍니다.
+        
+        Args:
+            name (str): 정렬 기준 열 이름
+            reverse (bool): 내림차순 여부
+            
+        Returns:
+            Inventory: 정렬된 Inventory
+        """
+        return self.take(self.argsort(name, reverse))
+    
+    def mask(self, name, op, value):
+        """
+        열 값을 value와 비교한 불리언 마스크를 만듭니다.
+        
+        Args:
+            name (str): 비교할 열 이름
+            op (str): MASK_OPERATORS의 비교 연산자 ('>=', '<', '==' 등)
+            value: 비교할 값
+            
+        Returns:
+            list 또는 numpy.ndarray: 행마다 True/False
+        """
+        compare = MASK_OPERATORS.get(op)
+        if compare is None:
+            raise ValueError(f'알 수 없는 비교 연산자입니다: {op!r}')
+        values = self._columns[name]
+        if self.backend == 'numpy' and name in self._numeric:
+            return compare(values, value)
+        return list(map(compare, values, repeat(value)))
+    
+    def compress(self, mask):
+        """
+        마스크가 True인 행만 남긴 새 Inventory를 돌려줍니다.
+        
+        Args:
+            mask (sequence): 행마다 True/False (mask()의 결과)
+            
+        Returns:
+            Inventory: 필터링된 Inventory
+        """
+        if len(mask) != self._length:
+            raise ValueError('마스크 길이가 행 수와 다릅니다.')
+        if self.backend == 'numpy':
+            mask = np.asarray(mask, dtype=bool)
+        columns = {}
+        for name, values in self._columns.items():
+            if name not in self._numeric:
+                columns[name] = list(compress(values, mask))
+            elif self.backend == 'numpy':
+                columns[name] = values[mask]
+            else:
+                columns[name] = array('d', compress(values, mask))
+        return self._derive(columns)
+
+
+def read_csv_inventory(file_path, backend=None):
+    """
+    CSV 파일을 행 딕셔너리를 만들지 않고 곧바로 Inventory로 읽습니다.
+    
+    Args:
+        file_path (str): CSV 파일 경로
+        backend (str): 'array', 'numpy' 또는 None(NumPy가 있으면 'numpy')
+        
+    Returns:
+        Inventory: 열 단위 인벤토리 (오류가 나면 빈 Inventory)
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            fieldnames = next(reader, [])
+            columns = {name: [] for name in fieldnames}
+            appenders = [column.append for column in columns.values()]
+            for row in reader:
+                if not row:
+                    continue
+                for append, value in zip(appenders, row):
+                    append(value)
+        return Inventory(columns, backend)
+    except FileNotFoundError:
+        print(f'오류: 파일 {file_path}을(를) 찾을 수 없습니다.')
+    except Exception as e:
+        print(f'파일 읽기 오류: {str(e)}')
+    return Inventory({}, backend)
+
+
+def _query_number(value):
+    """쿼리에서 숫자와 비교할 값을 float로 바꿉니다 (숫자가 아니면 NaN)."""
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')  # 'Various' 등은 '!='을 뺀 비교에서 항상 False
+
+
+def _query_text(field):
+    """쿼리에서 문자열과 비교할 값을 텍스트로 바꾸는 함수를 고릅니다."""
+    return format_measurement if field in MEASUREMENT_FIELDS else str
+
+
+class _QueryParser:
+    """
+    쿼리 텍스트를 구문 트리로 바꾸는 재귀 하강 파서
+    
+    문법 (우선순위가 낮은 것부터):
+        식   := 그리고 ('or' 그리고)*
+        그리고 := 부정 ('and' 부정)*
+        부정  := 'not' 부정 | '(' 식 ')' | 비교
+        비교  := 필드 연산자 값
+    
+    트리 노드는 ('or', 왼쪽, 오른쪽), ('and', 왼쪽, 오른쪽), ('not', 노드),
+    ('cmp', 필드, 연산자, 값) 튜플입니다.
+    """
+    
+    def __init__(self, text):
+        self.text = text
+        self.tokens = []
+        position = 0
+        while position < len(text):
+            match = QUERY_TOKEN.match(text, position)
+            if match is None:
+                raise self.error('알 수 없는 글자입니다', position)
+            if match.lastgroup != 'space':
+                self.tokens.append((match.lastgroup, match.group(), position))
+            position = match.end()
+        self.tokens.append(('end', '', len(text)))
+        self.position = 0
+    
+    def error(self, message, position=None):
+        """쿼리 텍스트의 위치를 붙인 ValueError를 만듭니다."""
+        if position is None:
+            position = self.tokens[self.position][2]
+        return ValueError(f'쿼리 구문 오류 ({position + 1}번째 글자): {message}: {self.text!r}')
+    
+    def peek(self):
+        return self.tokens[self.position]
+    
+    def take(self):
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+    
+    def keyword(self, word):
+        """다음 토큰이 키워드 word이면 건너뛰고 True를 돌려줍니다."""
+        kind, value, _ = self.peek()
+        if kind == 'name' and value.lower() == word:
+            self.position += 1
+            return True
+        return False
+    
+    def parse(self):
+        node = self.parse_or()
+        if self.peek()[0] != 'end':
+            raise self.error('식이 끝나야 할 곳에 다른 토큰이 있습니다')
+        return node
+    
+    def parse_or(self):
+        node = self.parse_and()
+        while self.keyword('or'):
+            node = ('or', node, self.parse_and())
+        return node
+    
+    def parse_and(self):
+        node = self.parse_not()
+        while self.keyword('and'):
+            node = ('and', node, self.parse_not())
+        return node
+    
+    def parse_not(self):
+        if self.keyword('not'):
+            return ('not', self.parse_not())
+        if self.peek()[0] == 'open':
+            self.take()
+            node = self.parse_or()
+            if self.take()[0] != 'close':
+                raise self.error("')'가 필요합니다", self.tokens[self.position - 1][2])
+            return node
+        return self.parse_comparison()
+    
+    def parse_comparison(self):
+        kind, value, position = self.take()
+        if kind == 'field':
+            field = value[1:-1]
+        elif kind == 'name' and value.lower() not in QUERY_KEYWORDS:
+            field = value
+        else:
+            raise self.error('필드 이름이 필요합니다', position)
+        
+        kind, op, position = self.take()
+        if kind != 'op':
+            raise self.error(f'비교 연산자({", ".join(MASK_OPERATORS)})가 필요합니다', position)
+        
+        kind, value, position = self.take()
+        if kind == 'number':
+            value = float(value)
+        elif kind == 'string':
+            value = re.sub(r'\\(.)', r'\1', value[1:-1])
+        else:
+            raise self.error('숫자나 따옴표로 감싼 문자열 값이 필요합니다', position)
+        return ('cmp', field, op, value)
+
+
+def _query_fields(node):
+    """구문 트리에서 비교에 쓴 필드 이름을 나온 순서대로 돌려줍니다."""
+    if node[0] == 'cmp':
+        yield node[1]
+    else:
+        for child in node[1:]:
+            yield from _query_fields(child)
+
+
+def _compile_predicate(node):
+    """구문 트리를 레코드 딕셔너리 하나를 받는 클로저로 바꿉니다."""
+    kind = node[0]
+    if kind == 'and':
+        left, right = _compile_predicate(node[1]), _compile_predicate(node[2])
+        return lambda item: left(item) and right(item)
+    if kind == 'or':
+        left, right = _compile_predicate(node[1]), _compile_predicate(node[2])
+        return lambda item: left(item) or right(item)
+    if kind == 'not':
+        operand = _compile_predicate(node[1])
+        return lambda item: not operand(item)
+    
+    _, field, op, value = node
+    compare = MASK_OPERATORS[op]
+    if isinstance(value, float):
+        def predicate(item):
+            found = item[field]
+            if type(found) is not float:
+                found = _query_number(found)
+            return compare(found, value)
+    else:
+        to_text = _query_text(field)
+        
+        def predicate(item):
+            found = item[field]
+            if type(found) is not str:
+                found = to_text(found)
+            return compare(found, value)
+    return predicate
+
+
+def _compile_mask(node):
+    """구문 트리를 Inventory 하나를 받아 불리언 마스크를 만드는 함수로 바꿉니다."""
+    kind = node[0]
+    if kind in ('and', 'or'):
+        left, right = _compile_mask(node[1]), _compile_mask(node[2])
+        combine = operator.and_ if kind == 'and' else operator.or_
+        
+        def mask(inventory):
+            first, second = left(inventory), right(inventory)
+            if inventory.backend == 'numpy':
+                return combine(np.asarray(first, dtype=bool), np.asarray(second, dtype=bool))
+            return list(map(combine, first, second))
+        return mask
+    if kind == 'not':
+        operand = _compile_mask(node[1])
+        
+        def mask(inventory):
+            values = operand(inventory)
+            if inventory.backend == 'numpy':
+                return ~np.asarray(values, dtype=bool)
+            return [not value for value in values]
+        return mask
+    
+    _, field, op, value = node
+    numeric = isinstance(value, float)
+    convert = _query_number if numeric else _query_text(field)
+    
+    def mask(inventory):
+        if inventory.is_numeric(field) == numeric:
+            return inventory.mask(field, op, value)
+        # 열 형식과 값 형식이 다르면 행마다 바꿔서 비교
+        values = inventory.column(field)
+        if not isinstance(values, list):
+            values = values.tolist()  # array·NumPy 배열을 파이썬 float로
+        return list(map(MASK_OPERATORS[op], map(convert, values), repeat(value)))
+    return mask
+
+
+class InventoryQuery:
+    """
+    한 번 파싱해서 컴파일한 인벤토리 쿼리
+    
+    "Flammability >= 0.7 and Strength == 'Weak'"처럼 필드, 비교 연산자
+    (MASK_OPERATORS), 값을 and/or/not과 괄호로 묶은 식을 받습니다.
+    이름에 공백이나 괄호가 있는 필드는 `Weight (g/cm³)`처럼 백틱으로
+    감싸고, 문자열 값은 작은따옴표나 큰따옴표로 감쌉니다.
+    
+    식은 두 가지로 컴파일합니다. 딕셔너리 레코드에는 비교마다 클로저
+    하나를 만들어 and/or로 이어 붙이고(짧은 회로 평가), Inventory에는
+    비교마다 Inventory.mask로 열 마스크를 만들어 열 단위로 합칩니다.
+    
+    숫자 값과 비교하면 'Various'처럼 숫자가 아닌 필드 값은 NaN으로 보므로
+    '!='을 뺀 비교에서 항상 False입니다. compile_query로 만들면 같은
+    텍스트의 쿼리는 다시 파싱하지 않습니다.
+    
+    필드 이름은 대소문자까지 정확해야 합니다. filter/stream/mask는 처음
+    레코드(또는 Inventory의 열 이름)로 필드를 확인하고, 없는 필드가
+    있으면 ValueError를 냅니다.
+    """
+    
+    def __init__(self, text):
+        """
+        InventoryQuery 초기화
+        
+        Args:
+            text (str): 쿼리 텍스트
+            
+        Raises:
+            ValueError: 쿼리 구문이 잘못된 경우
+        """
+        self.text = text
+        self.tree = _QueryParser(text).parse()
+        self.fields = tuple(dict.fromkeys(_query_fields(self.tree)))
+        self.matches = _compile_predicate(self.tree)
+        self._mask = _compile_mask(self.tree)
+    
+    def __call__(self, item):
+        return self.matches(item)
+    
+    def __repr__(self):
+        return f'InventoryQuery({self.text!r})'
+    
+    def check_fields(self, fieldnames):
+        """
+        쿼리에 쓴 필드가 모두 fieldnames에 있는지 확인합니다.
+        
+        Args:
+            fieldnames (iterable): 사용할 수 있는 필드 이름
+            
+        Raises:
+            ValueError: 없는 필드가 있는 경우
+        """
+        fieldnames = list(fieldnames)
+        unknown = [field for field in self.fields if field not in fieldnames]
+        if unknown:
+            raise ValueError(
+                f'쿼리에 알 수 없는 필드가 있습니다: {", ".join(unknown)} '
+                f'(사용할 수 있는 필드: {", ".join(fieldnames)})'
+            )
+    
+    def mask(self, inventory):
+        """
+        Inventory의 행마다 쿼리를 만족하는지 나타내는 마스크를 만듭니다.
+        
+        Args:
+            inventory (Inventory): 열 단위 인벤토리
+            
+        Returns:
+            list 또는 numpy.ndarray: 행마다 True/False
+            
+        Raises:
+            ValueError: 쿼리에 Inventory에 없는 필드가 있는 경우
+        """
+        self.check_fields(inventory.fieldnames)
+        return self._mask(inventory)
+    
+    def stream(self, items):
+        """
+        쿼리를 만족하는 항목만 하나씩 돌려주는 제너레이터
+        
+        Args:
+            items (iterable): 레코드 딕셔너리들
+            
+        Yields:
+            dict: 쿼리를 만족하는 항목
+            
+        Raises:
+            ValueError: 쿼리에 첫 레코드에 없는 필드가 있는 경우
+        """
+        items = iter(items)
+        first = next(items, None)
+        if first is None:
+            return
+        self.check_fields(first.keys())
+        yield from filter(self.matches, chain((first,), items))
+    
+    def filter(self, inventory_list):
+        """
+        쿼리를 만족하는 항목만 남깁니다.
+        
+        Args:
+            inventory_list (iterable): 딕셔너리들 또는 Inventory
+            
+        Returns:
+            list: 필터링된 딕셔너리 리스트 (Inventory를 받으면 필터링된 Inventory)
+            
+        Raises:
+            ValueError: 쿼리에 없는 필드가 있는 경우
+        """
+        if isinstance(inventory_list, Inventory):
+            return inventory_list.compress(self.mask(inventory_list))
+        return list(self.stream(inventory_list))
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def compile_query(text):
+    """
+    쿼리 텍스트를 InventoryQuery로 컴파일합니다 (텍스트별로 캐시).
+    
+    Args:
+        text (str): 쿼리 텍스트 (예: "Flammability >= 0.7 and Strength == 'Weak'")
+        
+    Returns:
+        InventoryQuery: 컴파일한 쿼리
+        
+    Raises:
+        ValueError: 쿼리 구문이 잘못된 경우
+    """
+    return InventoryQuery(text)
+
+
+def filter_inventory(inventory_list, query):
+    """
+    쿼리를 만족하는 항목만 필터링합니다.
+    
+    filter_dangerous_items는 인화성 임계값 하나만 받지만, 이 함수는
+    compile_query의 식을 받습니다.
+    
+    Args:
+        inventory_list (iterable): 딕셔너리들 또는 Inventory
+        query (str | InventoryQuery): 쿼리 텍스트 또는 컴파일한 쿼리
+        
+    Returns:
+        list: 필터링된 딕셔너리 리스트 (Inventory를 받으면 필터링된 Inventory)
+        
+    Raises:
+        ValueError: 쿼리 구문이 잘못됐거나 없는 필드가 있는 경우
+    """
+    if isinstance(query, str):
+        query = compile_query(query)
+    return query.filter(inventory_list)
+
+
+def measure_column_widths(inventory_list, fieldnames=None, sample_size=1000):
+    """
+    표본 행의 값 길이로 열 너비를 정합니다.
+    
+    길이와 인덱스가 있는 인벤토리(리스트, Inventory, InventoryFile)는
+    전체에서 고르게 떨어진 sample_size행을, 그 밖의 반복 가능한 객체는
+    처음 sample_size행을 봅니다. 표본 밖에 더 긴 값이 있으면 그 행만
+    열이 밀립니다.
+    
+    Args:
+        inventory_list (iterable): 인벤토리 항목
+        fieldnames (list): 열 이름 리스트 (기본값은 첫 행의 키)
+        sample_size (int): 볼 행 수
+        
+    Returns:
+        dict: {열 이름: 너비}
+    """
+    if _is_sequence(inventory_list):
+        step = max(1, len(inventory_list) // sample_size)
+        sample = [inventory_list[index] for index in range(0, len(inventory_list), step)]
+    else:
+        sample = list(islice(inventory_list, sample_size))
+    if fieldnames is None:
+        fieldnames = list(sample[0].keys()) if sample else list(INVENTORY_COLUMN_WIDTHS)
+    return {
+        name: max([len(name)] + [len(str(item[name])) for item in sample])
+        for name in fieldnames
+    }
+
+
+def _is_sequence(inventory_list):
+    """길이와 정수 인덱스로 접근할 수 있는 인벤토리인지 확인합니다."""
+    return hasattr(inventory_list, '__len__') and hasattr(inventory_list, '__getitem__')
+
+
+def render_inventory(inventory_list, file=None, widths=None, head=None, tail=None,
+                     page_size=None, block_rows=RENDER_BLOCK_ROWS):
+    """
+    인벤토리 표를 큰 버퍼에 모아 블록 단위로 씁니다.
+    
+    행 형식 문자열을 한 번만 만들고, block_rows행씩 모아 file.write를
+    한 번 부르므로 행마다 print하는 것보다 훨씬 빠릅니다. head/tail을
+    주면 앞뒤 몇 행만 쓰고 가운데는 생략한 행 수만 알려 줍니다.
+    리스트처럼 인덱스가 있는 인벤토리는 생략한 행을 건드리지 않고,
+    제너레이터는 끝까지 세면서 마지막 tail행만 남깁니다.
+    
+    Args:
+        inventory_list (iterable): 인벤토리 항목 (리스트, 제너레이터, Inventory 등)
+        file: 출력 스트림 (기본값 sys.stdout)
+        widths (dict | str): {열 이름: 너비}, 'auto'(표본으로 측정) 또는
+            None(INVENTORY_COLUMN_WIDTHS)
+        head (int): 앞에서부터 쓸 행 수
+        tail (int): 끝에서부터 쓸 행 수
+        page_size (int): 주면 이 행 수마다 멈추고 Enter를 기다림 (q 입력 시 중단)
+        block_rows (int): 한 번에 모아서 쓸 행 수
+    """
+    file = file or sys.stdout
+    sequence = _is_sequence(inventory_list)
+    rows = inventory_list if sequence else iter(inventory_list)
+    if not sequence:
+        first = next(rows, None)
+        rows = chain([first], rows) if first is not None else ()
+    if (len(rows) == 0) if sequence else (first is None):
+        file.write('표시할 인벤토리 항목이 없습니다.\n')
+        return
+    
+    if widths == 'auto':
+        if sequence:
+            widths = measure_column_widths(rows)
+        else:
+            sample = list(islice(rows, 1000))
+            widths = measure_column_widths(sample)
+            rows = chain(sample, rows)
+    widths = widths or INVENTORY_COLUMN_WIDTHS
+    
+    names = list(widths)
+    row_format = '|'.join(f' {{:<{widths[name]}}} ' for name in names)
+    separator = '+'.join('-' * (widths[name] + 2) for name in names)
+    header = row_format.format(*names)
+    
+    buffer = [separator, header, separator]
+    written = 0
+    
+    def emit(items):
+        """행들을 버퍼에 넣고, 블록이 차거나 페이지가 끝나면 씁니다."""
+        nonlocal written
+        for item in items:
+            buffer.append(row_format.format(*[str(item[name]) for name in names]))
+            written += 1
+            if page_size and written % page_size == 0:
+                file.write('\n'.join(buffer) + '\n')
+                buffer.clear()
+                file.flush()
+                if input('-- 계속하려면 Enter, 그만 보려면 q --').strip().lower() == 'q':
+                    return False
+            elif len(buffer) >= block_rows:
+                file.write('\n'.join(buffer) + '\n')
+                buffer.clear()
+        return True
+    
+    head = head or 0
+    tail = tail or 0
+    if not (head or tail):
+        completed = emit(rows)
+        total = len(rows) if sequence else written
+    elif sequence:
+        total = len(rows)
+        if head + tail >= total:
+            completed = emit(rows)
+        else:
+            completed = emit(rows[index] for index in range(head))
+            if completed:
+                buffer.append(f' ... {total - head - tail:,}행 생략 ...')
+                completed = emit(rows[index] for index in range(total - tail, total))
+    else:
+        completed = emit(islice(rows, head))
+        total = written
+        if completed:
+            last = deque(maxlen=tail)
+            for item in rows:
+                last.append(item)
+                total += 1
+            if total - written > len(last):
+                buffer.append(f' ... {total - written - len(last):,}행 생략 ...')
+            completed = emit(last)
+    
+    buffer.append(separator)
+    buffer.append(f'총 항목 수: {total}' if completed else '출력을 중단했습니다.')
+    file.write('\n'.join(buffer) + '\n')
+
+
+def print_inventory(inventory_list, head=None, tail=None, page_size=None, widths=None):
+    """
+    인벤토리 항목을 형식에 맞게 출력합니다.
+    
+    Args:
+        inventory_list (list): 인벤토리 데이터를 포함하는 딕셔너리 리스트
+        head (int): 앞에서부터 출력할 행 수 (기본값 전체)
+        tail (int): 끝에서부터 출력할 행 수 (기본값 전체)
+        page_size (int): 이 행 수마다 멈추고 Enter를 기다림 (기본값 멈추지 않음)
+        widths (dict | str): 열 너비 (기본값 INVENTORY_COLUMN_WIDTHS, 'auto'는 값으로 측정)
+    """
+    render_inventory(inventory_list, widths=widths, head=head, tail=tail, page_size=page_size)
+
+
+def main(argv=None):
+    """
+    스크립트를 실행하는 메인 함수입니다.
+    
+    Args:
+        argv (list): 명령행 인자 (기본값 sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description='화성 기지 인벤토리 관리자')
+    parser.add_argument('--input', default='Mars_Base_Inventory_List.csv',
+                        help='인벤토리 파일 (.csv 또는 이진 파일)')
+    parser.add_argument('--top', type=int, metavar='K',
+                        help='인화성이 가장 높은 K개만 출력 (파일을 한 번 훑으며 K개만 유지)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='CSV 이진 캐시(<CSV>.cache)를 쓰지 않고 매번 파싱')
+    parser.add_argument('--timing', action='store_true',
+                        help='인벤토리를 읽는 데 걸린 시간과 캐시 사용 여부를 출력')
+    parser.add_argument('--head', type=int, metavar='N', help='표마다 앞에서부터 N행만 출력')
+    parser.add_argument('--tail', type=int, metavar='N', help='표마다 끝에서부터 N행만 출력')
+    parser.add_argument('--page', type=int, metavar='N', help='N행마다 멈추고 Enter를 기다림')
+    parser.add_argument('--auto-width', action='store_true', help='열 너비를 값 길이에 맞춤')
+    parser.add_argument('--merge', nargs='+', metavar='FILE',
+                        help='인화성 순으로 정렬된 이진 파일들을 하나로 합쳐 --output에 씀')
+    parser.add_argument('--output', default='Mars_Base_Inventory_merged.bin',
+                        help='--merge 결과 파일 (기본값 Mars_Base_Inventory_merged.bin)')
+    parser.add_argument('--dedupe', action='store_true',
+                        help='--merge에서 Substance마다 인화성이 가장 높은 항목만 남김')
+    parser.add_argument('--query', metavar='EXPR',
+                        help="조건을 만족하는 항목만 출력 (예: \"Flammability >= 0.7 and Strength == 'Weak'\")")
+    args = parser.parse_args(argv)
+    
+    def show(items):
+        print_inventory(items, args.head, args.tail, args.page, 'auto' if args.auto_width else None)
+    
+    if args.merge:
+        if merge_binary_files(args.merge, args.output, args.dedupe):
+            print(f'{len(args.merge)}개 파일을 인화성 순으로 합쳐 {args.output}에 저장했습니다')
+        return
+    
+    if args.query is not None:
+        try:
+            query = compile_query(args.query)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    if args.top is not None:
+        if args.top < 1:
+            parser.error('--top은 1 이상이어야 합니다.')
+        items = iter_inventory_file(args.input)
+        if args.query is not None:
+            items = query.stream(items)
+        try:
+            top_items = top_dangerous_items(items, args.top)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f'\n인화성 상위 {args.top}개 ({args.input}):')
+        show(top_items)
+        return
+    
+    if args.query is not None:
+        try:
+            matched = query.filter(iter_inventory_file(args.input))
+        except ValueError as e:
+            parser.error(str(e))
+        print(f'\n{args.query} ({args.input}):')
+        show(matched)
+        return
+    
+    input_file = args.input
     dangerous_output_file = 'Mars_Base_Inventory_danger.csv'
     binary_output_file = 'Mars_Base_Inventory_List.bin'
     
     print('화성 기지 인벤토리 목록을 읽는 중...')
-    inventory_list = read_csv_file(input_file)
+    stats = {}
+    if args.no_cache:
+        started = time.perf_counter()
+        inventory_list = read_csv_file(input_file)
+        stats = {'cache': 'off', 'seconds': time.perf_counter() - started}
+    else:
+        inventory_list = read_csv_file_cached(input_file, stats=stats)
+    if args.timing and stats:
+        print(f'읽기 시간: {stats["seconds"] * 1000:.1f}ms (캐시: {stats["cache"]})')
     
     if not inventory_list:
         print('인벤토리 데이터가 없습니다. 종료합니다.')
         return
     
     print('\n원본 인벤토리 목록:')
-    print_inventory(inventory_list)
+    show(inventory_list)
     
     # 인화성으로 정렬
     sorted_inventory = sort_by_flammability(inventory_list)
     print('\n인화성 순으로 정렬된 인벤토리 (높은 순에서 낮은 순):')
-    print_inventory(sorted_inventory)
+    show(sorted_inventory)
     
     # 위험 항목 필터링
     dangerous_items = filter_dangerous_items(sorted_inventory)
     print('\n위험 항목 (인화성 >= 0.7):')
-    print_inventory(dangerous_items)
+    show(dangerous_items)
     
     # 위험 항목을 CSV에 쓰기
     if write_csv_file(dangerous_items, dangerous_output_file):
@@ -271,7 +3112,7 @@ def main():
     
     print('\n이진 파일에서 데이터 읽는 중:')
     binary_data = read_binary_file(binary_output_file)
-    print_inventory(binary_data)
+    show(binary_data)
     
     print('\n텍스트 vs 이진 파일 비교:')
     print('''